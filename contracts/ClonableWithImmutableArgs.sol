@@ -0,0 +1,129 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+/**
+ * @notice EIP-1167 clone helpers shared by our factory strategies.
+ * @dev Config clones append their per-instance args, each 32 bytes, to their runtime code, and
+ *  read them back with EXTCODECOPY instead of from storage. Our original and clones without
+ *  args keep those values in storage instead, and get zero back from _getImmutableArg().
+ */
+abstract contract ClonableWithImmutableArgs {
+    // length of EIP-1167 runtime code, where any immutable args start
+    uint256 internal constant CLONE_CODE_LENGTH = 0x2d;
+
+    // the contract we're deployed as. clones delegatecall to us, so this is the same for them.
+    //  can't be read during construction, so keep it out of anything our constructor calls
+    address internal immutable original;
+
+    constructor() {
+        original = address(this);
+    }
+
+    // deploy an EIP-1167 minimal proxy pointing at this contract, with any immutable args appended to its code.
+    //  a zero salt deploys with create, anything else with create2 so the address can be predicted.
+    function _clone(
+        bytes memory _args,
+        bytes32 _salt
+    ) internal returns (address newClone) {
+        // don't clone a clone
+        if (address(this) != original) {
+            revert();
+        }
+
+        bytes memory cloneCode = _cloneCode(_args);
+        assembly {
+            switch _salt
+            case 0 {
+                newClone := create(0, add(cloneCode, 0x20), mload(cloneCode))
+            }
+            default {
+                newClone := create2(
+                    0,
+                    add(cloneCode, 0x20),
+                    mload(cloneCode),
+                    _salt
+                )
+            }
+        }
+
+        // create2 returns zero if we've already deployed a clone with this salt
+        if (newClone == address(0)) {
+            revert();
+        }
+    }
+
+    // EIP-1167 bytecode, based on https://github.com/optionality/clone-factory/blob/master/contracts/CloneFactory.sol
+    // our init code copies our args along with the runtime code. the runtime code always
+    //  returns or reverts before reaching them, so they are never executed
+    function _cloneCode(
+        bytes memory _args
+    ) internal view returns (bytes memory) {
+        return
+            abi.encodePacked(
+                hex"3d60",
+                uint8(CLONE_CODE_LENGTH + _args.length),
+                hex"80600a3d3981f3363d3d373d3d3d363d73",
+                address(this),
+                hex"5af43d82803e903d91602b57fd5bf3",
+                _args
+            );
+    }
+
+    // config clones are salted by their deployer and vault, so each deployer gets one per vault
+    function _cloneSalt(
+        address _deployer,
+        address _vault
+    ) internal pure returns (bytes32) {
+        return keccak256(abi.encode(_deployer, _vault));
+    }
+
+    // standard create2 address derivation for a config clone from this contract
+    function _predictClone(
+        address _deployer,
+        address _vault,
+        bytes memory _args
+    ) internal view returns (address) {
+        return
+            address(
+                uint160(
+                    uint256(
+                        keccak256(
+                            abi.encodePacked(
+                                bytes1(0xff),
+                                address(this),
+                                _cloneSalt(_deployer, _vault),
+                                keccak256(_cloneCode(_args))
+                            )
+                        )
+                    )
+                )
+            );
+    }
+
+    // only checked when initializing, so we know whether to store our args instead. our original
+    //  initializes in its constructor, before it has any code
+    function _hasImmutableArgs() internal view returns (bool) {
+        return address(this).code.length > CLONE_CODE_LENGTH;
+    }
+
+    // read one of the 32-byte args appended to our clone's runtime code. our original's code
+    //  isn't a clone, so skip it. clones without args have nothing past their runtime code,
+    //  so extcodecopy pads with zeros. callers fall back to storage on zero, which is never
+    //  set on clones with args, so a zero arg still reads correctly
+    function _getImmutableArg(
+        uint256 _index
+    ) internal view returns (uint256 arg) {
+        if (address(this) == original) {
+            return 0;
+        }
+        assembly {
+            extcodecopy(
+                address(),
+                0,
+                add(CLONE_CODE_LENGTH, mul(_index, 0x20)),
+                0x20
+            )
+            arg := mload(0)
+        }
+    }
+}
@@ -47,6 +47,12 @@ interface IRegistry {
         address token,
         uint256 _type
     ) external view returns (address);
+
+    function predictVaultAddress(
+        address _token,
+        uint256 _releaseDelta,
+        uint256 _type
+    ) external view returns (address);
 }
 
 interface IPoolManager {
@@ -91,65 +97,95 @@ interface ICurveGauge {
 }
 
 interface IStrategy {
-    function cloneStrategyConvex(
+    struct ConvexConfig {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address tradeFactory;
+        uint256 pid;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+        address booster;
+        address convexToken;
+        address healthCheck;
+        address baseFeeOracle;
+        address curveVoter;
+        address convexVoter;
+        uint256 keepCRV;
+        uint256 keepCVX;
+        address priceOracle;
+    }
+
+    struct CurveBoostedConfig {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address tradeFactory;
+        address proxy;
+        address gauge;
+        address healthCheck;
+        address baseFeeOracle;
+        address curveVoter;
+        uint256 keepCRV;
+    }
+
+    struct ConvexFraxConfig {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address tradeFactory;
+        uint256 fraxPid;
+        address stakingAddress;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+        address booster;
+        address healthCheck;
+        address baseFeeOracle;
+        address curveVoter;
+        address convexVoter;
+        address fraxVoter;
+        uint256 keepCRV;
+        uint256 keepCVX;
+        uint256 keepFXS;
+        address priceOracle;
+    }
+
+    function cloneStrategyConvexWithConfig(
+        ConvexConfig calldata _config
+    ) external returns (address newStrategy);
+
+    function cloneStrategyCurveBoostedWithConfig(
+        CurveBoostedConfig calldata _config
+    ) external returns (address newStrategy);
+
+    function cloneStrategyConvexFraxWithConfig(
+        ConvexFraxConfig calldata _config
+    ) external returns (address newStrategy);
+
+    function predictStrategyConvexAddress(
+        address _deployer,
         address _vault,
-        address _strategist,
-        address _rewards,
-        address _keeper,
-        address _tradeFactory,
-        uint256 _pid,
-        uint256 _harvestProfitMinInUsdc,
-        uint256 _harvestProfitMaxInUsdc,
         address _booster,
-        address _convexToken
-    ) external returns (address newStrategy);
+        uint256 _pid
+    ) external view returns (address);
 
-    function cloneStrategyCurveBoosted(
+    function predictStrategyCurveBoostedAddress(
+        address _deployer,
         address _vault,
-        address _strategist,
-        address _rewards,
-        address _keeper,
-        address _tradeFactory,
         address _proxy,
         address _gauge
-    ) external returns (address newStrategy);
+    ) external view returns (address);
 
-    function cloneStrategyConvexFrax(
+    function predictStrategyConvexFraxAddress(
+        address _deployer,
         address _vault,
-        address _strategist,
-        address _rewards,
-        address _keeper,
-        address _tradeFactory,
-        uint256 _fraxPid,
+        address _fraxBooster,
         address _stakingAddress,
-        uint256 _harvestProfitMinInUsdc,
-        uint256 _harvestProfitMaxInUsdc,
-        address _booster
-    ) external returns (address newStrategy);
-
-    function setVoter(address _curveVoter) external;
-
-    function setVoters(address _curveVoter, address _convexVoter) external;
-
-    function setVoters(
-        address _curveVoter,
-        address _convexVoter,
-        address _fxsVoter
-    ) external;
-
-    function setLocalKeepCrvs(
-        uint256 _keepCrv,
-        uint256 _keepCvx,
-        uint256 _keepFxs
-    ) external;
-
-    function setLocalKeepCrvs(uint256 _keepCrv, uint256 _keepCvx) external;
-
-    function setLocalKeepCrv(uint256 _keepCrv) external;
-
-    function setHealthCheck(address) external;
-
-    function setBaseFeeOracle(address) external;
+        uint256 _fraxPid
+    ) external view returns (address);
 }
 
 interface IBooster {
@@ -189,6 +225,10 @@ interface Vault {
     function setDepositLimit(uint256) external;
 
     function addStrategy(address, uint256, uint256, uint256, uint256) external;
+
+    function token() external view returns (address);
+
+    function withdrawalQueue(uint256) external view returns (address);
 }
 
 contract CurveGlobal {
@@ -202,11 +242,94 @@ contract CurveGlobal {
         address convexFraxStrategy
     );
 
+    event VaultCreationSkipped(address indexed gauge, bytes reason);
+
+    struct FraxPool {
+        address stakingAddress;
+        uint96 fraxPid;
+    }
+
+    // the settings we read most during vault deployment, packed into three slots
+    struct PackedSettings {
+        address management;
+        uint16 keepCRV;
+        uint16 keepCVX;
+        uint16 keepFXS;
+        uint16 performanceFee;
+        uint16 managementFee;
+        address treasury;
+        uint96 harvestProfitMinInUsdc;
+        address keeper;
+        uint96 harvestProfitMaxInUsdc;
+    }
+
+    // everything we need from storage to deploy a vault and its strategies
+    struct FactoryConfig {
+        IRegistry registry;
+        IBooster booster;
+        IBooster fraxBooster;
+        address governance;
+        address management;
+        address guardian;
+        address treasury;
+        address keeper;
+        address healthCheck;
+        address tradeFactory;
+        address baseFeeOracle;
+        address priceOracle;
+        address convexStratImplementation;
+        address curveStratImplementation;
+        address convexFraxStratImplementation;
+        uint256 keepCRV;
+        address curveVoter;
+        uint256 keepCVX;
+        address convexVoter;
+        uint256 keepFXS;
+        address fraxVoter;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+        uint256 performanceFee;
+        uint256 managementFee;
+        uint256 depositLimit;
+        address proxy;
+    }
+
+    struct VaultInfo {
+        address vault;
+        address gauge;
+        address lpToken;
+        address[] strategies;
+    }
+
+    struct GaugePreflight {
+        address gauge;
+        address lpToken;
+        uint256 gaugeWeight;
+        bool canCreateVaultPermissionlessly;
+        bool strategyProxyHasGauge;
+        uint256 pid;
+        bool hasFraxPool;
+        uint256 convexFraxPid;
+        address stakingAddress;
+    }
+
+    struct BatchResult {
+        address gauge;
+        bool success;
+        address vault;
+        address convexStrategy;
+        address curveStrategy;
+        address convexFraxStrategy;
+    }
+
     /* ========== STATE VARIABLES ========== */
 
     /// @notice This is a list of all vaults deployed by this factory.
     address[] public deployedVaults;
 
+    /// @notice The Curve gauge a given factory vault was deployed for.
+    mapping(address => address) public gaugeOfVault;
+
     /// @notice This is specific to the protocol we are deploying automated vaults for.
     /// @dev 0 for curve, 1 for balancer. This is a subcategory within our vault type AUTOMATED on the registry.
     uint256 public constant CATEGORY = 0;
@@ -245,18 +368,24 @@ contract CurveGlobal {
     /// @notice Address to use for vault governance.
     address public governance = 0xFEB4acf3df3cDEA7399794D0869ef76A6EfAff52;
 
-    /// @notice Address to use for vault management.
-    address public management = 0x16388463d60FFE0661Cf7F1f31a7D658aC790ff7;
+    // vault management and treasury, strategy keeper, keeps, fees and harvest bounds. see views below
+    PackedSettings internal packedSettings =
+        PackedSettings({
+            management: 0x16388463d60FFE0661Cf7F1f31a7D658aC790ff7,
+            keepCRV: 0,
+            keepCVX: 0,
+            keepFXS: 0,
+            performanceFee: 1_000,
+            managementFee: 0,
+            treasury: 0x93A62dA5a14C80f265DAbC077fCEE437B1a0Efde,
+            harvestProfitMinInUsdc: 7_500 * 1e6,
+            keeper: 0x256e6a486075fbAdbB881516e9b6b507fd082B5D,
+            harvestProfitMaxInUsdc: 100_000 * 1e6
+        });
 
     /// @notice Address to use for vault guardian.
     address public guardian = 0x846e211e8ba920B353FB717631C015cf04061Cc9;
 
-    /// @notice Address to use for vault and strategy rewards.
-    address public treasury = 0x93A62dA5a14C80f265DAbC077fCEE437B1a0Efde;
-
-    /// @notice Address to use for strategy keepers.
-    address public keeper = 0x256e6a486075fbAdbB881516e9b6b507fd082B5D;
-
     /// @notice Address to use for strategy health check.
     address public healthCheck = 0xDDCea799fF1699e98EDF118e0629A974Df7DF012;
 
@@ -266,6 +395,10 @@ contract CurveGlobal {
     /// @notice Address to use for our network's base fee oracle.
     address public baseFeeOracle = 0x1E7eFAbF282614Aa2543EDaA50517ef5a23c868b;
 
+    /// @notice Address to use for pricing our Convex and Convex Frax strategies' claimable profit.
+    /// @dev If zero address, then strategies use yearn's lens oracle directly.
+    address public priceOracle;
+
     /// @notice Address of our Convex strategy implementation.
     /// @dev If zero address, then factory will produce vaults with only Curve strategies.
     address public convexStratImplementation;
@@ -278,38 +411,31 @@ contract CurveGlobal {
     /// @dev If zero address, then factory will produce vaults without Convex Frax strategies.
     address public convexFraxStratImplementation;
 
-    /// @notice The percentage of CRV we re-lock for boost (in basis points). Default is 0%.
-    uint256 public keepCRV;
-
     /// @notice The address of our Curve voter. This is where we send any keepCRV.
     address public curveVoter = 0xF147b8125d2ef93FB6965Db97D6746952a133934;
 
-    /// @notice The percentage of CVX we re-lock (in basis points). Default is 0%.
-    uint256 public keepCVX;
-
     /// @notice The address of our Convex voter. This is where we send any keepCVX.
     address public convexVoter;
 
-    /// @notice The percentage of FXS we re-lock for boost (in basis points). Default is 0%.
-    uint256 public keepFXS;
-
     /// @notice The address of our Frax voter. This is where we send any keepFXS.
     address public fraxVoter;
 
-    /// @notice Minimum profit size in USDC that we want to harvest.
-    uint256 public harvestProfitMinInUsdc = 7_500 * 1e6;
+    /// @notice Default deposit limit on our factory vaults. Set to a large number.
+    uint256 public depositLimit = 10_000_000_000_000 * 1e18;
 
-    /// @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
-    uint256 public harvestProfitMaxInUsdc = 100_000 * 1e6;
+    /// @notice Number of pools from a given Convex booster that have been added to our gauge index.
+    /// @dev Pools are indexed in order, so every pid below this value is indexed.
+    mapping(address => uint256) public numPidsIndexed;
 
-    /// @notice Default performance fee for our factory vaults (in basis points).
-    uint256 public performanceFee = 1_000;
+    // booster => gauge => pid + 1, so that zero means the gauge isn't indexed yet
+    mapping(address => mapping(address => uint256)) internal indexedPids;
 
-    /// @notice Default management fee for our factory vaults (in basis points).
-    uint256 public managementFee = 0;
+    /// @notice Number of pools from a given Convex Frax pool registry that have been added to our Frax index.
+    /// @dev Pools are indexed in order, so every Frax pid below this value is indexed.
+    mapping(address => uint256) public numFraxPidsIndexed;
 
-    /// @notice Default deposit limit on our factory vaults. Set to a large number.
-    uint256 public depositLimit = 10_000_000_000_000 * 1e18;
+    // pool registry => convex pid => our most recent active frax pool for that convex pid
+    mapping(address => mapping(uint256 => FraxPool)) internal indexedFraxPools;
 
     /* ========== CONSTRUCTOR ========== */
 
@@ -419,7 +545,7 @@ contract CurveGlobal {
         if (msg.sender != owner) {
             revert();
         }
-        management = _management;
+        packedSettings.management = _management;
     }
 
     /// @notice Set the vault guardian address for the factory.
@@ -439,17 +565,19 @@ contract CurveGlobal {
         if (msg.sender != owner) {
             revert();
         }
-        treasury = _treasury;
+        packedSettings.treasury = _treasury;
     }
 
     /// @notice Set the vault keeper address for the factory.
     /// @dev Must be called by owner or management.
     /// @param _keeper Address of default vault keeper.
     function setKeeper(address _keeper) external {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
-        keeper = _keeper;
+        packedSettings.keeper = _keeper;
     }
 
     /// @notice Set the vault health check address for the factory.
@@ -457,7 +585,9 @@ contract CurveGlobal {
     ///  ensure that harvest profits are within expected limits before executing.
     /// @param _health Address of default health check contract.
     function setHealthcheck(address _health) external {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
         healthCheck = _health;
@@ -478,17 +608,34 @@ contract CurveGlobal {
     ///  fee so strategy can avoid harvesting during periods of network congestion.
     /// @param _baseFeeOracle Address of default base fee oracle for strategies.
     function setBaseFeeOracle(address _baseFeeOracle) external {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
         baseFeeOracle = _baseFeeOracle;
     }
 
+    /// @notice Set the strategy price oracle address for the factory.
+    /// @dev Must be called by owner or management. Generally a PriceCache in front of
+    ///  yearn's lens oracle, so keepers checking many strategies reuse the same prices.
+    /// @param _priceOracle Address of default price oracle for strategies.
+    function setPriceOracle(address _priceOracle) external {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
+            revert();
+        }
+        priceOracle = _priceOracle;
+    }
+
     /// @notice Set the vault deposit limit for the factory.
     /// @dev Must be called by owner or management.
     /// @param _depositLimit Default deposit limit for vaults created by factory.
     function setDepositLimit(uint256 _depositLimit) external {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
         depositLimit = _depositLimit;
@@ -547,7 +694,7 @@ contract CurveGlobal {
             revert();
         }
 
-        keepCRV = _keepCRV;
+        packedSettings.keepCRV = uint16(_keepCRV);
         curveVoter = _curveVoter;
     }
 
@@ -568,7 +715,7 @@ contract CurveGlobal {
             }
         }
 
-        keepCVX = _keepCVX;
+        packedSettings.keepCVX = uint16(_keepCVX);
         convexVoter = _convexVoter;
     }
 
@@ -589,7 +736,7 @@ contract CurveGlobal {
             }
         }
 
-        keepFXS = _keepFXS;
+        packedSettings.keepFXS = uint16(_keepFXS);
         fraxVoter = _fraxVoter;
     }
 
@@ -600,10 +747,15 @@ contract CurveGlobal {
     function setHarvestProfitMinInUsdc(
         uint256 _harvestProfitMinInUsdc
     ) external {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
-        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
+        if (_harvestProfitMinInUsdc > type(uint96).max) {
+            revert();
+        }
+        packedSettings.harvestProfitMinInUsdc = uint96(_harvestProfitMinInUsdc);
     }
 
     /// @notice Set the amount of USDC profit that will force a harvest.
@@ -613,10 +765,15 @@ contract CurveGlobal {
     function setHarvestProfitMaxInUsdc(
         uint256 _harvestProfitMaxInUsdc
     ) external {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
-        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
+        if (_harvestProfitMaxInUsdc > type(uint96).max) {
+            revert();
+        }
+        packedSettings.harvestProfitMaxInUsdc = uint96(_harvestProfitMaxInUsdc);
     }
 
     /// @notice Set the performance fee (percentage of profit) deducted from each harvest.
@@ -630,7 +787,7 @@ contract CurveGlobal {
         if (_performanceFee > 5_000) {
             revert();
         }
-        performanceFee = _performanceFee;
+        packedSettings.performanceFee = uint16(_performanceFee);
     }
 
     /// @notice Set the management fee (as a percentage of TVL) assessed on factory vaults.
@@ -644,17 +801,133 @@ contract CurveGlobal {
         if (_managementFee > 1_000) {
             revert();
         }
-        managementFee = _managementFee;
+        packedSettings.managementFee = uint16(_managementFee);
     }
 
     /* ========== VIEWS ========== */
 
+    /// @notice Address to use for vault management.
+    function management() external view returns (address) {
+        return packedSettings.management;
+    }
+
+    /// @notice Address to use for vault and strategy rewards.
+    function treasury() external view returns (address) {
+        return packedSettings.treasury;
+    }
+
+    /// @notice Address to use for strategy keepers.
+    function keeper() external view returns (address) {
+        return packedSettings.keeper;
+    }
+
+    /// @notice The percentage of CRV we re-lock for boost (in basis points). Default is 0%.
+    function keepCRV() external view returns (uint256) {
+        return packedSettings.keepCRV;
+    }
+
+    /// @notice The percentage of CVX we re-lock (in basis points). Default is 0%.
+    function keepCVX() external view returns (uint256) {
+        return packedSettings.keepCVX;
+    }
+
+    /// @notice The percentage of FXS we re-lock for boost (in basis points). Default is 0%.
+    function keepFXS() external view returns (uint256) {
+        return packedSettings.keepFXS;
+    }
+
+    /// @notice Minimum profit size in USDC that we want to harvest.
+    function harvestProfitMinInUsdc() external view returns (uint256) {
+        return packedSettings.harvestProfitMinInUsdc;
+    }
+
+    /// @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
+    function harvestProfitMaxInUsdc() external view returns (uint256) {
+        return packedSettings.harvestProfitMaxInUsdc;
+    }
+
+    /// @notice Default performance fee for our factory vaults (in basis points).
+    function performanceFee() external view returns (uint256) {
+        return packedSettings.performanceFee;
+    }
+
+    /// @notice Default management fee for our factory vaults (in basis points).
+    function managementFee() external view returns (uint256) {
+        return packedSettings.managementFee;
+    }
+
     /// @notice View all vault addresses deployed by this factory.
     /// @return Array of all deployed factory vault addresses.
     function allDeployedVaults() external view returns (address[] memory) {
         return deployedVaults;
     }
 
+    /// @notice View a range of vault addresses deployed by this factory.
+    /// @dev Our range is clamped to the number of deployed vaults, so an offset past
+    ///  the end returns an empty array. Useful for syncing in bounded chunks.
+    /// @param _offset Index in deployedVaults of the first vault to return.
+    /// @param _limit Maximum number of vaults to return.
+    /// @return vaults Array of deployed factory vault addresses.
+    function deployedVaultsPage(
+        uint256 _offset,
+        uint256 _limit
+    ) public view returns (address[] memory vaults) {
+        uint256 length = deployedVaults.length;
+        if (_offset >= length) {
+            return vaults;
+        }
+        if (_limit > length - _offset) {
+            _limit = length - _offset;
+        }
+
+        vaults = new address[](_limit);
+        for (uint256 i; i < _limit; ++i) {
+            vaults[i] = deployedVaults[_offset + i];
+        }
+    }
+
+    /// @notice View details for a range of vaults deployed by this factory.
+    /// @dev See deployedVaultsPage() for range handling. Strategies are read from each
+    ///  vault's current withdrawal queue, so they reflect any changes made after deployment.
+    /// @param _offset Index in deployedVaults of the first vault to return.
+    /// @param _limit Maximum number of vaults to return.
+    /// @return info Vault, gauge, lp token and strategies for each vault in our range.
+    function deployedVaultsInfo(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (VaultInfo[] memory info) {
+        address[] memory vaults = deployedVaultsPage(_offset, _limit);
+        info = new VaultInfo[](vaults.length);
+        for (uint256 i; i < vaults.length; ++i) {
+            address vault = vaults[i];
+            info[i].vault = vault;
+            info[i].gauge = gaugeOfVault[vault];
+            info[i].lpToken = Vault(vault).token();
+            info[i].strategies = _vaultStrategies(vault);
+        }
+    }
+
+    // pull a vault's strategies from its withdrawal queue, which ends at the first empty slot
+    function _vaultStrategies(
+        address _vault
+    ) internal view returns (address[] memory strategies) {
+        // vaults hold at most 20 strategies
+        strategies = new address[](20);
+        uint256 count;
+        for (; count < 20; ++count) {
+            address strategy = Vault(_vault).withdrawalQueue(count);
+            if (strategy == address(0)) {
+                break;
+            }
+            strategies[count] = strategy;
+        }
+
+        // trim our array down to the strategies we actually found
+        assembly {
+            mstore(strategies, count)
+        }
+    }
+
     /// @notice Number of vaults deployed by this factory.
     /// @return Number of vaults deployed by this factory.
     function numVaults() external view returns (uint256) {
@@ -678,17 +951,21 @@ contract CurveGlobal {
     function latestStandardVaultFromGauge(
         address _gauge
     ) public view returns (address) {
-        address lptoken = ICurveGauge(_gauge).lp_token();
-        address latest;
+        return _latestStandardVault(ICurveGauge(_gauge).lp_token(), registry);
+    }
 
+    // check our registry for the latest LEGACY/DEFAULT/AUTOMATED vault for an lp token
+    function _latestStandardVault(
+        address _lptoken,
+        IRegistry _registry
+    ) internal view returns (address latest) {
         // we only care about types 0-2 here, so enforce that
         for (uint256 i; i < 3; ++i) {
-            latest = registry.latestVaultOfType(lptoken, i);
+            latest = _registry.latestVaultOfType(_lptoken, i);
             if (latest != address(0)) {
                 break;
             }
         }
-        return latest;
     }
 
     /// @notice Check if our strategy proxy has already approved a strategy for a given gauge.
@@ -704,16 +981,26 @@ contract CurveGlobal {
     }
 
     /// @notice Find the Convex pool id (pid) for a given Curve gauge.
-    /// @dev Will return max uint if no pid exists for a gauge.
+    /// @dev Will return max uint if no pid exists for a gauge. Only pools added to Convex
+    ///  since our last syncPids() are scanned, everything else is read from our index.
     /// @param _gauge The gauge address to check.
     /// @return pid The Convex pool id for the specified Curve gauge.
     function getPid(address _gauge) public view returns (uint256 pid) {
-        IBooster _booster = booster;
+        return _getPid(_gauge, booster);
+    }
+
+    // look up our gauge's pid on a given booster
+    function _getPid(
+        address _gauge,
+        IBooster _booster
+    ) internal view returns (uint256 pid) {
         if (!_booster.gaugeMap(_gauge)) {
             return type(uint256).max;
         }
 
-        for (uint256 i = _booster.poolLength(); i > 0; --i) {
+        // check any pools we haven't indexed yet first, since the most recent pool wins
+        uint256 numIndexed = numPidsIndexed[address(_booster)];
+        for (uint256 i = _booster.poolLength(); i > numIndexed; --i) {
             //we start at the end and work back for most recent
             (, , address gauge, , , ) = _booster.poolInfo(i - 1);
 
@@ -721,10 +1008,16 @@ contract CurveGlobal {
                 return i - 1;
             }
         }
+
+        uint256 indexedPid = indexedPids[address(_booster)][_gauge];
+        if (indexedPid > 0) {
+            return indexedPid - 1;
+        }
     }
 
     /// @notice Check if a Convex pid is also available on Convex Frax.
-    /// @dev Try-catch may appear as reverts in some dev envs.
+    /// @dev Try-catch may appear as reverts in some dev envs. Only Frax pools added
+    ///  since our last syncFraxPools() are scanned, everything else is read from our index.
     /// @param _convexPid The Convex pid to check.
     /// @return hasFraxPool Whether or not the given Convex pid also has a Convex Frax pool.
     /// @return convexFraxPid For Convex Frax pools, their assigned Convex Frax pid.
@@ -743,7 +1036,59 @@ contract CurveGlobal {
         IPoolRegistry _convexFraxPoolRegistry = IPoolRegistry(
             convexFraxPoolRegistry
         );
-        for (uint256 i = _convexFraxPoolRegistry.poolLength(); i > 0; --i) {
+
+        // check any pools we haven't indexed yet first, since the most recent pool wins
+        (hasFraxPool, convexFraxPid, stakingAddress) = _scanFraxPools(
+            _convexFraxPoolRegistry,
+            _convexPid,
+            _convexFraxPoolRegistry.poolLength(),
+            numFraxPidsIndexed[address(_convexFraxPoolRegistry)]
+        );
+        if (hasFraxPool) {
+            return (hasFraxPool, convexFraxPid, stakingAddress);
+        }
+
+        FraxPool memory pool = indexedFraxPools[
+            address(_convexFraxPoolRegistry)
+        ][_convexPid];
+        if (pool.stakingAddress == address(0)) {
+            return (false, 0, address(0));
+        }
+
+        // pools can be deactivated after we index them, so make sure ours is still live
+        (, , , , uint8 isActive) = _convexFraxPoolRegistry.poolInfo(
+            pool.fraxPid
+        );
+        if (isActive != 0) {
+            return (true, pool.fraxPid, pool.stakingAddress);
+        }
+
+        // our indexed pool was deactivated, so fall back to checking any older pools
+        return
+            _scanFraxPools(
+                _convexFraxPoolRegistry,
+                _convexPid,
+                pool.fraxPid,
+                0
+            );
+    }
+
+    // walk the frax pool registry backwards from _start down to _end for an active pool matching our convex pid
+    function _scanFraxPools(
+        IPoolRegistry _convexFraxPoolRegistry,
+        uint256 _convexPid,
+        uint256 _start,
+        uint256 _end
+    )
+        internal
+        view
+        returns (
+            bool hasFraxPool,
+            uint256 convexFraxPid,
+            address stakingAddress
+        )
+    {
+        for (uint256 i = _start; i > _end; --i) {
             // we start at the end and work back for most recent
             (
                 ,
@@ -768,6 +1113,225 @@ contract CurveGlobal {
         }
     }
 
+    /// @notice Add any Convex pools created since our last sync to our gauge index.
+    /// @dev May be called by anyone. Use _maxPools to split a large sync across multiple transactions.
+    /// @param _maxPools Maximum number of pools to index in this call.
+    /// @return Number of pools from our current booster that are now indexed.
+    function syncPids(uint256 _maxPools) external returns (uint256) {
+        IBooster _booster = booster;
+        uint256 start = numPidsIndexed[address(_booster)];
+        uint256 end = _booster.poolLength();
+        if (end - start > _maxPools) {
+            end = start + _maxPools;
+        }
+
+        // go from oldest to newest so that newer pools for the same gauge overwrite older ones
+        for (uint256 i = start; i < end; ++i) {
+            (, , address gauge, , , ) = _booster.poolInfo(i);
+            indexedPids[address(_booster)][gauge] = i + 1;
+        }
+        numPidsIndexed[address(_booster)] = end;
+        return end;
+    }
+
+    /// @notice Add any Convex Frax pools created since our last sync to our Frax index.
+    /// @dev May be called by anyone. Use _maxPools to split a large sync across multiple transactions.
+    ///  Every pool is indexed whether or not it's active, since pools can be reactivated later;
+    ///  getFraxInfo() checks that our indexed pool is active when it's read.
+    /// @param _maxPools Maximum number of pools to index in this call.
+    /// @return Number of pools from our current Frax pool registry that are now indexed.
+    function syncFraxPools(uint256 _maxPools) external returns (uint256) {
+        IPoolRegistry _convexFraxPoolRegistry = IPoolRegistry(
+            convexFraxPoolRegistry
+        );
+        uint256 start = numFraxPidsIndexed[address(_convexFraxPoolRegistry)];
+        uint256 end = _convexFraxPoolRegistry.poolLength();
+        if (end - start > _maxPools) {
+            end = start + _maxPools;
+        }
+
+        // go from oldest to newest so that newer pools for the same convex pid overwrite older ones
+        for (uint256 i = start; i < end; ++i) {
+            (
+                ,
+                address stakingAddress,
+                address stakingToken,
+                ,
+            ) = _convexFraxPoolRegistry.poolInfo(i);
+
+            // some staking tokens don't have this view
+            try IStakingToken(stakingToken).convexPoolId() returns (
+                uint256 convexPid
+            ) {
+                indexedFraxPools[address(_convexFraxPoolRegistry)][
+                    convexPid
+                ] = FraxPool(stakingAddress, uint96(i));
+            } catch {}
+        }
+        numFraxPidsIndexed[address(_convexFraxPoolRegistry)] = end;
+        return end;
+    }
+
+    /// @notice Check everything needed to decide on vault creation for a list of gauges in one call.
+    /// @dev Never reverts on bad gauges; any check that fails is left at its default value. A gauge
+    ///  without an lp token can't be permissionlessly deployed, and has a pid of max uint if it has no
+    ///  Convex pool. Gauges whose checks revert outright, for instance by returning data we can't
+    ///  decode, only keep their address and pid. Note that gauges without weight will still revert
+    ///  on vault creation.
+    /// @param _gauges The gauge addresses to check.
+    /// @return preflights Lp token, gauge weight, vault and strategy proxy status, and Convex
+    ///  and Convex Frax info for each gauge.
+    function gaugePreflight(
+        address[] calldata _gauges
+    ) external view returns (GaugePreflight[] memory preflights) {
+        address strategyProxy = getProxy();
+        preflights = new GaugePreflight[](_gauges.length);
+        for (uint256 i; i < _gauges.length; ++i) {
+            address gauge = _gauges[i];
+
+            // call ourselves so a revert, including one from decoding a bad return, only affects this gauge
+            try this.gaugePreflightFromBatch(gauge, strategyProxy) returns (
+                GaugePreflight memory preflight
+            ) {
+                preflights[i] = preflight;
+            } catch {
+                // leave everything else at its default, so this gauge isn't deployable
+                preflights[i].gauge = gauge;
+                preflights[i].pid = _getPid(gauge, booster);
+            }
+        }
+    }
+
+    /// @notice Run our creation checks on a single gauge on behalf of gaugePreflight.
+    /// @dev Must be called by this factory.
+    /// @param _gauge The gauge address to check.
+    /// @param _strategyProxy Our strategy proxy, loaded at the start of the batch.
+    /// @return preflight Lp token, gauge weight, vault and strategy proxy status, and Convex
+    ///  and Convex Frax info for our gauge.
+    function gaugePreflightFromBatch(
+        address _gauge,
+        address _strategyProxy
+    ) external view returns (GaugePreflight memory preflight) {
+        if (msg.sender != address(this)) {
+            revert();
+        }
+
+        preflight.gauge = _gauge;
+        preflight.pid = _getPid(_gauge, booster);
+
+        // don't bother with anything else if this isn't a contract, our calls below would fail decoding
+        if (_gauge.code.length == 0) {
+            return preflight;
+        }
+
+        try
+            IGaugeController(0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB)
+                .get_gauge_weight(_gauge)
+        returns (uint256 weight) {
+            preflight.gaugeWeight = weight;
+        } catch {}
+
+        try ICurveGauge(_gauge).lp_token() returns (address lptoken) {
+            preflight.lpToken = lptoken;
+            preflight.canCreateVaultPermissionlessly =
+                _latestStandardVault(lptoken, registry) == address(0);
+        } catch {}
+
+        preflight.strategyProxyHasGauge =
+            IProxy(_strategyProxy).strategies(_gauge) != address(0);
+
+        if (preflight.pid != type(uint256).max) {
+            try this.getFraxInfo(preflight.pid) returns (
+                bool hasFraxPool,
+                uint256 convexFraxPid,
+                address stakingAddress
+            ) {
+                preflight.hasFraxPool = hasFraxPool;
+                preflight.convexFraxPid = convexFraxPid;
+                preflight.stakingAddress = stakingAddress;
+            } catch {}
+        }
+    }
+
+    /// @notice Predict the address of the vault our factory will deploy for a given gauge.
+    /// @dev Vaults are deployed via CREATE2, keyed by lp token, vault type and release. This
+    ///  assumes the latest release on our registry's current release registry, same as our factory.
+    ///  Returns 0x0 if our registry can't deploy deterministically.
+    /// @param _gauge The gauge address to check.
+    /// @return Address our new vault will be deployed to.
+    function predictVaultAddress(address _gauge) public view returns (address) {
+        return
+            registry.predictVaultAddress(
+                ICurveGauge(_gauge).lp_token(),
+                0,
+                uint256(VaultType.AUTOMATED)
+            );
+    }
+
+    /// @notice Predict the addresses of the vault and strategies our factory will deploy for a given gauge.
+    /// @dev Strategies are deployed via CREATE2, keyed by implementation, our factory and our vault. A
+    ///  convex strategy's code includes its rewards contract, so it (and any convex frax strategy) can
+    ///  only be predicted once Convex has a pool for our gauge; until then, these are 0x0. Everything
+    ///  is 0x0 if our registry can't deploy our vault deterministically.
+    /// @param _gauge The gauge address to check.
+    /// @return vault Address our new vault will be deployed to.
+    /// @return convexStrategy Address our new convex strategy will be deployed to.
+    /// @return curveStrategy Address our new curve boosted strategy will be deployed to.
+    /// @return convexFraxStrategy Address our new convex frax strategy will be deployed to, if any.
+    function predictStrategyAddresses(
+        address _gauge
+    )
+        external
+        view
+        returns (
+            address vault,
+            address convexStrategy,
+            address curveStrategy,
+            address convexFraxStrategy
+        )
+    {
+        vault = predictVaultAddress(_gauge);
+        if (vault == address(0)) {
+            return (address(0), address(0), address(0), address(0));
+        }
+        curveStrategy = IStrategy(curveStratImplementation)
+            .predictStrategyCurveBoostedAddress(
+                address(this),
+                vault,
+                getProxy(),
+                _gauge
+            );
+
+        // no convex pool yet, so we can't know our rewards contract
+        uint256 pid = getPid(_gauge);
+        if (pid == type(uint256).max) {
+            return (vault, address(0), curveStrategy, address(0));
+        }
+        convexStrategy = IStrategy(convexStratImplementation)
+            .predictStrategyConvexAddress(
+                address(this),
+                vault,
+                address(booster),
+                pid
+            );
+
+        (
+            bool hasFraxPool,
+            uint256 fraxPid,
+            address stakingAddress
+        ) = getFraxInfo(pid);
+        if (hasFraxPool) {
+            convexFraxStrategy = IStrategy(convexFraxStratImplementation)
+                .predictStrategyConvexFraxAddress(
+                    address(this),
+                    vault,
+                    address(fraxBooster),
+                    stakingAddress,
+                    fraxPid
+                );
+        }
+    }
+
     /// @notice Check our current Curve strategy proxy via our Curve voter.
     /// @return proxy Address of our current Curve strategy proxy.
     function getProxy() public view returns (address proxy) {
@@ -799,11 +1363,20 @@ contract CurveGlobal {
             address convexFraxStrategy
         )
     {
-        if (!(msg.sender == owner || msg.sender == management)) {
+        if (
+            !(msg.sender == owner || msg.sender == packedSettings.management)
+        ) {
             revert();
         }
 
-        return _createNewVaultsAndStrategies(_gauge, true, _name, _symbol);
+        return
+            _createNewVaultsAndStrategies(
+                _gauge,
+                true,
+                _name,
+                _symbol,
+                _loadConfig()
+            );
     }
 
     /// @notice Deploy a factory Curve vault for a given Curve gauge permissionlessly.
@@ -826,7 +1399,118 @@ contract CurveGlobal {
         )
     {
         return
-            _createNewVaultsAndStrategies(_gauge, false, "default", "default");
+            _createNewVaultsAndStrategies(
+                _gauge,
+                false,
+                "default",
+                "default",
+                _loadConfig()
+            );
+    }
+
+    /// @notice Deploy factory Curve vaults for many Curve gauges permissionlessly.
+    /// @dev This may be called by anyone. Factory settings and our strategy proxy are only loaded once.
+    ///  Any gauge that can't get a vault (no weight, vault already exists, etc) is skipped and
+    ///  reported as unsuccessful instead of reverting the whole batch.
+    /// @param _gauges Addresses of the Curve gauges to deploy new vaults for.
+    /// @return results Outcome for each gauge, in the same order as _gauges.
+    function createNewVaultsAndStrategiesBatch(
+        address[] calldata _gauges
+    ) external returns (BatchResult[] memory results) {
+        FactoryConfig memory config = _loadConfig();
+        uint256 length = _gauges.length;
+        results = new BatchResult[](length);
+
+        for (uint256 i; i < length; ++i) {
+            address gauge = _gauges[i];
+            results[i].gauge = gauge;
+
+            // call ourselves so a revert only unwinds this gauge
+            try this.createNewVaultsAndStrategiesFromBatch(gauge, config) returns (
+                address vault,
+                address convexStrategy,
+                address curveStrategy,
+                address convexFraxStrategy
+            ) {
+                results[i].success = true;
+                results[i].vault = vault;
+                results[i].convexStrategy = convexStrategy;
+                results[i].curveStrategy = curveStrategy;
+                results[i].convexFraxStrategy = convexFraxStrategy;
+            } catch (bytes memory reason) {
+                emit VaultCreationSkipped(gauge, reason);
+            }
+        }
+    }
+
+    /// @notice Deploy a single vault on behalf of createNewVaultsAndStrategiesBatch.
+    /// @dev Must be called by this factory.
+    /// @param _gauge Address of the Curve gauge to deploy a new vault for.
+    /// @param _config Factory settings loaded at the start of the batch.
+    /// @return vault Address of the new vault.
+    /// @return convexStrategy Address of the vault's Convex strategy, if created.
+    /// @return curveStrategy Address of the vault's Curve boosted strategy.
+    /// @return convexFraxStrategy Address of the vault's Convex Frax strategy, if created.
+    function createNewVaultsAndStrategiesFromBatch(
+        address _gauge,
+        FactoryConfig memory _config
+    )
+        external
+        returns (
+            address vault,
+            address convexStrategy,
+            address curveStrategy,
+            address convexFraxStrategy
+        )
+    {
+        if (msg.sender != address(this)) {
+            revert();
+        }
+
+        return
+            _createNewVaultsAndStrategies(
+                _gauge,
+                false,
+                "default",
+                "default",
+                _config
+            );
+    }
+
+    // read everything we need to deploy a vault and its strategies into memory
+    function _loadConfig() internal view returns (FactoryConfig memory config) {
+        // three slots cover management, treasury, keeper, keeps, fees and harvest bounds
+        PackedSettings memory packed = packedSettings;
+
+        config.registry = registry;
+        config.booster = booster;
+        config.fraxBooster = fraxBooster;
+        config.governance = governance;
+        config.management = packed.management;
+        config.guardian = guardian;
+        config.treasury = packed.treasury;
+        config.keeper = packed.keeper;
+        config.healthCheck = healthCheck;
+        config.tradeFactory = tradeFactory;
+        config.baseFeeOracle = baseFeeOracle;
+        config.priceOracle = priceOracle;
+        config.convexStratImplementation = convexStratImplementation;
+        config.curveStratImplementation = curveStratImplementation;
+        config.convexFraxStratImplementation = convexFraxStratImplementation;
+        config.keepCRV = packed.keepCRV;
+        config.curveVoter = curveVoter;
+        config.keepCVX = packed.keepCVX;
+        config.convexVoter = convexVoter;
+        config.keepFXS = packed.keepFXS;
+        config.fraxVoter = fraxVoter;
+        config.harvestProfitMinInUsdc = packed.harvestProfitMinInUsdc;
+        config.harvestProfitMaxInUsdc = packed.harvestProfitMaxInUsdc;
+        config.performanceFee = packed.performanceFee;
+        config.managementFee = packed.managementFee;
+        config.depositLimit = depositLimit;
+
+        // pull our strategyProxy from our voter
+        config.proxy = IVoter(config.curveVoter).strategy();
     }
 
     // create a new vault along with strategies to match
@@ -834,7 +1518,8 @@ contract CurveGlobal {
         address _gauge,
         bool _permissionedUser,
         string memory _name,
-        string memory _symbol
+        string memory _symbol,
+        FactoryConfig memory _config
     )
         internal
         returns (
@@ -845,57 +1530,51 @@ contract CurveGlobal {
         )
     {
         // a curve gauge must have weight for a vault to be deployed
-        IGaugeController gaugeController = IGaugeController(
-            0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB
-        );
         require(
-            gaugeController.get_gauge_weight(_gauge) > 0,
+            IGaugeController(0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB)
+                .get_gauge_weight(_gauge) > 0,
             "Gauge must have weight"
         );
+        address lptoken = ICurveGauge(_gauge).lp_token();
 
         // if a legacy vault already exists, only permissioned users can deploy another
         if (!_permissionedUser) {
             require(
-                canCreateVaultPermissionlessly(_gauge),
+                _latestStandardVault(lptoken, _config.registry) == address(0),
                 "Vault already exists"
             );
         }
-        address lptoken = ICurveGauge(_gauge).lp_token();
 
         // make sure we don't already have a curve strategy setup for this gauge
         require(
-            !doesStrategyProxyHaveGauge(_gauge),
+            IProxy(_config.proxy).strategies(_gauge) == address(0),
             "Voter strategy already exists"
         );
 
         // get convex pid. if no pid create one
-        uint256 pid = getPid(_gauge);
+        uint256 pid = _getPid(_gauge, _config.booster);
         if (pid == type(uint256).max) {
-            //when we add the new pool it will be added to the end of the pools in convexDeposit.
-            pid = booster.poolLength();
-            //add pool
-            require(
-                IPoolManager(convexPoolManager).addPool(_gauge),
-                "Unable to add pool to Convex"
-            );
+            pid = _addConvexPool(_gauge, address(_config.booster));
         }
 
         if (_permissionedUser) {
             // allow trusted users to input the name and symbol or deploy a factory version of a legacy vault
-            vault = _createCustomVault(lptoken, _name, _symbol);
+            vault = _createCustomVault(lptoken, _name, _symbol, _config);
         } else {
             // anyone can create a vault, but it will have an auto-generated name and symbol
-            vault = _createStandardVault(lptoken);
+            vault = _createStandardVault(lptoken, _config);
         }
 
         // setup our fees, deposit limit, gov, etc
-        _setupVaultParams(vault);
+        _setupVaultParams(vault, _config);
+        gaugeOfVault[vault] = _gauge;
 
         // setup our strategies as needed
         (convexStrategy, curveStrategy, convexFraxStrategy) = _setupStrategies(
             vault,
             _gauge,
-            pid
+            pid,
+            _config
         );
 
         emit NewAutomatedVault(
@@ -909,17 +1588,38 @@ contract CurveGlobal {
         );
     }
 
+    // add a convex pool for our gauge, returning its new pid
+    function _addConvexPool(
+        address _gauge,
+        address _booster
+    ) internal returns (uint256 pid) {
+        //when we add the new pool it will be added to the end of the pools in convexDeposit.
+        pid = IBooster(_booster).poolLength();
+        //add pool
+        require(
+            IPoolManager(convexPoolManager).addPool(_gauge),
+            "Unable to add pool to Convex"
+        );
+
+        // if our index is fully synced, keep it that way
+        if (numPidsIndexed[_booster] == pid) {
+            indexedPids[_booster][_gauge] = pid + 1;
+            numPidsIndexed[_booster] = pid + 1;
+        }
+    }
+
     // permissioned users may pass custom name and symbol inputs
     function _createCustomVault(
         address lptoken,
         string memory _name,
-        string memory _symbol
+        string memory _symbol,
+        FactoryConfig memory _config
     ) internal returns (address vault) {
-        vault = registry.newVault(
+        vault = _config.registry.newVault(
             lptoken,
             address(this),
-            guardian,
-            treasury,
+            _config.guardian,
+            _config.treasury,
             _name,
             _symbol,
             0,
@@ -929,13 +1629,14 @@ contract CurveGlobal {
 
     // standard vaults create default name and symbols using on-chain data
     function _createStandardVault(
-        address lptoken
+        address lptoken,
+        FactoryConfig memory _config
     ) internal returns (address vault) {
-        vault = registry.newVault(
+        vault = _config.registry.newVault(
             lptoken,
             address(this),
-            guardian,
-            treasury,
+            _config.guardian,
+            _config.treasury,
             string(
                 abi.encodePacked(
                     "Curve ",
@@ -956,22 +1657,25 @@ contract CurveGlobal {
     }
 
     // set vault management, gov, deposit limit, and fees
-    function _setupVaultParams(address _vault) internal {
+    function _setupVaultParams(
+        address _vault,
+        FactoryConfig memory _config
+    ) internal {
         // record our new vault for posterity
         deployedVaults.push(_vault);
 
         Vault v = Vault(_vault);
-        v.setManagement(management);
+        v.setManagement(_config.management);
 
         // set governance to ychad who needs to accept before it is finalised. until then governance is this factory
-        v.setGovernance(governance);
-        v.setDepositLimit(depositLimit);
+        v.setGovernance(_config.governance);
+        v.setDepositLimit(_config.depositLimit);
 
-        if (v.managementFee() != managementFee) {
-            v.setManagementFee(managementFee);
+        if (v.managementFee() != _config.managementFee) {
+            v.setManagementFee(_config.managementFee);
         }
-        if (v.performanceFee() != performanceFee) {
-            v.setPerformanceFee(performanceFee);
+        if (v.performanceFee() != _config.performanceFee) {
+            v.setPerformanceFee(_config.performanceFee);
         }
     }
 
@@ -979,7 +1683,8 @@ contract CurveGlobal {
     function _setupStrategies(
         address _vault,
         address _gauge,
-        uint256 _pid
+        uint256 _pid,
+        FactoryConfig memory _config
     )
         internal
         returns (
@@ -988,7 +1693,7 @@ contract CurveGlobal {
             address convexFraxStrategy
         )
     {
-        // check if we can add a convex frax strategy for this pool, ganache can't handle this (use tenderly)
+        // check if we can add a convex frax strategy for this pool. once synced, this is a single registry read
         (
             bool hasFraxPool,
             uint256 fraxPid,
@@ -996,15 +1701,21 @@ contract CurveGlobal {
         ) = getFraxInfo(_pid);
 
         // we have a frax implementation, so we know we at least want convex and curve boosted strategies
-        convexStrategy = _addConvexStrategy(_vault, _pid);
-        curveStrategy = _addCurveStrategy(_vault, _gauge, hasFraxPool);
+        convexStrategy = _addConvexStrategy(_vault, _pid, _config);
+        curveStrategy = _addCurveStrategy(
+            _vault,
+            _gauge,
+            hasFraxPool,
+            _config
+        );
 
         if (hasFraxPool) {
             // we attach a frax strategy here since this is a frax pool
             convexFraxStrategy = _addConvexFraxStrategy(
                 _vault,
                 fraxPid,
-                stakingAddress
+                stakingAddress,
+                _config
             );
         }
     }
@@ -1012,31 +1723,31 @@ contract CurveGlobal {
     // deploy and attach a new convex strategy using our factory's existing implementation
     function _addConvexStrategy(
         address _vault,
-        uint256 _pid
+        uint256 _pid,
+        FactoryConfig memory _config
     ) internal returns (address convexStrategy) {
-        convexStrategy = IStrategy(convexStratImplementation)
-            .cloneStrategyConvex(
-                _vault,
-                management,
-                treasury,
-                keeper,
-                tradeFactory,
-                _pid,
-                harvestProfitMinInUsdc,
-                harvestProfitMaxInUsdc,
-                address(booster),
-                CVX
-            );
-
-        // set up health check and the base fee oracle for our new strategy
-        IStrategy(convexStrategy).setHealthCheck(healthCheck);
-        IStrategy(convexStrategy).setBaseFeeOracle(baseFeeOracle);
-
-        // if we're keeping any tokens, then setup our voters
-        if (keepCRV > 0 || keepCVX > 0) {
-            IStrategy(convexStrategy).setVoters(curveVoter, convexVoter);
-            IStrategy(convexStrategy).setLocalKeepCrvs(keepCRV, keepCVX);
-        }
+        // health check, base fee oracle, voters and keeps are all set when our strategy is initialized
+        IStrategy.ConvexConfig memory strategyConfig;
+        strategyConfig.vault = _vault;
+        strategyConfig.strategist = _config.management;
+        strategyConfig.rewards = _config.treasury;
+        strategyConfig.keeper = _config.keeper;
+        strategyConfig.tradeFactory = _config.tradeFactory;
+        strategyConfig.pid = _pid;
+        strategyConfig.harvestProfitMinInUsdc = _config.harvestProfitMinInUsdc;
+        strategyConfig.harvestProfitMaxInUsdc = _config.harvestProfitMaxInUsdc;
+        strategyConfig.booster = address(_config.booster);
+        strategyConfig.convexToken = CVX;
+        strategyConfig.healthCheck = _config.healthCheck;
+        strategyConfig.baseFeeOracle = _config.baseFeeOracle;
+        strategyConfig.curveVoter = _config.curveVoter;
+        strategyConfig.convexVoter = _config.convexVoter;
+        strategyConfig.keepCRV = _config.keepCRV;
+        strategyConfig.keepCVX = _config.keepCVX;
+        strategyConfig.priceOracle = _config.priceOracle;
+
+        convexStrategy = IStrategy(_config.convexStratImplementation)
+            .cloneStrategyConvexWithConfig(strategyConfig);
 
         // convex debtRatio can always start at 0
         Vault(_vault).addStrategy(convexStrategy, 0, 0, type(uint256).max, 0);
@@ -1046,34 +1757,31 @@ contract CurveGlobal {
     function _addCurveStrategy(
         address _vault,
         address _gauge,
-        bool _hasFraxPool
+        bool _hasFraxPool,
+        FactoryConfig memory _config
     ) internal returns (address curveStrategy) {
-        // pull our strategyProxy from our voter
-        IProxy proxy = IProxy(getProxy());
-
-        // create the curve voter strategy
-        curveStrategy = IStrategy(curveStratImplementation)
-            .cloneStrategyCurveBoosted(
-                _vault,
-                management,
-                treasury,
-                keeper,
-                tradeFactory,
-                address(proxy),
-                _gauge
-            );
-
-        // set up health check and the base fee oracle for our new strategy
-        IStrategy(curveStrategy).setHealthCheck(healthCheck);
-        IStrategy(curveStrategy).setBaseFeeOracle(baseFeeOracle);
+        // our strategyProxy was pulled from our voter when loading our config
+        IProxy proxy = IProxy(_config.proxy);
+
+        // health check, base fee oracle, voter and keep are all set when our strategy is initialized
+        IStrategy.CurveBoostedConfig memory strategyConfig;
+        strategyConfig.vault = _vault;
+        strategyConfig.strategist = _config.management;
+        strategyConfig.rewards = _config.treasury;
+        strategyConfig.keeper = _config.keeper;
+        strategyConfig.tradeFactory = _config.tradeFactory;
+        strategyConfig.proxy = address(proxy);
+        strategyConfig.gauge = _gauge;
+        strategyConfig.healthCheck = _config.healthCheck;
+        strategyConfig.baseFeeOracle = _config.baseFeeOracle;
 
         // must set our voter, this is used to deposit
-        IStrategy(curveStrategy).setVoter(curveVoter);
+        strategyConfig.curveVoter = _config.curveVoter;
+        strategyConfig.keepCRV = _config.keepCRV;
 
-        // if we're keeping any tokens, then setup our keepCRV
-        if (keepCRV > 0) {
-            IStrategy(curveStrategy).setLocalKeepCrv(keepCRV);
-        }
+        // create the curve voter strategy
+        curveStrategy = IStrategy(_config.curveStratImplementation)
+            .cloneStrategyCurveBoostedWithConfig(strategyConfig);
 
         uint256 curveDebtRatio = 10_000;
         if (_hasFraxPool) {
@@ -1096,39 +1804,33 @@ contract CurveGlobal {
     function _addConvexFraxStrategy(
         address _vault,
         uint256 _fraxPid,
-        address _stakingAddress
+        address _stakingAddress,
+        FactoryConfig memory _config
     ) internal returns (address convexFraxStrategy) {
-        convexFraxStrategy = IStrategy(convexFraxStratImplementation)
-            .cloneStrategyConvexFrax(
-                _vault,
-                management,
-                treasury,
-                keeper,
-                tradeFactory,
-                _fraxPid,
-                _stakingAddress,
-                harvestProfitMinInUsdc,
-                harvestProfitMaxInUsdc,
-                address(fraxBooster)
-            );
-
-        // set up health check and the base fee oracle for our new strategy
-        IStrategy(convexFraxStrategy).setHealthCheck(healthCheck);
-        IStrategy(convexFraxStrategy).setBaseFeeOracle(baseFeeOracle);
-
-        // if we're keeping any tokens, then setup our voters
-        if (keepCRV > 0 || keepCVX > 0 || keepFXS > 0) {
-            IStrategy(convexFraxStrategy).setVoters(
-                curveVoter,
-                convexVoter,
-                fraxVoter
-            );
-            IStrategy(convexFraxStrategy).setLocalKeepCrvs(
-                keepCRV,
-                keepCVX,
-                keepFXS
-            );
-        }
+        // health check, base fee oracle, voters and keeps are all set when our strategy is initialized
+        IStrategy.ConvexFraxConfig memory strategyConfig;
+        strategyConfig.vault = _vault;
+        strategyConfig.strategist = _config.management;
+        strategyConfig.rewards = _config.treasury;
+        strategyConfig.keeper = _config.keeper;
+        strategyConfig.tradeFactory = _config.tradeFactory;
+        strategyConfig.fraxPid = _fraxPid;
+        strategyConfig.stakingAddress = _stakingAddress;
+        strategyConfig.harvestProfitMinInUsdc = _config.harvestProfitMinInUsdc;
+        strategyConfig.harvestProfitMaxInUsdc = _config.harvestProfitMaxInUsdc;
+        strategyConfig.booster = address(_config.fraxBooster);
+        strategyConfig.healthCheck = _config.healthCheck;
+        strategyConfig.baseFeeOracle = _config.baseFeeOracle;
+        strategyConfig.curveVoter = _config.curveVoter;
+        strategyConfig.convexVoter = _config.convexVoter;
+        strategyConfig.fraxVoter = _config.fraxVoter;
+        strategyConfig.keepCRV = _config.keepCRV;
+        strategyConfig.keepCVX = _config.keepCVX;
+        strategyConfig.keepFXS = _config.keepFXS;
+        strategyConfig.priceOracle = _config.priceOracle;
+
+        convexFraxStrategy = IStrategy(_config.convexFraxStratImplementation)
+            .cloneStrategyConvexFraxWithConfig(strategyConfig);
 
         // for frax pools, Convex-Frax is the most profitable strategy, but it can be illiquid. default 80%.
         Vault(_vault).addStrategy(
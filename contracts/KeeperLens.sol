@@ -0,0 +1,154 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+interface IStrategy {
+    function harvestTrigger(uint256 callCostinEth) external view returns (bool);
+
+    function claimableProfitInUsdc() external view returns (uint256);
+}
+
+interface ICurveGlobal {
+    function deployedVaultsPage(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (address[] memory);
+}
+
+interface IPriceCache {
+    function cachePricesForBlock(
+        address[] calldata _tokens
+    ) external returns (uint256[] memory);
+}
+
+interface Vault {
+    function withdrawalQueue(uint256) external view returns (address);
+}
+
+contract KeeperLens {
+    /* ========== STRUCTS ========== */
+
+    struct WorkableStrategy {
+        address vault;
+        address strategy;
+        bool hasClaimableProfit;
+        uint256 claimableProfitInUsdc;
+    }
+
+    /* ========== CONSTANTS ========== */
+
+    // vaults hold at most 20 strategies
+    uint256 internal constant MAX_STRATEGIES = 20;
+
+    /* ========== VIEWS ========== */
+
+    /**
+     * @notice Find every strategy in a page of factory vaults whose harvestTrigger() is true.
+     * @dev Strategies whose trigger reverts are skipped, and claimableProfitInUsdc() is
+     *  optional, so a single broken strategy can't break the page. Keep pages small enough
+     *  to stay within your node's eth_call gas limit.
+     * @param _factory The factory whose deployed vaults we check, such as CurveGlobal.
+     * @param _offset Index in the factory's deployed vaults of the first vault to check.
+     * @param _limit Maximum number of vaults to check.
+     * @param _callCostInEth Our keeper's cost to harvest, passed to each harvestTrigger().
+     * @return workable Array of strategies that are ready to harvest, with their vaults.
+     */
+    function workableStrategies(
+        address _factory,
+        uint256 _offset,
+        uint256 _limit,
+        uint256 _callCostInEth
+    ) external view returns (WorkableStrategy[] memory workable) {
+        return
+            _workableStrategies(_factory, _offset, _limit, _callCostInEth);
+    }
+
+    /* ========== CALLS ========== */
+
+    /**
+     * @notice Same as workableStrategies(), but caches token prices for this block first.
+     * @dev Not a view, since it writes to our price cache, but meant to be run with eth_call.
+     *  Strategies that read prices through _priceCache then share one oracle read per token
+     *  across the whole page, instead of reading our oracle in every trigger and profit check.
+     * @param _factory The factory whose deployed vaults we check, such as CurveGlobal.
+     * @param _offset Index in the factory's deployed vaults of the first vault to check.
+     * @param _limit Maximum number of vaults to check.
+     * @param _callCostInEth Our keeper's cost to harvest, passed to each harvestTrigger().
+     * @param _priceCache The PriceCache our strategies use as their price oracle.
+     * @param _tokens Tokens whose prices our strategies read, such as CRV and CVX.
+     * @return workable Array of strategies that are ready to harvest, with their vaults.
+     */
+    function workableStrategiesWithPrices(
+        address _factory,
+        uint256 _offset,
+        uint256 _limit,
+        uint256 _callCostInEth,
+        address _priceCache,
+        address[] calldata _tokens
+    ) external returns (WorkableStrategy[] memory workable) {
+        IPriceCache(_priceCache).cachePricesForBlock(_tokens);
+        return
+            _workableStrategies(_factory, _offset, _limit, _callCostInEth);
+    }
+
+    /* ========== INTERNAL ========== */
+
+    function _workableStrategies(
+        address _factory,
+        uint256 _offset,
+        uint256 _limit,
+        uint256 _callCostInEth
+    ) internal view returns (WorkableStrategy[] memory workable) {
+        address[] memory vaults = ICurveGlobal(_factory).deployedVaultsPage(
+            _offset,
+            _limit
+        );
+        workable = new WorkableStrategy[](vaults.length * MAX_STRATEGIES);
+        uint256 count;
+
+        for (uint256 i; i < vaults.length; ++i) {
+            for (uint256 j; j < MAX_STRATEGIES; ++j) {
+                address strategy = Vault(vaults[i]).withdrawalQueue(j);
+                if (strategy == address(0)) {
+                    break;
+                }
+                if (!_isWorkable(strategy, _callCostInEth)) {
+                    continue;
+                }
+
+                WorkableStrategy memory info = workable[count];
+                info.vault = vaults[i];
+                info.strategy = strategy;
+                try IStrategy(strategy).claimableProfitInUsdc() returns (
+                    uint256 claimableProfit
+                ) {
+                    info.hasClaimableProfit = true;
+                    info.claimableProfitInUsdc = claimableProfit;
+                } catch {}
+                ++count;
+            }
+        }
+
+        // trim our array down to the strategies we actually found
+        assembly {
+            mstore(workable, count)
+        }
+    }
+
+    // check a strategy's trigger, treating any revert as not workable
+    function _isWorkable(
+        address _strategy,
+        uint256 _callCostInEth
+    ) internal view returns (bool) {
+        if (_strategy.code.length == 0) {
+            return false;
+        }
+
+        try IStrategy(_strategy).harvestTrigger(_callCostInEth) returns (
+            bool triggered
+        ) {
+            return triggered;
+        } catch {
+            return false;
+        }
+    }
+}
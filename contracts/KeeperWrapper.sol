@@ -3,11 +3,94 @@ pragma solidity ^0.8.15;
 
 interface IStrategy {
     function harvest() external;
+
+    function harvestTrigger(uint256 callCostinEth) external view returns (bool);
 }
 
 contract KeeperWrapper {
+    /* ========== EVENTS ========== */
+
+    event StrategyHarvested(address indexed strategy);
+
+    event StrategyHarvestFailed(address indexed strategy, bytes reason);
+
     /// @notice This allows anyone to call harvest() on vaults created by the factory.
     function harvestStrategy(address _strategy) external {
         IStrategy(_strategy).harvest();
     }
+
+    /**
+     * @notice Harvest many strategies in a single transaction.
+     * @dev A failing harvest emits StrategyHarvestFailed and doesn't stop the others. We stop early,
+     *  without reverting, once we have less than _gasReserve gas left before a harvest, and each
+     *  harvest may only use the gas above our reserve, so a harvest that runs out of gas still
+     *  leaves enough to emit its failure and carry on. Keepers should set this to at least the
+     *  cost of emitting a failure and checking the next strategy.
+     * @param _strategies Array of strategies to harvest, in order.
+     * @param _gasReserve Minimum gas we must have left to attempt another harvest.
+     * @return attempted Number of strategies we attempted to harvest. Any strategies from this
+     *  index onwards were skipped for lack of gas.
+     */
+    function harvestMany(
+        address[] calldata _strategies,
+        uint256 _gasReserve
+    ) external returns (uint256 attempted) {
+        uint256 length = _strategies.length;
+        for (; attempted < length; ++attempted) {
+            if (gasleft() < _gasReserve) {
+                break;
+            }
+            _harvest(_strategies[attempted], gasleft() - _gasReserve);
+        }
+    }
+
+    /**
+     * @notice Harvest any of these strategies whose harvestTrigger() is true.
+     * @dev Triggers are checked in this same transaction, so we only harvest strategies that
+     *  are due as of this block. Strategies whose trigger reverts or returns false are skipped
+     *  silently, and failing harvests emit StrategyHarvestFailed without reverting.
+     * @param _strategies Array of strategies to check and harvest, in order.
+     * @param _callCostInEth Our keeper's cost to harvest, passed to each harvestTrigger().
+     * @return harvested Number of strategies successfully harvested.
+     */
+    function harvestIfTriggered(
+        address[] calldata _strategies,
+        uint256 _callCostInEth
+    ) external returns (uint256 harvested) {
+        uint256 length = _strategies.length;
+        for (uint256 i; i < length; ++i) {
+            address strategy = _strategies[i];
+            if (strategy.code.length == 0) {
+                continue;
+            }
+
+            try IStrategy(strategy).harvestTrigger(_callCostInEth) returns (
+                bool triggered
+            ) {
+                if (triggered && _harvest(strategy, gasleft())) {
+                    ++harvested;
+                }
+            } catch {}
+        }
+    }
+
+    // harvest a single strategy with at most _gasLimit gas, emitting the result instead of reverting
+    function _harvest(
+        address _strategy,
+        uint256 _gasLimit
+    ) internal returns (bool) {
+        // try/catch can't catch calls to addresses without code
+        if (_strategy.code.length == 0) {
+            emit StrategyHarvestFailed(_strategy, "");
+            return false;
+        }
+
+        try IStrategy(_strategy).harvest{gas: _gasLimit}() {
+            emit StrategyHarvested(_strategy);
+            return true;
+        } catch (bytes memory reason) {
+            emit StrategyHarvestFailed(_strategy, reason);
+            return false;
+        }
+    }
 }
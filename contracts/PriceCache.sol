@@ -0,0 +1,193 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+import "@openzeppelin/contracts/access/Ownable.sol";
+
+interface IOracle {
+    // pull our asset price, in usdc, via yearn's oracle
+    function getPriceUsdcRecommended(
+        address tokenAddress
+    ) external view returns (uint256);
+}
+
+/**
+ * @notice Shared cache in front of yearn's lens oracle, so many strategies checking
+ *  claimableProfitInUsdc() can reuse the same prices.
+ * @dev Views can't write storage, so prices are cached ahead of reads in one of two ways. Our
+ *  owner and approved keepers may call updatePrices() to cache prices for up to maxStaleness,
+ *  for instance at the start of a harvest batch. Anyone may call cachePricesForBlock() to cache
+ *  prices for the current block only; KeeperLens does this at the start of each scan, so every
+ *  strategy in the scan shares one oracle read per token. Reads fall through to our oracle
+ *  whenever a cached price is missing or no longer valid.
+ */
+contract PriceCache is Ownable {
+    /* ========== STRUCTS ========== */
+
+    // packed into a single slot so each cached read is one SLOAD
+    struct CachedPrice {
+        uint192 price;
+        uint56 timestamp;
+        bool blockOnly;
+    }
+
+    /* ========== STATE VARIABLES ========== */
+
+    /// @notice The oracle we cache prices from.
+    IOracle public oracle;
+
+    /// @notice Maximum age in seconds of a cached price before we read our oracle again.
+    /// @dev Zero means cached prices are only used in the block they were cached.
+    uint256 public maxStaleness;
+
+    /// @notice Latest cached USDC price (6 decimals) for a token, when we cached it, and whether
+    ///  it's only valid for the block it was cached in.
+    mapping(address => CachedPrice) public cachedPrices;
+
+    /// @notice Whether an address may update our cached prices, in addition to our owner.
+    mapping(address => bool) public keepers;
+
+    /* ========== EVENTS ========== */
+
+    event PriceCached(address indexed token, uint256 price);
+
+    event OracleUpdated(address oracle);
+
+    event MaxStalenessUpdated(uint256 maxStaleness);
+
+    event KeeperUpdated(address indexed keeper, bool approved);
+
+    /* ========== CONSTRUCTOR ========== */
+
+    constructor(address _oracle, uint256 _maxStaleness) {
+        oracle = IOracle(_oracle);
+        maxStaleness = _maxStaleness;
+    }
+
+    /* ========== VIEWS ========== */
+
+    /**
+     * @notice Get a token's price in USDC (6 decimals), with the same interface as yearn's
+     *  lens oracle.
+     * @dev Uses our cached price if it's fresh enough, otherwise reads our oracle directly.
+     * @param _token The token to price.
+     * @return The token's price in USDC.
+     */
+    function getPriceUsdcRecommended(
+        address _token
+    ) external view returns (uint256) {
+        CachedPrice memory cached = cachedPrices[_token];
+        if (_isFresh(cached)) {
+            return cached.price;
+        }
+        return oracle.getPriceUsdcRecommended(_token);
+    }
+
+    /// @notice Check whether we have a fresh cached price for a token.
+    /// @param _token The token to check.
+    /// @return Whether getPriceUsdcRecommended() will skip our oracle for this token.
+    function isPriceFresh(address _token) external view returns (bool) {
+        return _isFresh(cachedPrices[_token]);
+    }
+
+    // a timestamp of zero means we've never cached this token. block timestamps are unique per block,
+    //  so block-only prices are matched on timestamp
+    function _isFresh(CachedPrice memory _cached) internal view returns (bool) {
+        if (_cached.timestamp == 0) {
+            return false;
+        }
+        if (_cached.blockOnly) {
+            return _cached.timestamp == block.timestamp;
+        }
+        return block.timestamp - _cached.timestamp <= maxStaleness;
+    }
+
+    /* ========== CORE FUNCTIONS ========== */
+
+    /**
+     * @notice Cache the current oracle price for each of these tokens.
+     * @dev Must be called by owner or an approved keeper. Our oracle reads spot prices in
+     *  places, so letting anyone cache them would let a manipulated price stick around for
+     *  up to maxStaleness.
+     * @param _tokens Array of tokens to cache prices for.
+     * @return prices Array of the prices we cached, in the same order.
+     */
+    function updatePrices(
+        address[] calldata _tokens
+    ) external returns (uint256[] memory prices) {
+        if (!keepers[msg.sender] && msg.sender != owner()) {
+            revert();
+        }
+
+        uint256 length = _tokens.length;
+        prices = new uint256[](length);
+        for (uint256 i; i < length; ++i) {
+            address token = _tokens[i];
+            uint256 price = oracle.getPriceUsdcRecommended(token);
+            cachedPrices[token] = CachedPrice(
+                uint192(price),
+                uint56(block.timestamp),
+                false
+            );
+            prices[i] = price;
+            emit PriceCached(token, price);
+        }
+    }
+
+    /**
+     * @notice Cache the current oracle price for each of these tokens, for this block only.
+     * @dev Anyone may call this, since a price that is only used in the block it was read in is
+     *  no easier to manipulate than reading our oracle directly. Tokens that already have a valid
+     *  cached price are left alone. Meant to be called inside an eth_call, such as by
+     *  KeeperLens.workableStrategiesWithPrices(), so doesn't emit events.
+     * @param _tokens Array of tokens to cache prices for.
+     * @return prices Array of the prices we cached or already had, in the same order.
+     */
+    function cachePricesForBlock(
+        address[] calldata _tokens
+    ) external returns (uint256[] memory prices) {
+        uint256 length = _tokens.length;
+        prices = new uint256[](length);
+        for (uint256 i; i < length; ++i) {
+            address token = _tokens[i];
+            CachedPrice memory cached = cachedPrices[token];
+            if (_isFresh(cached)) {
+                prices[i] = cached.price;
+                continue;
+            }
+
+            uint256 price = oracle.getPriceUsdcRecommended(token);
+            cachedPrices[token] = CachedPrice(
+                uint192(price),
+                uint56(block.timestamp),
+                true
+            );
+            prices[i] = price;
+        }
+    }
+
+    /* ========== SETTERS ========== */
+
+    /// @notice Set the oracle we cache prices from.
+    /// @dev Must be called by owner. Cached prices from our old oracle stay valid until stale.
+    /// @param _oracle Address of our new oracle.
+    function setOracle(address _oracle) external onlyOwner {
+        oracle = IOracle(_oracle);
+        emit OracleUpdated(_oracle);
+    }
+
+    /// @notice Set how long our cached prices stay valid.
+    /// @dev Must be called by owner.
+    /// @param _maxStaleness Maximum age in seconds of a cached price.
+    function setMaxStaleness(uint256 _maxStaleness) external onlyOwner {
+        maxStaleness = _maxStaleness;
+        emit MaxStalenessUpdated(_maxStaleness);
+    }
+
+    /// @notice Approve or revoke an address to update our cached prices.
+    /// @dev Must be called by owner.
+    /// @param _keeper The address to approve or revoke.
+    /// @param _approved Whether this address may call updatePrices().
+    function setKeeper(address _keeper, bool _approved) external onlyOwner {
+        keepers[_keeper] = _approved;
+        emit KeeperUpdated(_keeper, _approved);
+    }
+}
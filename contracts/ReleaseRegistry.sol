@@ -28,6 +28,69 @@ contract ReleaseRegistry is Ownable {
         return IVault(releases[numReleases - 1]).apiVersion(); // dev: no release
     }
 
+    /**
+    @notice
+        Returns the address a deterministic vault will be deployed to via
+        newVaultDeterministic().
+    @dev
+        Throws if no releases are registered yet. Our salt is scoped to the
+        deployer, token and release id, so each (deployer, token, salt, release)
+        maps to exactly one address, even if a template is ever re-released.
+    @param _deployer The address that will call newVaultDeterministic().
+    @param _token The token that will be deposited into the new Vault.
+    @param _salt The salt the deployer will pass to newVaultDeterministic().
+    @param _releaseDelta The number of releases prior to the latest to use as a target.
+    @return The address the vault will be deployed to.
+    */
+    function predictVaultAddress(
+        address _deployer,
+        address _token,
+        bytes32 _salt,
+        uint256 _releaseDelta
+    ) external view returns (address) {
+        // NOTE: Underflow if no releases created yet, or targeting prior to release history
+        uint256 releaseTarget = numReleases - 1 - _releaseDelta; // dev: no releases
+        address release = releases[releaseTarget];
+        require(release != address(0), "unknown release");
+        return
+            address(
+                uint160(
+                    uint256(
+                        keccak256(
+                            abi.encodePacked(
+                                bytes1(0xff),
+                                address(this),
+                                _vaultSalt(
+                                    _deployer,
+                                    _token,
+                                    releaseTarget,
+                                    _salt
+                                ),
+                                keccak256(
+                                    abi.encodePacked(
+                                        hex"3d602d80600a3d3981f3363d3d373d3d3d363d73",
+                                        release,
+                                        hex"5af43d82803e903d91602b57fd5bf3"
+                                    )
+                                )
+                            )
+                        )
+                    )
+                )
+            );
+    }
+
+    // scope our salt to the caller so no one else can squat on a deployer's vault address, and to
+    //  our release so redeploying a token from a different release can never collide
+    function _vaultSalt(
+        address _deployer,
+        address _token,
+        uint256 _releaseTarget,
+        bytes32 _salt
+    ) internal pure returns (bytes32) {
+        return keccak256(abi.encode(_deployer, _token, _releaseTarget, _salt));
+    }
+
     /**
     @notice
         Add a previously deployed Vault as the template contract for the latest release,
@@ -86,6 +149,36 @@ contract ReleaseRegistry is Ownable {
         return vault;
     }
 
+    function _newDeterministicProxyVault(
+        address _token,
+        address _governance,
+        address _rewards,
+        address _guardian,
+        string memory _name,
+        string memory _symbol,
+        uint256 _releaseTarget,
+        bytes32 _salt
+    ) internal returns (address vault) {
+        {
+            address release = releases[_releaseTarget];
+            require(release != address(0), "unknown release");
+            vault = _cloneDeterministic(
+                release,
+                _vaultSalt(msg.sender, _token, _releaseTarget, _salt)
+            );
+            emit NewClone(vault);
+        }
+        // NOTE: Must initialize the Vault atomically with deploying it
+        IVault(vault).initialize(
+            _token,
+            _governance,
+            _rewards,
+            _name,
+            _symbol,
+            _guardian
+        );
+    }
+
     /// @notice Deploy a new vault with the latest vault release.
     /// @dev See other newVault() function for more details.
     function newVault(
@@ -146,6 +239,102 @@ contract ReleaseRegistry is Ownable {
         return vault;
     }
 
+    /**
+    @notice
+        Create new vaults for a batch of tokens using the same release, as simple
+        "forwarder-style" delegatecall proxies to that release.
+    @dev
+        Throws if no releases are registered yet. Our release is only resolved once for the
+        whole batch. Vaults are deployed with CREATE2 just like newVaultDeterministic(), so
+        each address can be found with predictVaultAddress() using this same salt. Throws if
+        this caller has already deployed a vault for any of these tokens with this salt and
+        release. Vaults use their default names and symbols, and are not automatically
+        endorsed. Emits a NewClone event for each vault.
+    @param _tokens The tokens that may be deposited into our new Vaults.
+    @param _governance vault governance
+    @param _guardian The address authorized for guardian interactions in our new Vaults.
+    @param _rewards The address to use for collecting rewards in our new Vaults
+    @param _releaseDelta Specify the number of releases prior to the latest to use as a target. Default is latest.
+    @param _salt Caller-chosen salt, scoped to msg.sender and each token.
+    @return vaults The addresses of our newly-deployed vaults, in the same order as our tokens
+     */
+    function newVaults(
+        address[] calldata _tokens,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        uint256 _releaseDelta,
+        bytes32 _salt
+    ) external returns (address[] memory vaults) {
+        // NOTE: Underflow if no releases created yet, or targeting prior to release history
+        uint256 releaseTarget = numReleases - 1 - _releaseDelta; // dev: no releases
+        address release = releases[releaseTarget];
+        require(release != address(0), "unknown release");
+
+        vaults = new address[](_tokens.length);
+        for (uint256 i; i < _tokens.length; ++i) {
+            address vault = _cloneDeterministic(
+                release,
+                _vaultSalt(msg.sender, _tokens[i], releaseTarget, _salt)
+            );
+            emit NewClone(vault);
+
+            // NOTE: Must initialize the Vault atomically with deploying it
+            IVault(vault).initialize(
+                _tokens[i],
+                _governance,
+                _rewards,
+                "",
+                "",
+                _guardian
+            );
+            vaults[i] = vault;
+        }
+    }
+
+    /**
+    @notice
+        Create a new vault for the given token using CREATE2, so that its address
+        may be known before deployment. See predictVaultAddress().
+    @dev
+        Throws if no releases are registered yet. Throws if this caller has already
+        deployed a vault for this token, salt and release. Note that this vault will
+        not be automatically endorsed.
+    @param _token The token that may be deposited into the new Vault.
+    @param _governance vault governance
+    @param _guardian The address authorized for guardian interactions in the new Vault.
+    @param _rewards The address to use for collecting rewards in the new Vault
+    @param _name Specify a custom Vault name. Set to empty string for default choice.
+    @param _symbol Specify a custom Vault symbol name. Set to empty string for default choice.
+    @param _releaseDelta Specify the number of releases prior to the latest to use as a target. Default is latest.
+    @param _salt Caller-chosen salt, scoped to msg.sender and _token.
+    @return The address of the newly-deployed vault
+     */
+    function newVaultDeterministic(
+        address _token,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        string calldata _name,
+        string calldata _symbol,
+        uint256 _releaseDelta,
+        bytes32 _salt
+    ) external returns (address) {
+        // NOTE: Underflow if no releases created yet, or targeting prior to release history
+        uint256 releaseTarget = numReleases - 1 - _releaseDelta; // dev: no releases
+        return
+            _newDeterministicProxyVault(
+                _token,
+                _governance,
+                _rewards,
+                _guardian,
+                _name,
+                _symbol,
+                releaseTarget,
+                _salt
+            );
+    }
+
     function _clone(address _target) internal returns (address _newVault) {
         // Copied from https://github.com/optionality/clone-factory/blob/master/contracts/CloneFactory.sol
         bytes20 addressBytes = bytes20(address(_target));
@@ -165,4 +354,28 @@ contract ReleaseRegistry is Ownable {
             _newVault := create(0, clone_code, 0x37)
         }
     }
+
+    // same as _clone, but deployed via CREATE2 so our address is predictable
+    function _cloneDeterministic(
+        address _target,
+        bytes32 _salt
+    ) internal returns (address _newVault) {
+        bytes20 addressBytes = bytes20(address(_target));
+
+        assembly {
+            // EIP-1167 bytecode
+            let clone_code := mload(0x40)
+            mstore(
+                clone_code,
+                0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000
+            )
+            mstore(add(clone_code, 0x14), addressBytes)
+            mstore(
+                add(clone_code, 0x28),
+                0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000
+            )
+            _newVault := create2(0, clone_code, 0x37, _salt)
+        }
+        require(_newVault != address(0), "already deployed");
+    }
 }
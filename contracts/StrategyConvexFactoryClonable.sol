@@ -6,6 +6,7 @@ pragma experimental ABIEncoderV2;
 import "@openzeppelin/contracts/utils/math/Math.sol";
 import "./interfaces/curve.sol";
 import "@yearnvaults/contracts/BaseStrategy.sol";
+import "./ClonableWithImmutableArgs.sol";
 
 interface ITradeFactory {
     function enable(address, address) external;
@@ -79,19 +80,41 @@ interface IConvexDeposit {
     ) external view returns (address, address, address, address, address, bool);
 }
 
-contract StrategyConvexFactoryClonable is BaseStrategy {
+contract StrategyConvexFactoryClonable is
+    BaseStrategy,
+    ClonableWithImmutableArgs
+{
     using SafeERC20 for IERC20;
 
-    /* ========== STATE VARIABLES ========== */
-
-    /// @notice This is the deposit contract that all Convex pools use, aka booster.
-    address public depositContract;
+    /* ========== STRUCTS ========== */
+
+    /// @notice Everything needed to fully set up a new Convex strategy in one call.
+    struct InitConfig {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address tradeFactory;
+        uint256 pid;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+        address booster;
+        address convexToken;
+        address healthCheck;
+        address baseFeeOracle;
+        address curveVoter;
+        address convexVoter;
+        uint256 keepCRV;
+        uint256 keepCVX;
+        address priceOracle;
+    }
 
-    /// @notice This is unique to each pool and holds the rewards.
-    IConvexRewards public rewardsContract;
+    /* ========== STATE VARIABLES ========== */
 
-    /// @notice This is a unique numerical identifier for each Convex pool.
-    uint256 public pid;
+    // our booster, rewards contract and pid. clones with immutable args keep these in their code instead, see views
+    address internal storedDepositContract;
+    IConvexRewards internal storedRewardsContract;
+    uint256 internal storedPid;
 
     /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
     uint256 public localKeepCRV;
@@ -128,6 +151,15 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     /// @dev Only used in harvestTrigger.
     uint256 public harvestProfitMaxInUsdc;
 
+    /// @notice Oracle we use to price our claimable rewards in USDC.
+    /// @dev Only used in harvestTrigger. Defaults to yearn's lens oracle, but may be a shared
+    ///  PriceCache in front of it.
+    IOracle public priceOracle;
+
+    // yearn lens oracle, our default priceOracle
+    address internal constant YEARN_ORACLE =
+        0x83d95e0D5f402511dB06817Aff3f9eA88224B030;
+
     /// @notice Check if we need to earmark rewards on Convex before harvesting, usually false.
     /// @dev Only used in harvestTrigger.
     bool public checkEarmark;
@@ -191,27 +223,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         address _booster,
         address _convexToken
     ) external returns (address newStrategy) {
-        // don't clone a clone
-        if (!isOriginal) {
-            revert();
-        }
-
-        // Copied from https://github.com/optionality/clone-factory/blob/master/contracts/CloneFactory.sol
-        bytes20 addressBytes = bytes20(address(this));
-        assembly {
-            // EIP-1167 bytecode
-            let clone_code := mload(0x40)
-            mstore(
-                clone_code,
-                0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000
-            )
-            mstore(add(clone_code, 0x14), addressBytes)
-            mstore(
-                add(clone_code, 0x28),
-                0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000
-            )
-            newStrategy := create(0, clone_code, 0x37)
-        }
+        newStrategy = _clone("", 0);
 
         StrategyConvexFactoryClonable(newStrategy).initialize(
             _vault,
@@ -264,7 +276,83 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         );
     }
 
-    // this is called by our original strategy, as well as any clones via the above function
+    /// @notice Clone this strategy on another vault, fully configured in a single call.
+    /// @dev In practice, this will only be called by the factory on the template contract.
+    ///  Health check, base fee oracle, voters and keeps are all set during initialization. Our booster,
+    ///  rewards contract and pid are appended to the clone's code, so reading them never costs an SLOAD.
+    ///  Deployed with CREATE2, so our address is known ahead of time via predictStrategyConvexAddress.
+    /// @param _config Our new strategy's full configuration.
+    /// @return newStrategy Address of our new cloned strategy.
+    function cloneStrategyConvexWithConfig(
+        InitConfig calldata _config
+    ) external returns (address newStrategy) {
+        (, , , address _rewardsContract, , ) = IConvexDeposit(_config.booster)
+            .poolInfo(_config.pid);
+        newStrategy = _clone(
+            abi.encode(_config.booster, _rewardsContract, _config.pid),
+            _cloneSalt(msg.sender, _config.vault)
+        );
+        StrategyConvexFactoryClonable(newStrategy).initializeWithConfig(
+            _config
+        );
+
+        emit Cloned(newStrategy);
+    }
+
+    /// @notice Predict the address of a clone from cloneStrategyConvexWithConfig.
+    /// @dev Clones are deployed with CREATE2, salted by their deployer and vault. Our pool must
+    ///  already exist on our booster, since its rewards contract is part of the clone's code.
+    /// @param _deployer Address that will call cloneStrategyConvexWithConfig.
+    /// @param _vault Vault address we are targeting with this strategy.
+    /// @param _booster Address of the convex booster/deposit contract.
+    /// @param _pid Our pool id (pid) for this strategy.
+    /// @return Address our new cloned strategy will be deployed to.
+    function predictStrategyConvexAddress(
+        address _deployer,
+        address _vault,
+        address _booster,
+        uint256 _pid
+    ) external view returns (address) {
+        (, , , address _rewardsContract, , ) = IConvexDeposit(_booster)
+            .poolInfo(_pid);
+        return
+            _predictClone(
+                _deployer,
+                _vault,
+                abi.encode(_booster, _rewardsContract, _pid)
+            );
+    }
+
+    /// @notice Initialize the strategy along with its health check, base fee oracle, voters and keeps.
+    /// @dev This should only be called by the clone function above.
+    /// @param _config Our strategy's full configuration.
+    function initializeWithConfig(InitConfig calldata _config) external {
+        _initialize(
+            _config.vault,
+            _config.strategist,
+            _config.rewards,
+            _config.keeper
+        );
+        _initializeStrat(
+            _config.tradeFactory,
+            _config.pid,
+            _config.harvestProfitMinInUsdc,
+            _config.harvestProfitMaxInUsdc,
+            _config.booster,
+            _config.convexToken
+        );
+
+        healthCheck = _config.healthCheck;
+        baseFeeOracle = _config.baseFeeOracle;
+        if (_config.priceOracle != address(0)) {
+            priceOracle = IOracle(_config.priceOracle);
+        }
+        curveVoter = _config.curveVoter;
+        convexVoter = _config.convexVoter;
+        _setLocalKeepCrvs(_config.keepCRV, _config.keepCVX);
+    }
+
+    // this is called by our original strategy, as well as any clones
     function _initializeStrat(
         address _tradeFactory,
         uint256 _pid,
@@ -274,18 +362,24 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         address _convexToken
     ) internal {
         // make sure that we haven't initialized this before
-        if (depositContract != address(0)) {
+        if (storedDepositContract != address(0)) {
             revert(); // already initialized.
         }
 
         // 1:1 assignments
         tradeFactory = _tradeFactory;
-        pid = _pid;
+        priceOracle = IOracle(YEARN_ORACLE);
         harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
-        depositContract = _booster;
         convexToken = IERC20(_convexToken);
 
+        // clones with immutable args already have these in their code
+        bool hasImmutableArgs = _hasImmutableArgs();
+        if (!hasImmutableArgs) {
+            storedPid = _pid;
+            storedDepositContract = _booster;
+        }
+
         // want = Curve LP
         want.approve(address(_booster), type(uint256).max);
 
@@ -298,13 +392,15 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         (address lptoken, , , address _rewardsContract, , ) = booster.poolInfo(
             _pid
         );
-        rewardsContract = IConvexRewards(_rewardsContract);
+        if (!hasImmutableArgs) {
+            storedRewardsContract = IConvexRewards(_rewardsContract);
+        }
         if (address(lptoken) != address(want)) {
             revert();
         }
 
         // set up rewards and trade factory
-        _updateRewards();
+        _updateRewards(IConvexRewards(_rewardsContract));
         _setUpTradeFactory();
 
         // set our strategy's name
@@ -323,9 +419,36 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         return stratName;
     }
 
+    /// @notice This is the deposit contract that all Convex pools use, aka booster.
+    function depositContract() public view returns (address) {
+        address arg = address(uint160(_getImmutableArg(0)));
+        if (arg != address(0)) {
+            return arg;
+        }
+        return storedDepositContract;
+    }
+
+    /// @notice This is unique to each pool and holds the rewards.
+    function rewardsContract() public view returns (IConvexRewards) {
+        address arg = address(uint160(_getImmutableArg(1)));
+        if (arg != address(0)) {
+            return IConvexRewards(arg);
+        }
+        return storedRewardsContract;
+    }
+
+    /// @notice This is a unique numerical identifier for each Convex pool.
+    function pid() public view returns (uint256) {
+        uint256 arg = _getImmutableArg(2);
+        if (arg != 0) {
+            return arg;
+        }
+        return storedPid;
+    }
+
     /// @notice Balance of want staked in Convex.
     function stakedBalance() public view returns (uint256) {
-        return rewardsContract.balanceOf(address(this));
+        return rewardsContract().balanceOf(address(this));
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -336,7 +459,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
 
     /// @notice Balance of CRV we can claim from the staking contract.
     function claimableBalance() public view returns (uint256) {
-        return rewardsContract.earned(address(this));
+        return rewardsContract().earned(address(this));
     }
 
     /// @notice Total assets the strategy holds, sum of loose and staked want.
@@ -355,7 +478,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     {
         // this claims our CRV, CVX, and any extra tokens like SNX or ANKR. no harm leaving this true even if no extra rewards currently
         // rewards will be converted later with mev protection by yswaps (tradeFactory)
-        rewardsContract.getReward(address(this), true);
+        rewardsContract().getReward(address(this), true);
 
         // by default this is zero, but if we want any for our voter this will be used
         uint256 _localKeepCRV = localKeepCRV;
@@ -432,7 +555,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         // deposit into convex and stake immediately but only if we have something to invest
         // the final true argument means we deposit + stake at the same time
         if (_toInvest > 0) {
-            IConvexDeposit(depositContract).deposit(pid, _toInvest, true);
+            IConvexDeposit(depositContract()).deposit(pid(), _toInvest, true);
         }
     }
 
@@ -442,14 +565,16 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         // check our loose want
         uint256 _wantBal = balanceOfWant();
         if (_amountNeeded > _wantBal) {
-            uint256 _stakedBal = stakedBalance();
+            // read our rewards contract once, since clones may read it from code
+            IConvexRewards _rewardsContract = rewardsContract();
+            uint256 _stakedBal = _rewardsContract.balanceOf(address(this));
             if (_stakedBal > 0) {
                 uint256 _neededFromStaked;
                 unchecked {
                     _neededFromStaked = _amountNeeded - _wantBal;
                 }
                 // withdraw whatever extra funds we need
-                rewardsContract.withdrawAndUnwrap(
+                _rewardsContract.withdrawAndUnwrap(
                     Math.min(_stakedBal, _neededFromStaked),
                     claimRewards
                 );
@@ -467,20 +592,22 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
 
     // fire sale, get rid of it all!
     function liquidateAllPositions() internal override returns (uint256) {
-        uint256 _stakedBal = stakedBalance();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 _stakedBal = _rewardsContract.balanceOf(address(this));
         if (_stakedBal > 0) {
             // don't bother withdrawing zero, save gas where we can
-            rewardsContract.withdrawAndUnwrap(_stakedBal, claimRewards);
+            _rewardsContract.withdrawAndUnwrap(_stakedBal, claimRewards);
         }
         return balanceOfWant();
     }
 
     // migrate our want token to a new strategy if needed, claim rewards tokens as well unless it's an emergency
     function prepareMigration(address _newStrategy) internal override {
-        uint256 stakedBal = stakedBalance();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 stakedBal = _rewardsContract.balanceOf(address(this));
 
         if (stakedBal > 0) {
-            rewardsContract.withdrawAndUnwrap(stakedBal, claimRewards);
+            _rewardsContract.withdrawAndUnwrap(stakedBal, claimRewards);
         }
 
         uint256 crvBal = crv.balanceOf(address(this));
@@ -507,9 +634,10 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     /// @dev Make sure to check claimRewards before this step if needed, and
     ///  plan to have gov sweep convex deposit tokens from strategy after this.
     function withdrawToConvexDepositTokens() external onlyVaultManagers {
-        uint256 _stakedBal = stakedBalance();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 _stakedBal = _rewardsContract.balanceOf(address(this));
         if (_stakedBal > 0) {
-            rewardsContract.withdraw(_stakedBal, claimRewards);
+            _rewardsContract.withdraw(_stakedBal, claimRewards);
         }
     }
 
@@ -521,21 +649,22 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     function updateRewards() external onlyGovernance {
         address tf = tradeFactory;
         _removeTradeFactoryPermissions(true);
-        _updateRewards();
+        _updateRewards(rewardsContract());
 
         tradeFactory = tf;
         _setUpTradeFactory();
     }
 
-    function _updateRewards() internal {
+    // our rewards contract is passed in, since our constructor can't read it from our getter
+    function _updateRewards(IConvexRewards _rewardsContract) internal {
         // empty the rewardsTokens and rebuild
         delete rewardsTokens;
 
         // convex provides us info on any extra tokens we may receive
-        uint256 length = rewardsContract.extraRewardsLength();
+        uint256 length = _rewardsContract.extraRewardsLength();
         address _convexToken = address(convexToken);
         for (uint256 i; i < length; ++i) {
-            address virtualRewardsPool = rewardsContract.extraRewards(i);
+            address virtualRewardsPool = _rewardsContract.extraRewards(i);
             address _rewardsToken = IConvexRewards(virtualRewardsPool)
                 .rewardToken();
 
@@ -688,14 +817,13 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     }
 
     /// @notice Calculates the profit if all claimable assets were sold for USDC (6 decimals).
-    /// @dev Uses yearn's lens oracle, if returned values are strange then troubleshoot there.
+    /// @dev Uses our priceOracle, yearn's lens oracle by default. If returned values are strange
+    ///  then troubleshoot there.
     /// @return Total return in USDC from selling claimable CRV and CVX.
     function claimableProfitInUsdc() public view returns (uint256) {
-        IOracle yearnOracle = IOracle(
-            0x83d95e0D5f402511dB06817Aff3f9eA88224B030
-        ); // yearn lens oracle
-        uint256 crvPrice = yearnOracle.getPriceUsdcRecommended(address(crv));
-        uint256 convexTokenPrice = yearnOracle.getPriceUsdcRecommended(
+        IOracle oracle = priceOracle;
+        uint256 crvPrice = oracle.getPriceUsdcRecommended(address(crv));
+        uint256 convexTokenPrice = oracle.getPriceUsdcRecommended(
             address(convexToken)
         );
 
@@ -756,7 +884,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     /// @return needsEarmark Whether or not rewards need to be earmarked before flowing again.
     function needsEarmarkReward() public view returns (bool needsEarmark) {
         // check if there is any CRV we need to earmark
-        uint256 crvExpiry = rewardsContract.periodFinish();
+        uint256 crvExpiry = rewardsContract().periodFinish();
         if (crvExpiry < block.timestamp) {
             return true;
         }
@@ -773,6 +901,11 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         uint256 _keepCrv,
         uint256 _keepCvx
     ) external onlyGovernance {
+        _setLocalKeepCrvs(_keepCrv, _keepCvx);
+    }
+
+    // checks our keeps against our voters before setting them
+    function _setLocalKeepCrvs(uint256 _keepCrv, uint256 _keepCvx) internal {
         if (_keepCrv > 10_000 || _keepCvx > 10_000) {
             revert();
         }
@@ -828,4 +961,11 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
         checkEarmark = _checkEarmark;
     }
+
+    /// @notice Set the oracle we use to price our claimable rewards.
+    /// @dev Must be called by governance or management.
+    /// @param _priceOracle Address of our new price oracle.
+    function setPriceOracle(address _priceOracle) external onlyVaultManagers {
+        priceOracle = IOracle(_priceOracle);
+    }
 }
@@ -6,6 +6,7 @@ pragma experimental ABIEncoderV2;
 import "@openzeppelin/contracts/utils/math/Math.sol";
 import "./interfaces/curve.sol";
 import "@yearnvaults/contracts/BaseStrategy.sol";
+import "./ClonableWithImmutableArgs.sol";
 
 interface ITradeFactory {
     function enable(address, address) external;
@@ -75,18 +76,50 @@ interface IConvexFrax {
     function withdrawLockedAndUnwrap(bytes32 _kek_id) external;
 }
 
-contract StrategyConvexFraxFactoryClonable is BaseStrategy {
+contract StrategyConvexFraxFactoryClonable is
+    BaseStrategy,
+    ClonableWithImmutableArgs
+{
     using SafeERC20 for IERC20;
-    /* ========== STATE VARIABLES ========== */
 
-    /// @notice This is the Frax Booster.
-    address public fraxBooster;
+    /* ========== STRUCTS ========== */
+
+    /// @notice Everything needed to fully set up a new Convex Frax strategy in one call.
+    struct InitConfig {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address tradeFactory;
+        uint256 fraxPid;
+        address stakingAddress;
+        uint256 harvestProfitMinInUsdc;
+        uint256 harvestProfitMaxInUsdc;
+        address booster;
+        address healthCheck;
+        address baseFeeOracle;
+        address curveVoter;
+        address convexVoter;
+        address fraxVoter;
+        uint256 keepCRV;
+        uint256 keepCVX;
+        uint256 keepFXS;
+        address priceOracle;
+    }
 
-    /// @notice This is the staking address specific to this Convex pool.
-    IConvexFrax public stakingAddress;
+    /// @notice Our own record of a kek, so we don't need to copy Frax's full stake history.
+    struct Kek {
+        bytes32 kekId;
+        uint128 amount;
+        uint64 endingTimestamp;
+    }
 
-    /// @notice This is a unique numerical identifier for each Convex Frax pool.
-    uint256 public fraxPid;
+    /* ========== STATE VARIABLES ========== */
+
+    // our frax booster, staking address and frax pid. clones with immutable args keep these in their code instead, see views
+    address internal storedFraxBooster;
+    IConvexFrax internal storedStakingAddress;
+    uint256 internal storedFraxPid;
 
     /// @notice This is the vault our strategy uses to stake on Frax and use Convex's boost.
     IConvexFrax public userVault;
@@ -132,6 +165,15 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     /// @dev Only used in harvestTrigger.
     uint256 public harvestProfitMaxInUsdc;
 
+    /// @notice Oracle we use to price our claimable rewards in USDC.
+    /// @dev Only used in harvestTrigger. Defaults to yearn's lens oracle, but may be a shared
+    ///  PriceCache in front of it.
+    IOracle public priceOracle;
+
+    // yearn lens oracle, our default priceOracle
+    address internal constant YEARN_ORACLE =
+        0x83d95e0D5f402511dB06817Aff3f9eA88224B030;
+
     // ySwaps stuff
     /// @notice The address of our ySwaps trade factory.
     address public tradeFactory;
@@ -164,12 +206,19 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     /// @notice This is the max number of keks we will allow the strategy to have
     ///  open at one time to limit withdraw loops.
     /// @dev A new kek (position) is created each time we stake the LP token. A whole
-    ///  kek must be withdrawn during any withdrawals.
+    ///  kek must be withdrawn during any withdrawals. Can't be more than KEK_RING_SIZE.
     uint256 public maxKeks;
 
     /// @notice The index of the next kek to be deposited to for deposit/withdrawal tracking.
     uint256 public nextKek;
 
+    /// @notice The most keks we keep records for, and our upper limit for maxKeks.
+    uint256 public constant KEK_RING_SIZE = 32;
+
+    // our most recent keks, by kek index modulo KEK_RING_SIZE. only the last maxKeks can hold funds.
+    //  slots are reused as we go, so gas stays flat no matter how many keks we've ever created.
+    Kek[KEK_RING_SIZE] internal kekRing;
+
     /* ========== CONSTRUCTOR ========== */
 
     constructor(
@@ -219,27 +268,7 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         uint256 _harvestProfitMaxInUsdc,
         address _booster
     ) external returns (address newStrategy) {
-        // don't clone a clone
-        if (!isOriginal) {
-            revert();
-        }
-
-        // Copied from https://github.com/optionality/clone-factory/blob/master/contracts/CloneFactory.sol
-        bytes20 addressBytes = bytes20(address(this));
-        assembly {
-            // EIP-1167 bytecode
-            let clone_code := mload(0x40)
-            mstore(
-                clone_code,
-                0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000
-            )
-            mstore(add(clone_code, 0x14), addressBytes)
-            mstore(
-                add(clone_code, 0x28),
-                0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000
-            )
-            newStrategy := create(0, clone_code, 0x37)
-        }
+        newStrategy = _clone("", 0);
 
         StrategyConvexFraxFactoryClonable(newStrategy).initialize(
             _vault,
@@ -292,6 +321,84 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         );
     }
 
+    /// @notice Clone this strategy on another vault, fully configured in a single call.
+    /// @dev In practice, this will only be called by the factory on the template contract.
+    ///  Health check, base fee oracle, voters and keeps are all set during initialization. Our frax booster,
+    ///  staking address and frax pid are appended to the clone's code, so reading them never costs an SLOAD.
+    ///  Deployed with CREATE2, so our address is known ahead of time via predictStrategyConvexFraxAddress.
+    /// @param _config Our new strategy's full configuration.
+    /// @return newStrategy Address of our new cloned strategy.
+    function cloneStrategyConvexFraxWithConfig(
+        InitConfig calldata _config
+    ) external returns (address newStrategy) {
+        newStrategy = _clone(
+            abi.encode(
+                _config.booster,
+                _config.stakingAddress,
+                _config.fraxPid
+            ),
+            _cloneSalt(msg.sender, _config.vault)
+        );
+        StrategyConvexFraxFactoryClonable(newStrategy).initializeWithConfig(
+            _config
+        );
+
+        emit Cloned(newStrategy);
+    }
+
+    /// @notice Predict the address of a clone from cloneStrategyConvexFraxWithConfig.
+    /// @dev Clones are deployed with CREATE2, salted by their deployer and vault.
+    /// @param _deployer Address that will call cloneStrategyConvexFraxWithConfig.
+    /// @param _vault Vault address we are targeting with this strategy.
+    /// @param _fraxBooster Address of the convex frax booster/deposit contract.
+    /// @param _stakingAddress Our frax staking address.
+    /// @param _fraxPid Our frax pool id (pid) for this strategy.
+    /// @return Address our new cloned strategy will be deployed to.
+    function predictStrategyConvexFraxAddress(
+        address _deployer,
+        address _vault,
+        address _fraxBooster,
+        address _stakingAddress,
+        uint256 _fraxPid
+    ) external view returns (address) {
+        return
+            _predictClone(
+                _deployer,
+                _vault,
+                abi.encode(_fraxBooster, _stakingAddress, _fraxPid)
+            );
+    }
+
+    /// @notice Initialize the strategy along with its health check, base fee oracle, voters and keeps.
+    /// @dev This should only be called by the clone function above.
+    /// @param _config Our strategy's full configuration.
+    function initializeWithConfig(InitConfig calldata _config) external {
+        _initialize(
+            _config.vault,
+            _config.strategist,
+            _config.rewards,
+            _config.keeper
+        );
+        _initializeStrat(
+            _config.tradeFactory,
+            _config.fraxPid,
+            _config.stakingAddress,
+            _config.harvestProfitMinInUsdc,
+            _config.harvestProfitMaxInUsdc,
+            _config.booster
+        );
+
+        healthCheck = _config.healthCheck;
+        baseFeeOracle = _config.baseFeeOracle;
+        if (_config.priceOracle != address(0)) {
+            priceOracle = IOracle(_config.priceOracle);
+        }
+        curveVoter = _config.curveVoter;
+        convexVoter = _config.convexVoter;
+        fraxVoter = _config.fraxVoter;
+        _setLocalKeepCrvs(_config.keepCRV, _config.keepCVX, _config.keepFXS);
+    }
+
     // this is called by our original strategy, as well as any clones
     function _initializeStrat(
         address _tradeFactory,
@@ -302,17 +409,22 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         address _booster
     ) internal {
         // make sure that we haven't initialized this before
-        if (fraxBooster != address(0)) {
+        if (storedFraxBooster != address(0)) {
             revert(); // already initialized.
         }
 
         // 1:1 assignments
         tradeFactory = _tradeFactory;
-        fraxPid = _fraxPid;
-        stakingAddress = IConvexFrax(_stakingAddress);
+        priceOracle = IOracle(YEARN_ORACLE);
         harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
-        fraxBooster = _booster;
+
+        // clones with immutable args already have these in their code
+        if (!_hasImmutableArgs()) {
+            storedFraxPid = _fraxPid;
+            storedStakingAddress = IConvexFrax(_stakingAddress);
+            storedFraxBooster = _booster;
+        }
 
         // have our strategy deploy our vault from the booster using the fraxPid
         userVault = IConvexFrax(IConvexFrax(_booster).createVault(_fraxPid));
@@ -330,7 +442,7 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
         // setup our default frax LP management vars
         maxKeks = 5;
-        lockTime = stakingAddress.lock_time_min(); // default to current minimum
+        lockTime = IConvexFrax(_stakingAddress).lock_time_min(); // default to current minimum
         maxSingleDeposit = 500_000e18;
         minDeposit = 10_000e18;
 
@@ -354,10 +466,37 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         return stratName;
     }
 
+    /// @notice This is the Frax Booster.
+    function fraxBooster() public view returns (address) {
+        address arg = address(uint160(_getImmutableArg(0)));
+        if (arg != address(0)) {
+            return arg;
+        }
+        return storedFraxBooster;
+    }
+
+    /// @notice This is the staking address specific to this Convex pool.
+    function stakingAddress() public view returns (IConvexFrax) {
+        address arg = address(uint160(_getImmutableArg(1)));
+        if (arg != address(0)) {
+            return IConvexFrax(arg);
+        }
+        return storedStakingAddress;
+    }
+
+    /// @notice This is a unique numerical identifier for each Convex Frax pool.
+    function fraxPid() public view returns (uint256) {
+        uint256 arg = _getImmutableArg(2);
+        if (arg != 0) {
+            return arg;
+        }
+        return storedFraxPid;
+    }
+
     /// @notice Balance of want staked in Convex Frax.
     function stakedBalance() public view returns (uint256) {
         // how much want we have staked in Convex-Frax
-        return stakingAddress.lockedLiquidityOf(address(userVault));
+        return stakingAddress().lockedLiquidityOf(address(userVault));
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -469,24 +608,33 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
         // If we have already locked the max amount of keks, we need
         // to withdraw the oldest one and reinvest that alongside the new funds
-        if (nextKek >= maxKeks) {
+        uint256 _nextKek = nextKek;
+        uint256 _maxKeks = maxKeks;
+        if (_nextKek >= _maxKeks) {
             // Get the oldest kek that could have funds in it
-            IConvexFrax.LockedStake memory stake = stakingAddress
-                .lockedStakesOf(address(userVault))[nextKek - maxKeks];
+            Kek storage oldest = kekRing[(_nextKek - _maxKeks) % KEK_RING_SIZE];
+            uint256 amount = oldest.amount;
             // Make sure it hasn't already been withdrawn
-            if (stake.amount > 0) {
+            if (amount > 0) {
                 // Withdraw funds and add them to the amount to deposit
-                userVault.withdrawLockedAndUnwrap(stake.kek_id);
+                userVault.withdrawLockedAndUnwrap(oldest.kekId);
+                oldest.amount = 0;
                 unchecked {
-                    _toInvest += stake.amount;
+                    _toInvest += amount;
                 }
             }
         }
 
-        userVault.stakeLockedCurveLp(_toInvest, lockTime);
+        uint256 _lockTime = lockTime;
+        bytes32 kekId = userVault.stakeLockedCurveLp(_toInvest, _lockTime);
+        kekRing[_nextKek % KEK_RING_SIZE] = Kek(
+            kekId,
+            uint128(_toInvest),
+            uint64(block.timestamp + _lockTime)
+        );
         lastDeposit = block.timestamp;
         lastDepositAmount = _toInvest;
-        nextKek++;
+        nextKek = _nextKek + 1;
     }
 
     function liquidatePosition(
@@ -525,20 +673,18 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
     // this function manages withdrawing from multiple keks at once
     function withdrawSome(uint256 _amount) internal {
-        IConvexFrax.LockedStake[] memory stakes = stakingAddress.lockedStakesOf(
-            address(userVault)
-        );
-
-        uint256 i = nextKek > maxKeks ? nextKek - maxKeks : 0;
+        uint256 _nextKek = nextKek;
+        uint256 _maxKeks = maxKeks;
+        uint256 i = _nextKek > _maxKeks ? _nextKek - _maxKeks : 0;
         uint256 needed = Math.min(_amount, stakedBalance());
-        IConvexFrax.LockedStake memory stake;
         uint256 liquidity;
-        while (needed > 0 && i < nextKek) {
-            stake = stakes[i];
-            liquidity = stake.amount;
+        while (needed > 0 && i < _nextKek) {
+            Kek storage kek = kekRing[i % KEK_RING_SIZE];
+            liquidity = kek.amount;
 
-            if (liquidity > 0 && stake.ending_timestamp <= block.timestamp) {
-                userVault.withdrawLockedAndUnwrap(stake.kek_id);
+            if (liquidity > 0 && kek.endingTimestamp <= block.timestamp) {
+                userVault.withdrawLockedAndUnwrap(kek.kekId);
+                kek.amount = 0;
 
                 if (liquidity < needed) {
                     unchecked {
@@ -788,6 +934,7 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     }
 
     /// @notice Calculates the profit if all claimable assets were sold for USDC (6 decimals).
+    /// @dev Uses our priceOracle, yearn's lens oracle by default.
     /// @return Total return in USDC from selling claimable CRV, CVX, and FXS.
     function claimableProfitInUsdc() public view returns (uint256) {
         (, uint256[] memory tokenAmounts) = userVault.earned();
@@ -797,14 +944,12 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         uint256 claimableCvx = tokenAmounts[rewardLength - 1];
         uint256 claimableCrv = tokenAmounts[rewardLength - 2];
 
-        IOracle yearnOracle = IOracle(
-            0x83d95e0D5f402511dB06817Aff3f9eA88224B030
-        ); // yearn lens oracle
-        uint256 crvPrice = yearnOracle.getPriceUsdcRecommended(address(crv));
-        uint256 cvxPrice = yearnOracle.getPriceUsdcRecommended(
+        IOracle oracle = priceOracle;
+        uint256 crvPrice = oracle.getPriceUsdcRecommended(address(crv));
+        uint256 cvxPrice = oracle.getPriceUsdcRecommended(
             address(convexToken)
         );
-        uint256 fxsPrice = yearnOracle.getPriceUsdcRecommended(address(fxs));
+        uint256 fxsPrice = oracle.getPriceUsdcRecommended(address(fxs));
 
         return
             (crvPrice *
@@ -828,35 +973,55 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     /// @notice Check how much want we have locked (not just deposited) in the staking contract.
     /// @return stillLocked The total amount of want that cannot yet be withdrawn from the staking contract.
     function stillLockedStake() public view returns (uint256 stillLocked) {
-        IConvexFrax.LockedStake[] memory stakes = stakingAddress.lockedStakesOf(
-            address(userVault)
-        );
-
-        IConvexFrax.LockedStake memory stake;
+        Kek memory kek;
         uint256 time = block.timestamp;
         uint256 _nextKek = nextKek;
         uint256 _maxKeks = maxKeks;
         uint256 i = _nextKek > _maxKeks ? _nextKek - _maxKeks : 0;
 
         for (i; i < _nextKek; ++i) {
-            stake = stakes[i];
+            kek = kekRing[i % KEK_RING_SIZE];
 
-            if (stake.ending_timestamp > time) {
+            if (kek.endingTimestamp > time) {
                 unchecked {
-                    stillLocked += stake.amount;
+                    stillLocked += kek.amount;
                 }
             }
         }
     }
 
+    /// @notice View our record of one of our most recent keks.
+    /// @dev Only our last KEK_RING_SIZE keks are kept, older indexes revert.
+    /// @param _index Index of the kek to view.
+    /// @return Our kek's id, remaining amount and ending timestamp.
+    function kekInfo(uint256 _index) external view returns (Kek memory) {
+        require(_isInKekRing(_index), "!ring");
+        return kekRing[_index % KEK_RING_SIZE];
+    }
+
+    // older keks have had their slot reused by a newer one
+    function _isInKekRing(uint256 _index) internal view returns (bool) {
+        uint256 _nextKek = nextKek;
+        return _index < _nextKek && _index + KEK_RING_SIZE >= _nextKek;
+    }
+
     /// @notice This function allows manual withdrawal of a specific kek.
-    /// @dev Available if the counter or loops fail.
+    /// @dev Available if the counter or loops fail. Keks older than our ring are looked up
+    ///  from Frax's full stake history instead.
     /// @param index Index of the kek to withdraw.
     //Pass the index of the kek to withdraw as the param
     function manualWithdraw(uint256 index) external onlyVaultManagers {
-        userVault.withdrawLockedAndUnwrap(
-            stakingAddress.lockedStakesOf(address(userVault))[index].kek_id
-        );
+        if (_isInKekRing(index)) {
+            Kek storage kek = kekRing[index % KEK_RING_SIZE];
+            userVault.withdrawLockedAndUnwrap(kek.kekId);
+            kek.amount = 0;
+        } else {
+            userVault.withdrawLockedAndUnwrap(
+                stakingAddress()
+                    .lockedStakesOf(address(userVault))[index]
+                    .kek_id
+            );
+        }
     }
 
     /* ========== SETTERS ========== */
@@ -868,6 +1033,7 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     /// @param _newMaxKeks New number of maxKeks.
     function setMaxKeks(uint256 _newMaxKeks) external onlyVaultManagers {
         require(_newMaxKeks > 0, "Must be >0");
+        require(_newMaxKeks <= KEK_RING_SIZE, "Must be <=ring");
 
         uint256 _maxKeks = maxKeks;
         uint256 _nextKek = nextKek;
@@ -880,23 +1046,20 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
                 uint256 toWithdraw = _nextKek > _maxKeks
                     ? _maxKeks - _newMaxKeks
                     : nextKek - _newMaxKeks;
-                IConvexFrax.LockedStake[] memory stakes = stakingAddress
-                    .lockedStakesOf(address(userVault));
-                IConvexFrax.LockedStake memory stake;
-
                 for (uint256 i; i < toWithdraw; ++i) {
                     // withdraw our oldest keks to lower the number staked.
-                    stake = _maxKeks > _nextKek
-                        ? stakes[i]
-                        : stakes[_nextKek - _maxKeks + i];
+                    Kek storage kek = _maxKeks > _nextKek
+                        ? kekRing[i]
+                        : kekRing[(_nextKek - _maxKeks + i) % KEK_RING_SIZE];
 
                     // Need to make sure the kek can be withdrawn and is > 0
-                    if (stake.amount > 0) {
+                    if (kek.amount > 0) {
                         require(
-                            stake.ending_timestamp < block.timestamp,
+                            kek.endingTimestamp < block.timestamp,
                             "Not liquid"
                         );
-                        userVault.withdrawLockedAndUnwrap(stake.kek_id);
+                        userVault.withdrawLockedAndUnwrap(kek.kekId);
+                        kek.amount = 0;
                     }
                 }
             }
@@ -926,9 +1089,10 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     ///  before a harvest, otherwise timestamp checks when withdrawing could be inaccurate.
     /// @param _lockTime Time to lock our LP (in seconds). By default bound to 1 week < t < 1 year.
     function setLockTime(uint256 _lockTime) external onlyVaultManagers {
+        IConvexFrax _stakingAddress = stakingAddress();
         require(
-            stakingAddress.lock_time_min() <= _lockTime &&
-                _lockTime <= stakingAddress.lock_time_for_max_multiplier(),
+            _stakingAddress.lock_time_min() <= _lockTime &&
+                _lockTime <= _stakingAddress.lock_time_for_max_multiplier(),
             "Disallowed by staking address"
         );
         lockTime = _lockTime;
@@ -944,6 +1108,15 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         uint256 _keepCvx,
         uint256 _keepFxs
     ) external onlyGovernance {
+        _setLocalKeepCrvs(_keepCrv, _keepCvx, _keepFxs);
+    }
+
+    // checks our keeps against our voters before setting them
+    function _setLocalKeepCrvs(
+        uint256 _keepCrv,
+        uint256 _keepCvx,
+        uint256 _keepFxs
+    ) internal {
         if (_keepCrv > 10_000 || _keepCvx > 10_000 || _keepFxs > 10_000) {
             revert();
         }
@@ -996,4 +1169,11 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
     }
+
+    /// @notice Set the oracle we use to price our claimable rewards.
+    /// @dev Must be called by governance or management.
+    /// @param _priceOracle Address of our new price oracle.
+    function setPriceOracle(address _priceOracle) external onlyVaultManagers {
+        priceOracle = IOracle(_priceOracle);
+    }
 }
@@ -7,6 +7,7 @@ import "@openzeppelin/contracts/utils/math/Math.sol";
 import "./interfaces/yearn.sol";
 import "./interfaces/curve.sol";
 import "@yearnvaults/contracts/BaseStrategy.sol";
+import "./ClonableWithImmutableArgs.sol";
 
 interface ITradeFactory {
     function enable(address, address) external;
@@ -21,15 +22,34 @@ interface IDetails {
     function symbol() external view returns (string memory);
 }
 
-contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
+contract StrategyCurveBoostedFactoryClonable is
+    BaseStrategy,
+    ClonableWithImmutableArgs
+{
     using SafeERC20 for IERC20;
-    /* ========== STATE VARIABLES ========== */
 
-    /// @notice Yearn's strategyProxy, needed for interacting with our Curve Voter.
-    ICurveStrategyProxy public proxy;
+    /* ========== STRUCTS ========== */
+
+    /// @notice Everything needed to fully set up a new Curve boosted strategy in one call.
+    struct InitConfig {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address tradeFactory;
+        address proxy;
+        address gauge;
+        address healthCheck;
+        address baseFeeOracle;
+        address curveVoter;
+        uint256 keepCRV;
+    }
 
-    /// @notice Curve gauge contract, most are tokenized, held by Yearn's voter.
-    address public gauge;
+    /* ========== STATE VARIABLES ========== */
+
+    // our strategy proxy and gauge. clones with immutable args keep these in their code instead, see views
+    ICurveStrategyProxy internal storedProxy;
+    address internal storedGauge;
 
     /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
     uint256 public localKeepCRV;
@@ -91,27 +111,7 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         address _proxy,
         address _gauge
     ) external returns (address newStrategy) {
-        // don't clone a clone
-        if (!isOriginal) {
-            revert();
-        }
-
-        // Copied from https://github.com/optionality/clone-factory/blob/master/contracts/CloneFactory.sol
-        bytes20 addressBytes = bytes20(address(this));
-        assembly {
-            // EIP-1167 bytecode
-            let clone_code := mload(0x40)
-            mstore(
-                clone_code,
-                0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000
-            )
-            mstore(add(clone_code, 0x14), addressBytes)
-            mstore(
-                add(clone_code, 0x28),
-                0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000
-            )
-            newStrategy := create(0, clone_code, 0x37)
-        }
+        newStrategy = _clone("", 0);
 
         StrategyCurveBoostedFactoryClonable(newStrategy).initialize(
             _vault,
@@ -148,6 +148,61 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         _initializeStrat(_tradeFactory, _proxy, _gauge);
     }
 
+    /// @notice Clone this strategy on another vault, fully configured in a single call.
+    /// @dev In practice, this will only be called by the factory on the template contract.
+    ///  Health check, base fee oracle, voter and keep are all set during initialization. Our proxy
+    ///  and gauge are appended to the clone's code, so reading them never costs an SLOAD.
+    ///  Deployed with CREATE2, so our address is known ahead of time via predictStrategyCurveBoostedAddress.
+    /// @param _config Our new strategy's full configuration.
+    /// @return newStrategy Address of our new cloned strategy.
+    function cloneStrategyCurveBoostedWithConfig(
+        InitConfig calldata _config
+    ) external returns (address newStrategy) {
+        newStrategy = _clone(
+            abi.encode(_config.proxy, _config.gauge),
+            _cloneSalt(msg.sender, _config.vault)
+        );
+        StrategyCurveBoostedFactoryClonable(newStrategy).initializeWithConfig(
+            _config
+        );
+
+        emit Cloned(newStrategy);
+    }
+
+    /// @notice Predict the address of a clone from cloneStrategyCurveBoostedWithConfig.
+    /// @dev Clones are deployed with CREATE2, salted by their deployer and vault.
+    /// @param _deployer Address that will call cloneStrategyCurveBoostedWithConfig.
+    /// @param _vault Vault address we are targeting with this strategy.
+    /// @param _proxy Our strategy proxy address.
+    /// @param _gauge Gauge address for this strategy.
+    /// @return Address our new cloned strategy will be deployed to.
+    function predictStrategyCurveBoostedAddress(
+        address _deployer,
+        address _vault,
+        address _proxy,
+        address _gauge
+    ) external view returns (address) {
+        return _predictClone(_deployer, _vault, abi.encode(_proxy, _gauge));
+    }
+
+    /// @notice Initialize the strategy along with its health check, base fee oracle, voter and keep.
+    /// @dev This should only be called by the clone function above.
+    /// @param _config Our strategy's full configuration.
+    function initializeWithConfig(InitConfig calldata _config) external {
+        _initialize(
+            _config.vault,
+            _config.strategist,
+            _config.rewards,
+            _config.keeper
+        );
+        _initializeStrat(_config.tradeFactory, _config.proxy, _config.gauge);
+
+        healthCheck = _config.healthCheck;
+        baseFeeOracle = _config.baseFeeOracle;
+        curveVoter = _config.curveVoter;
+        _setLocalKeepCrv(_config.keepCRV);
+    }
+
     // this is called by our original strategy, as well as any clones
     function _initializeStrat(
         address _tradeFactory,
@@ -155,14 +210,18 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         address _gauge
     ) internal {
         // make sure that we haven't initialized this before
-        if (gauge != address(0)) {
+        if (storedGauge != address(0)) {
             revert(); // already initialized.
         }
 
         // 1:1 assignments
         tradeFactory = _tradeFactory;
-        proxy = ICurveStrategyProxy(_proxy); // our factory checks the latest proxy from curve voter and passes it here
-        gauge = _gauge;
+
+        // clones with immutable args already have these in their code
+        if (!_hasImmutableArgs()) {
+            storedProxy = ICurveStrategyProxy(_proxy); // our factory checks the latest proxy from curve voter and passes it here
+            storedGauge = _gauge;
+        }
 
         // want = Curve LP
         want.approve(_proxy, type(uint256).max);
@@ -190,9 +249,27 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         return stratName;
     }
 
+    /// @notice Yearn's strategyProxy, needed for interacting with our Curve Voter.
+    function proxy() public view returns (ICurveStrategyProxy) {
+        address arg = address(uint160(_getImmutableArg(0)));
+        if (arg != address(0)) {
+            return ICurveStrategyProxy(arg);
+        }
+        return storedProxy;
+    }
+
+    /// @notice Curve gauge contract, most are tokenized, held by Yearn's voter.
+    function gauge() public view returns (address) {
+        address arg = address(uint160(_getImmutableArg(1)));
+        if (arg != address(0)) {
+            return arg;
+        }
+        return storedGauge;
+    }
+
     /// @notice Balance of want staked in Curve's gauge.
     function stakedBalance() public view returns (uint256) {
-        return proxy.balanceOf(gauge);
+        return proxy().balanceOf(gauge());
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -214,11 +291,15 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         override
         returns (uint256 _profit, uint256 _loss, uint256 _debtPayment)
     {
+        // read our proxy and gauge once, since clones may read them from code
+        ICurveStrategyProxy _proxy = proxy();
+        address _gauge = gauge();
+
         // rewards will be converted later with mev protection by yswaps (tradeFactory)
         // if we have anything in the gauge, then harvest CRV from the gauge
-        uint256 _stakedBal = stakedBalance();
+        uint256 _stakedBal = _proxy.balanceOf(_gauge);
         if (_stakedBal > 0) {
-            proxy.harvest(gauge);
+            _proxy.harvest(_gauge);
 
             // by default this is zero, but if we want any for our voter this will be used
             uint256 _localKeepCRV = localKeepCRV;
@@ -239,7 +320,7 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
 
         // claim any extra rewards we may have
         if (rewardsTokens.length > 0) {
-            proxy.claimManyRewards(gauge, rewardsTokens);
+            _proxy.claimManyRewards(_gauge, rewardsTokens);
         }
 
         // serious loss should never happen, but if it does (for instance, if Curve is hacked), let's record it accurately
@@ -286,8 +367,9 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         // Send all of our LP tokens to the proxy and deposit to the gauge
         uint256 _toInvest = balanceOfWant();
         if (_toInvest > 0) {
-            want.safeTransfer(address(proxy), _toInvest);
-            proxy.deposit(gauge, address(want));
+            ICurveStrategyProxy _proxy = proxy();
+            want.safeTransfer(address(_proxy), _toInvest);
+            _proxy.deposit(gauge(), address(want));
         }
     }
 
@@ -297,15 +379,17 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         // check our loose want
         uint256 _wantBal = balanceOfWant();
         if (_amountNeeded > _wantBal) {
-            uint256 _stakedBal = stakedBalance();
+            ICurveStrategyProxy _proxy = proxy();
+            address _gauge = gauge();
+            uint256 _stakedBal = _proxy.balanceOf(_gauge);
             if (_stakedBal > 0) {
                 uint256 _neededFromStaked;
                 unchecked {
                     _neededFromStaked = _amountNeeded - _wantBal;
                 }
                 // withdraw whatever extra funds we need
-                proxy.withdraw(
-                    gauge,
+                _proxy.withdraw(
+                    _gauge,
                     address(want),
                     Math.min(_stakedBal, _neededFromStaked)
                 );
@@ -323,19 +407,23 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
 
     // fire sale, get rid of it all!
     function liquidateAllPositions() internal override returns (uint256) {
-        uint256 _stakedBal = stakedBalance();
+        ICurveStrategyProxy _proxy = proxy();
+        address _gauge = gauge();
+        uint256 _stakedBal = _proxy.balanceOf(_gauge);
         if (_stakedBal > 0) {
             // don't bother withdrawing zero, save gas where we can
-            proxy.withdraw(gauge, address(want), _stakedBal);
+            _proxy.withdraw(_gauge, address(want), _stakedBal);
         }
         return balanceOfWant();
     }
 
     // migrate our want token to a new strategy if needed, as well as our CRV
     function prepareMigration(address _newStrategy) internal override {
-        uint256 stakedBal = stakedBalance();
+        ICurveStrategyProxy _proxy = proxy();
+        address _gauge = gauge();
+        uint256 stakedBal = _proxy.balanceOf(_gauge);
         if (stakedBal > 0) {
-            proxy.withdraw(gauge, address(want), stakedBal);
+            _proxy.withdraw(_gauge, address(want), stakedBal);
         }
         uint256 crvBal = crv.balanceOf(address(this));
 
@@ -501,6 +589,11 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
     /// @dev Must be less than 10,000. Set in basis points. Only governance can set this.
     /// @param _keepCrv Percent of each CRV harvest to send to our voter.
     function setLocalKeepCrv(uint256 _keepCrv) external onlyGovernance {
+        _setLocalKeepCrv(_keepCrv);
+    }
+
+    // checks our keep against our voter before setting it
+    function _setLocalKeepCrv(uint256 _keepCrv) internal {
         if (_keepCrv > 10_000) {
             revert();
         }
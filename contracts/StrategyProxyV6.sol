@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: AGPL-3.0
 
 pragma solidity ^0.6.12;
+pragma experimental ABIEncoderV2;
 
 import "@openzeppelinLegacy/contracts/token/ERC20/IERC20.sol";
 import "@openzeppelinLegacy/contracts/utils/Address.sol";
@@ -27,6 +28,7 @@ library SafeProxy {
 interface VeCRV {
     function increase_unlock_time(uint256 _time) external;
     function locked__end(address user) external returns (uint);
+    function user_point_epoch(address user) external view returns (uint256);
 }
 
 interface IMetaRegistry {
@@ -37,6 +39,11 @@ interface IGaugeController {
     function gauge_types(address _gauge) external view returns (int128);
 }
 
+interface IGaugeRewards {
+    function reward_tokens(uint256 _index) external view returns (address);
+    function claimable_reward(address _user, address _token) external view returns (uint256);
+}
+
 contract StrategyProxy {
     using SafeERC20 for IERC20;
     using Address for address;
@@ -45,6 +52,21 @@ contract StrategyProxy {
 
     uint256 private constant WEEK = 604800; // Number of seconds in a week
 
+    uint256 private constant FEE_CLAIM_ITERATIONS = 50; // Max weeks plus user epochs covered by a single fee distributor claim
+
+    uint256 private constant MAX_FEE_CLAIMS = 20; // Max claims per call, the size of claim_many's array
+
+    uint256 private constant MAX_GAUGE_REWARDS = 8; // Max reward tokens on a Curve gauge
+
+    struct GaugeSnapshot {
+        address gauge;
+        uint256 balance;
+        address strategy;
+        address[] rewardTokens;
+        uint256[] claimableRewards;
+        bool[] rewardTokensApproved;
+    }
+
     /// @notice Yearn's voter proxy. Typically referred to as "voter".
     IProxy public constant proxy = IProxy(0xF147b8125d2ef93FB6965Db97D6746952a133934);
 
@@ -75,8 +97,26 @@ contract StrategyProxy {
     /// @notice Look up the strategy approved for a given Curve gauge.
     mapping(address => address) public strategies;
 
-    /// @notice Check if a gauge reward token is approved for claiming.
-    mapping(address => bool) public rewardTokenApproved;
+    /// @notice Check if our voter has given a gauge a standing max approval for its LP token.
+    /// @dev Set on a gauge's first deposit, cleared when its strategy is revoked.
+    mapping(address => bool) public gaugeApproved;
+
+    /// @notice Bit assigned to an approved reward token in our approval bitmap, plus one so zero means unapproved.
+    /// @dev Bits are assigned on approval and freed on revocation, so up to 256 tokens may be approved at once.
+    mapping(address => uint256) public rewardTokenBit;
+
+    /// @notice Bitmap of currently approved reward tokens, by each token's bit.
+    uint256 public approvedRewardTokens;
+
+    /// @notice Incremented whenever reward token approvals change.
+    /// @dev Gauge reward token caches synced under an older version are stale.
+    uint256 public rewardTokensVersion;
+
+    // gauge => approved reward tokens as of our last sync, for cachedRewardTokens()
+    mapping(address => address[]) internal gaugeRewardTokens;
+
+    // gauge => hash of our version and its cached tokens, so claimCachedRewards() can check a whole list at once
+    mapping(address => bytes32) internal gaugeRewardTokensHash;
 
     /// @notice Look up the recipient approved for a given extra token (typically from bribes).
     mapping(address => address) public extraTokenRecipient;
@@ -110,6 +150,7 @@ contract StrategyProxy {
     event ExtraTokenRecipientRevoked(address indexed token, address indexed recipient);
     event RewardTokenApproved(address indexed token, bool approved);
     event FactorySet(address indexed factory);
+    event GaugeApprovalSet(address indexed gauge, bool approved);
     event TokenClaimed(address indexed token, address indexed recipient, uint balance);
 
     constructor() public {
@@ -154,6 +195,22 @@ contract StrategyProxy {
     /// @param _strategy Strategy to approve on gauge.
     function approveStrategy(address _gauge, address _strategy) external {
         require(msg.sender == governance || msg.sender == factory, "!access");
+        _approveStrategy(_gauge, _strategy);
+    }
+
+    /// @notice Add many strategies to their gauges, such as when migrating to a new implementation.
+    /// @dev Must be called by governance or factory. Reverts entirely if any single approval fails.
+    /// @param _gauges Gauges to permit strategies on.
+    /// @param _strategies Strategies to approve on each gauge, in the same order.
+    function approveStrategies(address[] calldata _gauges, address[] calldata _strategies) external {
+        require(msg.sender == governance || msg.sender == factory, "!access");
+        require(_gauges.length == _strategies.length, "!length");
+        for (uint256 i = 0; i < _gauges.length; i++) {
+            _approveStrategy(_gauges[i], _strategies[i]);
+        }
+    }
+
+    function _approveStrategy(address _gauge, address _strategy) internal {
         require(_strategy != address(0), "disallow zero");
         require(strategies[_gauge] != _strategy, "already approved");
         strategies[_gauge] = _strategy;
@@ -161,14 +218,56 @@ contract StrategyProxy {
     }
 
     /// @notice Clear any previously approved strategy to a gauge.
-    /// @dev Must be called by governance.
+    /// @dev Must be called by governance. Also clears our voter's LP token approval to this gauge.
     /// @param _gauge Gauge from which to remove strategy.
     function revokeStrategy(address _gauge) external {
         require(msg.sender == governance, "!governance");
+        _revokeStrategy(_gauge);
+    }
+
+    /// @notice Clear previously approved strategies from many gauges.
+    /// @dev Must be called by governance. Reverts entirely if any gauge is already revoked.
+    /// @param _gauges Gauges from which to remove strategies.
+    function revokeStrategies(address[] calldata _gauges) external {
+        require(msg.sender == governance, "!governance");
+        for (uint256 i = 0; i < _gauges.length; i++) {
+            _revokeStrategy(_gauges[i]);
+        }
+    }
+
+    function _revokeStrategy(address _gauge) internal {
         address _strategy = strategies[_gauge];
         require(_strategy != address(0), "already revoked");
         strategies[_gauge] = address(0);
         emit StrategyRevoked(_gauge, _strategy);
+        if (gaugeApproved[_gauge]) {
+            // @dev: Older gauges may not have lp_token(), and some tokens may refuse our approval;
+            //  neither blocks revocation. Use revokeGaugeApproval() to retry for those.
+            try Gauge(_gauge).lp_token() returns (address _token) {
+                _revokeGaugeApproval(_gauge, _token);
+            } catch {}
+        }
+    }
+
+    /// @notice Clear our voter's standing LP token approval to a gauge.
+    /// @dev Must be called by governance. Useful for older gauges without lp_token(), where
+    ///  revokeStrategy() can't look up the LP token. The next deposit will approve again.
+    /// @param _gauge Gauge from which to remove our approval.
+    /// @param _token The LP token approved to this gauge.
+    function revokeGaugeApproval(address _gauge, address _token) external {
+        require(msg.sender == governance, "!governance");
+        require(gaugeApproved[_gauge], "already revoked");
+        require(_revokeGaugeApproval(_gauge, _token), "!approve");
+    }
+
+    // returns whether our voter cleared its approval. unlike safeExecute, a failed approval doesn't
+    //  revert, and our gauge stays marked as approved so we can try again
+    function _revokeGaugeApproval(address _gauge, address _token) internal returns (bool) {
+        (bool _success, ) = proxy.execute(_token, 0, abi.encodeWithSignature("approve(address,uint256)", _gauge, 0));
+        if (!_success) return false;
+        gaugeApproved[_gauge] = false;
+        emit GaugeApprovalSet(_gauge, false);
+        return true;
     }
 
     /// @notice Use to approve a recipient. Recipients have privileges to claim tokens directly from the voter.
@@ -322,6 +421,51 @@ contract StrategyProxy {
         return IERC20(_gauge).balanceOf(address(proxy));
     }
 
+    /// @notice View our voter's position in many gauges at once.
+    /// @dev Reward tokens are read from each gauge's reward_tokens(), and are left empty for older
+    ///  gauges without it. Non-contract addresses return an empty snapshot.
+    /// @param _gauges The gauges to check.
+    /// @return snapshots Voter balance, approved strategy, and each reward token's claimable amount
+    ///  and approval status, for each gauge.
+    function snapshot(address[] calldata _gauges) external view returns (GaugeSnapshot[] memory snapshots) {
+        snapshots = new GaugeSnapshot[](_gauges.length);
+        for (uint256 i = 0; i < _gauges.length; i++) {
+            address _gauge = _gauges[i];
+            snapshots[i].gauge = _gauge;
+            if (!_gauge.isContract()) continue;
+            snapshots[i].balance = balanceOf(_gauge);
+            snapshots[i].strategy = strategies[_gauge];
+            _snapshotRewards(snapshots[i]);
+        }
+    }
+
+    function _snapshotRewards(GaugeSnapshot memory _snapshot) internal view {
+        address[] memory tokens = new address[](MAX_GAUGE_REWARDS);
+        uint256 count;
+        for (; count < MAX_GAUGE_REWARDS; count++) {
+            try IGaugeRewards(_snapshot.gauge).reward_tokens(count) returns (address _token) {
+                if (_token == address(0)) break;
+                tokens[count] = _token;
+            } catch {
+                break;
+            }
+        }
+        // trim our array down to the reward tokens we actually found
+        assembly {
+            mstore(tokens, count)
+        }
+
+        _snapshot.rewardTokens = tokens;
+        _snapshot.claimableRewards = new uint256[](count);
+        _snapshot.rewardTokensApproved = new bool[](count);
+        for (uint256 i = 0; i < count; i++) {
+            try IGaugeRewards(_snapshot.gauge).claimable_reward(address(proxy), tokens[i]) returns (uint256 _claimable) {
+                _snapshot.claimableRewards[i] = _claimable;
+            } catch {}
+            _snapshot.rewardTokensApproved[i] = rewardTokenApproved(tokens[i]);
+        }
+    }
+
     /// @notice Withdraw full balance of voter's LPs from gauge.
     /// @param _gauge The gauge from which to withdraw.
     /// @param _token The LP token to withdraw from gauge.
@@ -331,7 +475,8 @@ contract StrategyProxy {
 
     /// @notice Takes care of depositing Curve LPs into gauge.
     /// @dev Strategy must first transfer LPs to this contract prior to calling.
-    ///  Must be called by strategy approved for this gauge.
+    ///  Must be called by strategy approved for this gauge. Our voter max approves
+    ///  each gauge once, so after the first deposit this is a single voter call.
     /// @param _gauge The gauge to deposit LP token into.
     /// @param _token The LP token to deposit into gauge.
     function deposit(address _gauge, address _token) external {
@@ -340,8 +485,13 @@ contract StrategyProxy {
         IERC20(_token).safeTransfer(address(proxy), _balance);
         _balance = IERC20(_token).balanceOf(address(proxy));
 
-        proxy.safeExecute(_token, 0, abi.encodeWithSignature("approve(address,uint256)", _gauge, 0));
-        proxy.safeExecute(_token, 0, abi.encodeWithSignature("approve(address,uint256)", _gauge, _balance));
+        if (!gaugeApproved[_gauge]) {
+            // some older LP tokens require resetting to zero before approving
+            proxy.safeExecute(_token, 0, abi.encodeWithSignature("approve(address,uint256)", _gauge, 0));
+            proxy.safeExecute(_token, 0, abi.encodeWithSignature("approve(address,uint256)", _gauge, uint256(-1)));
+            gaugeApproved[_gauge] = true;
+            emit GaugeApprovalSet(_gauge, true);
+        }
         proxy.safeExecute(_gauge, 0, abi.encodeWithSignature("deposit(uint256)", _balance));
     }
 
@@ -356,6 +506,44 @@ contract StrategyProxy {
         proxy.safeExecute(crv, 0, abi.encodeWithSignature("transfer(address,uint256)", msg.sender, _balance));
     }
 
+    /// @notice Mint CRV for many gauges at once, and transfer each gauge's CRV to its approved strategy.
+    /// @dev Mints up to eight gauges per call to our voter via Curve's mint_many. Gauges without an
+    ///  approved strategy, and repeats within a group of eight, are skipped. Each gauge's share is read
+    ///  from the minter's per-gauge minted tally. Strategies sell any CRV sent here on their next harvest.
+    /// @param _gauges The gauges to mint CRV for.
+    function harvestMany(address[] calldata _gauges) external {
+        uint256 length = _gauges.length;
+        for (uint256 i = 0; i < length; i += 8) {
+            address[8] memory batch;
+            uint256[8] memory mintedBefore;
+            uint256 count;
+            for (uint256 j = i; j < length && j < i + 8; j++) {
+                address _gauge = _gauges[j];
+                if (strategies[_gauge] == address(0) || _inBatch(batch, count, _gauge)) continue;
+                batch[count] = _gauge;
+                mintedBefore[count] = Mintr(mintr).minted(address(proxy), _gauge);
+                count++;
+            }
+            if (count == 0) continue;
+
+            proxy.safeExecute(mintr, 0, abi.encodeWithSignature("mint_many(address[8])", batch));
+            for (uint256 j = 0; j < count; j++) {
+                uint256 _amount = Mintr(mintr).minted(address(proxy), batch[j]).sub(mintedBefore[j]);
+                if (_amount > 0) {
+                    proxy.safeExecute(crv, 0, abi.encodeWithSignature("transfer(address,uint256)", strategies[batch[j]], _amount));
+                }
+            }
+        }
+    }
+
+    // mint_many would mint a repeated gauge only once, so we must only pay it out once
+    function _inBatch(address[8] memory _batch, uint256 _count, address _gauge) internal pure returns (bool) {
+        for (uint256 i = 0; i < _count; i++) {
+            if (_batch[i] == _gauge) return true;
+        }
+        return false;
+    }
+
     /// @notice Claim share of weekly admin fees from Curve fee distributor.
     /// @dev Admin fees become available every Thursday, so we run this expensive
     ///  logic only once per week. May only be called by feeRecipient.
@@ -364,8 +552,7 @@ contract StrategyProxy {
         require(msg.sender == feeRecipient, "!approved");
         if (!claimable()) return;
 
-        address p = address(proxy);
-        feeDistribution.claim_many([p, p, p, p, p, p, p, p, p, p, p, p, p, p, p, p, p, p, p, p]);
+        _claimFees(feeClaimsNeeded());
         lastTimeCursor = feeDistribution.time_cursor_of(address(proxy));
 
         uint256 amount = IERC20(CRV3).balanceOf(address(proxy));
@@ -375,6 +562,36 @@ contract StrategyProxy {
         }
     }
 
+    /// @notice Number of fee distributor claims needed to catch up on all pending weeks of admin fees.
+    /// @dev Each claim runs 50 iterations, and each iteration either moves forward a week or through one
+    ///  of our veCRV lock's user epochs, so we count both. Capped at 20 claims; any remainder is picked up
+    ///  next time. Our time cursor is zero before our first claim, so we don't know how far back we go; use the cap.
+    function feeClaimsNeeded() public view returns (uint256) {
+        address p = address(proxy);
+        uint256 cursor = feeDistribution.time_cursor_of(p);
+        if (cursor == 0) return MAX_FEE_CLAIMS;
+        uint256 iterations = now > cursor ? now.sub(cursor).div(WEEK) : 0;
+        uint256 maxEpoch = veCRV.user_point_epoch(p);
+        uint256 epoch = feeDistribution.user_epoch_of(p);
+        if (maxEpoch > epoch) iterations = iterations.add(maxEpoch - epoch);
+        uint256 claims = iterations.div(FEE_CLAIM_ITERATIONS).add(1);
+        return Math.min(claims, MAX_FEE_CLAIMS);
+    }
+
+    // claim_many stops at the first zero address, so only fill in as many claims as we need
+    function _claimFees(uint256 _claims) internal {
+        address p = address(proxy);
+        if (_claims == 1) {
+            feeDistribution.claim(p);
+            return;
+        }
+        address[20] memory claimants;
+        for (uint256 i = 0; i < _claims; i++) {
+            claimants[i] = p;
+        }
+        feeDistribution.claim_many(claimants);
+    }
+
     /// @notice Check if it has been one week since last admin fee claim.
     function claimable() public view returns (bool) {
         /// @dev add 1 day buffer since fees come available mid-day
@@ -389,7 +606,7 @@ contract StrategyProxy {
     /// @param _token The token to be claimed to the approved strategy.
     function claimRewards(address _gauge, address _token) external {
         require(strategies[_gauge] == msg.sender, "!strategy");
-        require(rewardTokenApproved[_token], "!approvedToken");
+        require(rewardTokenBit[_token] != 0, "!approvedToken");
         Gauge(_gauge).claim_rewards(address(proxy));
         _transferBalance(_token);
     }
@@ -402,20 +619,93 @@ contract StrategyProxy {
         require(strategies[_gauge] == msg.sender, "!strategy");
         Gauge(_gauge).claim_rewards(address(proxy));
         for (uint256 i; i < _tokens.length; ++i) {
-            require(rewardTokenApproved[_tokens[i]], "!approvedToken");
+            require(rewardTokenBit[_tokens[i]] != 0, "!approvedToken");
+            _transferBalance(_tokens[i]);
+        }
+    }
+
+    /// @notice Claim a gauge's cached non-CRV token incentives and transfer to strategy.
+    /// @dev Must be called by the strategy approved for the given gauge. If _tokens matches our
+    ///  current cache for this gauge, see cachedRewardTokens(), the whole list is checked with two
+    ///  storage reads instead of one per token, so this is cheaper than claimManyRewards() from
+    ///  three tokens up. Otherwise each token is checked individually, same as claimManyRewards().
+    /// @param _gauge The gauge which this strategy is claiming rewards.
+    /// @param _tokens The token(s) to be claimed to the approved strategy.
+    function claimCachedRewards(address _gauge, address[] calldata _tokens) external {
+        require(strategies[_gauge] == msg.sender, "!strategy");
+        Gauge(_gauge).claim_rewards(address(proxy));
+        if (keccak256(abi.encode(rewardTokensVersion, _tokens)) != gaugeRewardTokensHash[_gauge]) {
+            for (uint256 i; i < _tokens.length; ++i) {
+                require(rewardTokenBit[_tokens[i]] != 0, "!approvedToken");
+            }
+        }
+        for (uint256 i; i < _tokens.length; ++i) {
             _transferBalance(_tokens[i]);
         }
     }
 
+    /// @notice Cache a gauge's approved reward tokens for claimCachedRewards().
+    /// @dev May be called by anyone. Approving or revoking any reward token makes every cache
+    ///  stale, as does a gauge adding a new reward token, so sync again after either.
+    /// @param _gauge The gauge to cache reward tokens for.
+    function syncGaugeRewardTokens(address _gauge) external {
+        address[] memory tokens = new address[](MAX_GAUGE_REWARDS);
+        uint256 count;
+        for (uint256 i = 0; i < MAX_GAUGE_REWARDS; i++) {
+            address _token;
+            try IGaugeRewards(_gauge).reward_tokens(i) returns (address _rewardToken) {
+                _token = _rewardToken;
+            } catch {
+                break;
+            }
+            if (_token == address(0)) break;
+            if (rewardTokenBit[_token] != 0) tokens[count++] = _token;
+        }
+        // trim our array down to the approved tokens we actually found
+        assembly {
+            mstore(tokens, count)
+        }
+
+        gaugeRewardTokens[_gauge] = tokens;
+        gaugeRewardTokensHash[_gauge] = keccak256(abi.encode(rewardTokensVersion, tokens));
+    }
+
+    /// @notice View our cached reward tokens for a gauge, to pass to claimCachedRewards().
+    /// @dev Returns an empty list if our cache is stale.
+    /// @param _gauge The gauge to check.
+    function cachedRewardTokens(address _gauge) external view returns (address[] memory tokens) {
+        tokens = gaugeRewardTokens[_gauge];
+        if (keccak256(abi.encode(rewardTokensVersion, tokens)) != gaugeRewardTokensHash[_gauge]) {
+            return new address[](0);
+        }
+    }
+
+    /// @notice Check if a gauge reward token is approved for claiming.
+    /// @param _token The token to check.
+    function rewardTokenApproved(address _token) public view returns (bool) {
+        return rewardTokenBit[_token] != 0;
+    }
+
     /// @notice Approve reward tokens to be claimed by strategies.
     /// @dev Must be called by governance.
     /// @param _token The token to be claimed.
     function approveRewardToken(address _token) external {
         require(msg.sender == governance, "!governance");
-        require(_isSafeToken(_token),"!safeToken");
-        require(!rewardTokenApproved[_token]);
-        rewardTokenApproved[_token] = true;
-        emit RewardTokenApproved(_token, true);
+        approvedRewardTokens = _approveRewardToken(approvedRewardTokens, _token);
+        rewardTokensVersion++;
+    }
+
+    /// @notice Approve many reward tokens to be claimed by strategies.
+    /// @dev Must be called by governance. Our approval bitmap is only written once.
+    /// @param _tokens The tokens to be claimed.
+    function approveRewardTokens(address[] calldata _tokens) external {
+        require(msg.sender == governance, "!governance");
+        uint256 _approved = approvedRewardTokens;
+        for (uint256 i = 0; i < _tokens.length; i++) {
+            _approved = _approveRewardToken(_approved, _tokens[i]);
+        }
+        approvedRewardTokens = _approved;
+        rewardTokensVersion++;
     }
 
     /// @notice Revoke approval of reward tokens to be claimed by strategies.
@@ -423,9 +713,55 @@ contract StrategyProxy {
     /// @param _token The token to be revoked.
     function revokeRewardToken(address _token) external {
         require(msg.sender == governance, "!governance");
-        require(rewardTokenApproved[_token]);
-        rewardTokenApproved[_token] = false;
+        approvedRewardTokens = _revokeRewardToken(approvedRewardTokens, _token);
+        rewardTokensVersion++;
+    }
+
+    /// @notice Revoke approval of many reward tokens to be claimed by strategies.
+    /// @dev Must be called by governance. Our approval bitmap is only written once.
+    /// @param _tokens The tokens to be revoked.
+    function revokeRewardTokens(address[] calldata _tokens) external {
+        require(msg.sender == governance, "!governance");
+        uint256 _approved = approvedRewardTokens;
+        for (uint256 i = 0; i < _tokens.length; i++) {
+            _approved = _revokeRewardToken(_approved, _tokens[i]);
+        }
+        approvedRewardTokens = _approved;
+        rewardTokensVersion++;
+    }
+
+    // assign our token our lowest free bit, and return our bitmap with it approved
+    function _approveRewardToken(uint256 _approved, address _token) internal returns (uint256) {
+        require(_isSafeToken(_token),"!safeToken");
+        require(rewardTokenBit[_token] == 0);
+        uint256 _bit = _freeRewardTokenBit(_approved);
+        rewardTokenBit[_token] = _bit;
+        emit RewardTokenApproved(_token, true);
+        return _approved | (uint256(1) << (_bit - 1));
+    }
+
+    // free our token's bit, and return our bitmap with it revoked
+    function _revokeRewardToken(uint256 _approved, address _token) internal returns (uint256) {
+        uint256 _bit = rewardTokenBit[_token];
+        require(_bit != 0);
+        rewardTokenBit[_token] = 0;
         emit RewardTokenApproved(_token, false);
+        return _approved & ~(uint256(1) << (_bit - 1));
+    }
+
+    // find the lowest bit not assigned to an approved token, plus one
+    function _freeRewardTokenBit(uint256 _approved) internal pure returns (uint256 _bit) {
+        require(_approved != uint256(-1), "!bits");
+        // isolate our lowest unset bit, then binary search for its position
+        uint256 _free = ~_approved;
+        _free = _free & (~_free + 1);
+        for (uint256 _shift = 128; _shift > 0; _shift >>= 1) {
+            if (_free >= (uint256(1) << _shift)) {
+                _free >>= _shift;
+                _bit += _shift;
+            }
+        }
+        return _bit + 1;
     }
 
     // make sure a strategy can't yoink gauge or LP tokens.
@@ -440,7 +776,11 @@ contract StrategyProxy {
         return true;
     }
 
+    // skip empty balances, so claiming many tokens doesn't pay for zero-value transfers
     function _transferBalance(address _token) internal {
-        proxy.safeExecute(_token, 0, abi.encodeWithSignature("transfer(address,uint256)", msg.sender, IERC20(_token).balanceOf(address(proxy))));
+        uint256 _balance = IERC20(_token).balanceOf(address(proxy));
+        if (_balance > 0) {
+            proxy.safeExecute(_token, 0, abi.encodeWithSignature("transfer(address,uint256)", msg.sender, _balance));
+        }
     }
 }
@@ -18,9 +18,41 @@ interface IReleaseRegistry {
         string calldata _symbol,
         uint256 _releaseDelta
     ) external returns (address);
+
+    function newVaultDeterministic(
+        address _token,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        string calldata _name,
+        string calldata _symbol,
+        uint256 _releaseDelta,
+        bytes32 _salt
+    ) external returns (address);
+
+    function predictVaultAddress(
+        address _deployer,
+        address _token,
+        bytes32 _salt,
+        uint256 _releaseDelta
+    ) external view returns (address);
 }
 
 contract VaultRegistry is Ownable {
+    /* ========== STRUCTS ========== */
+
+    struct LegacyVault {
+        address vault;
+        bool imported;
+    }
+
+    struct TokenVaults {
+        address token;
+        address[] vaults;
+        uint256[] types;
+        bool[] endorsed;
+    }
+
     /* ========== STATE VARIABLES ========== */
 
     /// @notice Default vault type for this registry. Emitted on vault creation.
@@ -33,6 +65,14 @@ contract VaultRegistry is Ownable {
     /// @notice Address of our release registry. Used to pull most recent vault release.
     address public releaseRegistry;
 
+    /// @notice Whether legacy (type 0) lookups are served from our local snapshot of the legacy registry.
+    /// @dev Tokens that haven't been imported yet still fall back to the legacy registry.
+    bool public useLegacySnapshot;
+
+    /// @notice Our local copy of the legacy registry's latest vault for a given token.
+    /// @dev Imported via importLegacyVaults(). Vault is zero for imported tokens without a legacy vault.
+    mapping(address => LegacyVault) public legacySnapshot;
+
     /// @notice If one or more vault(s) exist for a token, they will be shown here.
     /// @dev Only vaults deployed from this registry will be shown.
     mapping(address => address[]) public vaults;
@@ -43,6 +83,10 @@ contract VaultRegistry is Ownable {
     /// @notice Check if an endorsed vault exists for a given underlying token.
     mapping(address => bool) public isRegistered;
 
+    /// @notice Latest vault endorsed by this registry for a given token and type.
+    /// @dev Legacy (type 0) vaults aren't stored here, use latestVaultOfType() for those.
+    mapping(address => mapping(uint256 => address)) public latestByType;
+
     /// @notice Check the type of a given vault address.
     /// @dev Vault must have been endorsed by this registry.
     mapping(address => uint256) public vaultType;
@@ -69,6 +113,10 @@ contract VaultRegistry is Ownable {
     event ApprovedVaultOwnerUpdated(address governance, bool approved);
     event ApprovedVaultEndorser(address account, bool canEndorse);
     event ReleaseRegistryUpdated(address newRegistry);
+    event VaultEndorsementSkipped(address indexed vault, bytes reason);
+    event VaultCreationSkipped(address indexed token, bytes reason);
+    event LegacyVaultImported(address indexed token, address vault);
+    event UseLegacySnapshotUpdated(bool useSnapshot);
 
     error GovernanceMismatch(address vault);
     error NotAllowedToEndorse();
@@ -101,6 +149,43 @@ contract VaultRegistry is Ownable {
         return vaults[_token].length;
     }
 
+    /**
+     @notice Returns every vault for a range of tokens registered with this registry.
+     @dev Our range is clamped to the number of tokens, so an offset past the end returns
+      an empty array. Legacy vaults are not included.
+     @param _offset Index in tokens of the first token to return.
+     @param _limit Maximum number of tokens to return.
+     @return page Token, vaults, vault types and endorsement status for each token in our range.
+     */
+    function tokenVaultsPage(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (TokenVaults[] memory page) {
+        uint256 length = tokens.length;
+        if (_offset >= length) {
+            return page;
+        }
+        if (_limit > length - _offset) {
+            _limit = length - _offset;
+        }
+
+        page = new TokenVaults[](_limit);
+        for (uint256 i; i < _limit; ++i) {
+            address token = tokens[_offset + i];
+            address[] memory tokenVaults = vaults[token];
+            uint256 numTokenVaults = tokenVaults.length;
+
+            page[i].token = token;
+            page[i].vaults = tokenVaults;
+            page[i].types = new uint256[](numTokenVaults);
+            page[i].endorsed = new bool[](numTokenVaults);
+            for (uint256 j; j < numTokenVaults; ++j) {
+                page[i].types[j] = vaultType[tokenVaults[j]];
+                page[i].endorsed[j] = isVaultEndorsed[tokenVaults[j]];
+            }
+        }
+    }
+
     /**
      @notice Returns the latest deployed vault for the given token.
      @dev Return zero if no vault is associated with the token. Also
@@ -127,6 +212,45 @@ contract VaultRegistry is Ownable {
         return _latestVaultOfType(_token, _type);
     }
 
+    /**
+     @notice Returns the address newVault() will deploy a vault to for the given token and type.
+     @dev Returns zero if our release registry predates deterministic deployments, in which case
+      newVault() uses its plain newVault() instead, or if our target release doesn't exist.
+     @param _token The token the new vault will be for.
+     @param _releaseDelta The number of releases prior to the latest to use as a target.
+     @param _type Vault type.
+     @return The address of the vault newVault() would deploy.
+     */
+    function predictVaultAddress(
+        address _token,
+        uint256 _releaseDelta,
+        uint256 _type
+    ) external view returns (address) {
+        return _predictVaultAddress(_token, _releaseDelta, _type);
+    }
+
+    // older release registries don't have predictVaultAddress(), so this doubles as our check for
+    //  whether our release registry can deploy deterministically
+    function _predictVaultAddress(
+        address _token,
+        uint256 _releaseDelta,
+        uint256 _type
+    ) internal view returns (address) {
+        (bool success, bytes memory data) = releaseRegistry.staticcall(
+            abi.encodeWithSelector(
+                IReleaseRegistry.predictVaultAddress.selector,
+                address(this),
+                _token,
+                bytes32(_type),
+                _releaseDelta
+            )
+        );
+        if (!success || data.length < 32) {
+            return address(0);
+        }
+        return abi.decode(data, (address));
+    }
+
     // get the latest vault for a token, from this registry or our legacy registry.
     function _latestVault(address _token) internal view returns (address) {
         uint256 length = _numVaults(_token);
@@ -146,29 +270,24 @@ contract VaultRegistry is Ownable {
             return _fetchFromLegacy(_token);
         }
 
-        uint256 length = _numVaults(_token);
-        if (length == 0) {
-            return address(0);
-        }
+        return latestByType[_token][_type];
+    }
 
-        uint256 i = length - 1;
-        while (true) {
-            address vault = vaults[_token][i];
-            if (vaultType[vault] == _type) {
-                return vault;
-            }
-            if (i == 0) {
-                break;
-            }
-            unchecked {
-                i--;
+    // check our legacy registry for vaults for a given token, using our snapshot if we can
+    function _fetchFromLegacy(address _token) internal view returns (address) {
+        if (useLegacySnapshot) {
+            LegacyVault memory snapshot = legacySnapshot[_token];
+            if (snapshot.imported) {
+                return snapshot.vault;
             }
         }
-        return address(0);
+        return _fetchFromLegacyRegistry(_token);
     }
 
-    // check our legacy registry for vaults for a given token
-    function _fetchFromLegacy(address _token) internal view returns (address) {
+    // read the latest vault for a given token directly from our legacy registry
+    function _fetchFromLegacyRegistry(
+        address _token
+    ) internal view returns (address) {
         bytes memory data = abi.encodeWithSignature(
             "latestVault(address)",
             _token
@@ -192,6 +311,10 @@ contract VaultRegistry is Ownable {
         Throws if caller isn't governance.
         Throws if no releases are registered yet.
         Throws if there already is a registered vault for the given token with the latest api version.
+        Vault address is deterministic, see predictVaultAddress(), unless our release registry
+        predates deterministic deployments, in which case we use its newVault(). Since our salt
+        is keyed by (token, release, type), this throws if we've ever deployed a vault for this
+        token and type from our target release, even if a newer release has been registered since.
         Emits a NewVault event.
     @param _token The token that may be deposited into the new Vault.
     @param _guardian The address authorized for guardian interactions in the new Vault.
@@ -200,7 +323,7 @@ contract VaultRegistry is Ownable {
     @param _symbol Specify a custom Vault symbol name. Set to empty string for default choice.
     @param _releaseDelta Specify the number of releases prior to the latest to use as a target. Default is latest.
     @param _type Vault type. Basic defined types are 1: default, 2: automated, but more can be added.
-    @return The address of the newly-deployed vault
+    @return vault The address of the newly-deployed vault
      */
     function newVault(
         address _token,
@@ -211,20 +334,21 @@ contract VaultRegistry is Ownable {
         string calldata _symbol,
         uint256 _releaseDelta,
         uint256 _type
-    ) public returns (address) {
+    ) public returns (address vault) {
         require(vaultEndorsers[msg.sender], "unauthorized");
         require(approvedVaultsOwner[_governance], "not allowed vault owner");
-        address vault = IReleaseRegistry(releaseRegistry).newVault(
+
+        vault = _deployVault(
             _token,
             _governance,
             _guardian,
             _rewards,
             _name,
             _symbol,
-            _releaseDelta
+            _releaseDelta,
+            _type
         );
         _registerVault(_token, vault, _type);
-        return vault;
     }
 
     /**
@@ -250,10 +374,6 @@ contract VaultRegistry is Ownable {
             revert NotAllowedToEndorse();
         }
 
-        if (approvedVaultsOwner[IVault(_vault).governance()] == false) {
-            revert GovernanceMismatch(_vault);
-        }
-
         // NOTE: Underflow if no releases created yet, or targeting prior to release history
         uint256 releaseTarget = IReleaseRegistry(releaseRegistry)
             .numReleases() -
@@ -262,11 +382,122 @@ contract VaultRegistry is Ownable {
         string memory apiVersion = IVault(
             IReleaseRegistry(releaseRegistry).releases(releaseTarget)
         ).apiVersion();
+        _endorseVault(_vault, apiVersion, _type);
+    }
+
+    /**
+     @notice
+         Endorse a batch of existing vaults in a single transaction, skipping any that fail.
+     @dev
+         Throws if caller isn't an approved endorser, or if our array lengths don't match.
+         Release api versions are only looked up when our release delta changes, so group
+         vaults by release delta where possible. Emits a VaultEndorsementSkipped event for
+         each vault that fails. See endorseVault() for more details.
+     @param _vaults The vaults that will be endorsed by this registry.
+     @param _releaseDeltas The number of releases prior to the latest to use as a target for each vault.
+     @param _types The vault type for each vault.
+     @return success Whether each vault was endorsed.
+    */
+    function endorseVaults(
+        address[] calldata _vaults,
+        uint256[] calldata _releaseDeltas,
+        uint256[] memory _types
+    ) public returns (bool[] memory success) {
+        if (vaultEndorsers[msg.sender] == false) {
+            revert NotAllowedToEndorse();
+        }
+        require(
+            _vaults.length == _releaseDeltas.length &&
+                _vaults.length == _types.length,
+            "length mismatch"
+        );
+
+        // NOTE: Underflow if no releases created yet
+        uint256 latestRelease = IReleaseRegistry(releaseRegistry)
+            .numReleases() - 1; // dev: no releases
+        uint256 cachedDelta = type(uint256).max;
+        string memory apiVersion;
+
+        success = new bool[](_vaults.length);
+        for (uint256 i; i < _vaults.length; ++i) {
+            uint256 releaseDelta = _releaseDeltas[i];
+            if (releaseDelta > latestRelease) {
+                // encode our reason like a revert, so it matches our other skips
+                emit VaultEndorsementSkipped(
+                    _vaults[i],
+                    abi.encodeWithSignature("Error(string)", "unknown release")
+                );
+                continue;
+            }
+            if (releaseDelta != cachedDelta) {
+                cachedDelta = releaseDelta;
+                apiVersion = IVault(
+                    IReleaseRegistry(releaseRegistry).releases(
+                        latestRelease - releaseDelta
+                    )
+                ).apiVersion();
+            }
+
+            try this.endorseVaultFromBatch(_vaults[i], apiVersion, _types[i]) {
+                success[i] = true;
+            } catch (bytes memory reason) {
+                emit VaultEndorsementSkipped(_vaults[i], reason);
+            }
+        }
+    }
+
+    /**
+    @notice Endorse a batch of vaults of the default vault type.
+    @dev See main endorseVaults() function for more details.
+    @param _vaults The vaults that will be endorsed by this registry.
+    @param _releaseDeltas The number of releases prior to the latest to use as a target for each vault.
+    @return success Whether each vault was endorsed.
+     */
+    function endorseVaults(
+        address[] calldata _vaults,
+        uint256[] calldata _releaseDeltas
+    ) external returns (bool[] memory success) {
+        uint256[] memory types = new uint256[](_vaults.length);
+        for (uint256 i; i < _vaults.length; ++i) {
+            types[i] = DEFAULT_VAULT_TYPE;
+        }
+        return endorseVaults(_vaults, _releaseDeltas, types);
+    }
+
+    /**
+    @notice Endorse a single vault from within endorseVaults().
+    @dev This is external only so endorseVaults() can catch its reverts. Throws if
+     not called by this registry.
+    @param _vault The vault that will be endorsed by this registry.
+    @param _apiVersion The api version of our target release.
+    @param _type Vault type
+     */
+    function endorseVaultFromBatch(
+        address _vault,
+        string calldata _apiVersion,
+        uint256 _type
+    ) external {
+        if (msg.sender != address(this)) {
+            revert NotAllowedToEndorse();
+        }
+        _endorseVault(_vault, _apiVersion, _type);
+    }
+
+    // check our vault's governance and version before adding it to our registry
+    function _endorseVault(
+        address _vault,
+        string memory _apiVersion,
+        uint256 _type
+    ) internal {
+        if (approvedVaultsOwner[IVault(_vault).governance()] == false) {
+            revert GovernanceMismatch(_vault);
+        }
+
         if (
             keccak256(bytes((IVault(_vault).apiVersion()))) !=
-            keccak256(bytes((apiVersion)))
+            keccak256(bytes((_apiVersion)))
         ) {
-            revert VersionMissmatch(IVault(_vault).apiVersion(), apiVersion);
+            revert VersionMissmatch(IVault(_vault).apiVersion(), _apiVersion);
         }
         // Add to the end of the list of vaults for token
         _registerVault(IVault(_vault).token(), _vault, _type);
@@ -316,6 +547,123 @@ contract VaultRegistry is Ownable {
             );
     }
 
+    /**
+    @notice
+        Deploy new vaults for a batch of tokens in a single transaction, skipping any that fail.
+    @dev
+        Vaults use their default names and symbols. Throws if caller isn't an approved endorser,
+        or if governance isn't an approved vault owner. Emits a VaultCreationSkipped event for
+        each token that fails. Each token is deployed separately, rather than through our release
+        registry's newVaults(), so one failing token can't revert the rest. Vaults still use the
+        same CREATE2 salt as newVault(), so their addresses can be predicted the same way. See
+        main newVault() function for more details.
+    @param _tokens The tokens that may be deposited into our new Vaults.
+    @param _governance vault governance
+    @param _guardian The address authorized for guardian interactions in our new Vaults.
+    @param _rewards The address to use for collecting rewards in our new Vaults
+    @param _releaseDelta Specify the number of releases prior to the latest to use as a target. Default is latest.
+    @param _type Vault type. Basic defined types are 1: default, 2: automated, but more can be added.
+    @return vaults The address of each newly-deployed vault, or zero if that token was skipped
+     */
+    function newVaults(
+        address[] calldata _tokens,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        uint256 _releaseDelta,
+        uint256 _type
+    ) external returns (address[] memory vaults) {
+        require(vaultEndorsers[msg.sender], "unauthorized");
+        require(approvedVaultsOwner[_governance], "not allowed vault owner");
+
+        vaults = new address[](_tokens.length);
+        for (uint256 i; i < _tokens.length; ++i) {
+            try
+                this.newVaultFromBatch(
+                    _tokens[i],
+                    _governance,
+                    _guardian,
+                    _rewards,
+                    _releaseDelta,
+                    _type
+                )
+            returns (address vault) {
+                vaults[i] = vault;
+            } catch (bytes memory reason) {
+                emit VaultCreationSkipped(_tokens[i], reason);
+            }
+        }
+    }
+
+    /**
+    @notice Deploy a single vault from within newVaults().
+    @dev This is external only so newVaults() can catch its reverts. Throws if
+     not called by this registry.
+    @return vault The address of the newly-deployed vault
+     */
+    function newVaultFromBatch(
+        address _token,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        uint256 _releaseDelta,
+        uint256 _type
+    ) external returns (address vault) {
+        require(msg.sender == address(this), "unauthorized");
+
+        vault = _deployVault(
+            _token,
+            _governance,
+            _guardian,
+            _rewards,
+            "",
+            "",
+            _releaseDelta,
+            _type
+        );
+        _registerVault(_token, vault, _type);
+    }
+
+    // deploy via CREATE2 when our release registry supports it, salted by our vault type. release
+    //  registry scopes this to us, our token and our release, so our address is keyed by
+    //  (token, release, type). any failure reverts, we never fall back to a plain deployment.
+    function _deployVault(
+        address _token,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        string memory _name,
+        string memory _symbol,
+        uint256 _releaseDelta,
+        uint256 _type
+    ) internal returns (address) {
+        IReleaseRegistry _releaseRegistry = IReleaseRegistry(releaseRegistry);
+        if (_predictVaultAddress(_token, _releaseDelta, _type) == address(0)) {
+            return
+                _releaseRegistry.newVault(
+                    _token,
+                    _governance,
+                    _guardian,
+                    _rewards,
+                    _name,
+                    _symbol,
+                    _releaseDelta
+                );
+        }
+
+        return
+            _releaseRegistry.newVaultDeterministic(
+                _token,
+                _governance,
+                _guardian,
+                _rewards,
+                _name,
+                _symbol,
+                _releaseDelta,
+                bytes32(_type)
+            );
+    }
+
     function _registerVault(
         address _token,
         address _vault,
@@ -344,6 +692,7 @@ contract VaultRegistry is Ownable {
         // Update the latest deployment
         vaults[_token].push(_vault);
         vaultType[_vault] = _type;
+        latestByType[_token][_type] = _vault;
 
         // Register tokens for endorsed vaults
         if (isRegistered[_token] == false) {
@@ -384,6 +733,31 @@ contract VaultRegistry is Ownable {
         emit ApprovedVaultOwnerUpdated(_addr, _approved);
     }
 
+    /**
+    @notice Copy the latest legacy vault for each token into our local snapshot.
+    @dev Throws if caller is not owner. Reads directly from our legacy registry, so this
+     can be called in chunks, and called again for any tokens whose legacy vault changes.
+    @param _tokens The tokens to import legacy vaults for.
+     */
+    function importLegacyVaults(address[] calldata _tokens) external onlyOwner {
+        for (uint256 i; i < _tokens.length; ++i) {
+            address token = _tokens[i];
+            address vault = _fetchFromLegacyRegistry(token);
+            legacySnapshot[token] = LegacyVault(vault, true);
+            emit LegacyVaultImported(token, vault);
+        }
+    }
+
+    /**
+    @notice Set whether legacy vault lookups should use our local snapshot.
+    @dev Throws if caller is not owner.
+    @param _useSnapshot Serve imported tokens from our snapshot instead of our legacy registry.
+     */
+    function setUseLegacySnapshot(bool _useSnapshot) external onlyOwner {
+        useLegacySnapshot = _useSnapshot;
+        emit UseLegacySnapshotUpdated(_useSnapshot);
+    }
+
     /**
     @notice Update the address of our release registry.
     @dev Contains information about latest and past vault releases. 
@@ -1,6 +1,8 @@
 pragma solidity ^0.6.12;
 
 interface FeeDistribution {
+    function claim(address) external returns (uint256);
+
     function claim_many(address[20] calldata) external returns (bool);
 
     function last_token_time() external view returns (uint256);
@@ -8,4 +10,6 @@ interface FeeDistribution {
     function time_cursor() external view returns (uint256);
 
     function time_cursor_of(address) external view returns (uint256);
+
+    function user_epoch_of(address) external view returns (uint256);
 }
\ No newline at end of file
@@ -14,4 +14,6 @@ interface Gauge {
     function rewarded_token() external returns (address);
 
     function reward_tokens(uint256) external returns (address);
+
+    function lp_token() external view returns (address);
 }
\ No newline at end of file
@@ -4,4 +4,8 @@ pragma solidity ^0.6.12;
 
 interface Mintr {
     function mint(address) external;
+
+    function mint_many(address[8] calldata) external;
+
+    function minted(address, address) external view returns (uint256);
 }
\ No newline at end of file
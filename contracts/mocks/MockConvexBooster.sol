@@ -0,0 +1,47 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+/// @notice Minimal stand-in for Convex's booster, only used to benchmark our factory lookups.
+contract MockConvexBooster {
+    struct PoolInfo {
+        address lptoken;
+        address token;
+        address gauge;
+        address crvRewards;
+        address stash;
+        bool shutdown;
+    }
+
+    PoolInfo[] public poolInfo;
+
+    mapping(address => bool) public gaugeMap;
+
+    function poolLength() external view returns (uint256) {
+        return poolInfo.length;
+    }
+
+    // add a single pool for a specific gauge
+    function addPool(address _lptoken, address _gauge) public returns (bool) {
+        poolInfo.push(
+            PoolInfo(_lptoken, address(0), _gauge, address(0), address(0), false)
+        );
+        gaugeMap[_gauge] = true;
+        return true;
+    }
+
+    // fill the booster with placeholder pools, each with a unique gauge
+    function addPools(uint256 _count) external {
+        for (uint256 i; i < _count; ++i) {
+            address gauge = address(
+                uint160(uint256(keccak256(abi.encode(poolInfo.length))))
+            );
+            addPool(gauge, gauge);
+        }
+    }
+
+    function shutdownPool(uint256 _pid) external {
+        PoolInfo storage pool = poolInfo[_pid];
+        pool.shutdown = true;
+        gaugeMap[pool.gauge] = false;
+    }
+}
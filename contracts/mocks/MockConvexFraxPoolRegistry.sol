@@ -0,0 +1,65 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+/// @notice Staking token stand-in that reports which Convex pid it wraps.
+contract MockFraxStakingToken {
+    uint256 internal immutable pid;
+    bool internal immutable hasPid;
+
+    constructor(uint256 _convexPoolId, bool _hasConvexPoolId) {
+        pid = _convexPoolId;
+        hasPid = _hasConvexPoolId;
+    }
+
+    // some real staking tokens don't have this view, so allow reverting
+    function convexPoolId() external view returns (uint256) {
+        require(hasPid);
+        return pid;
+    }
+}
+
+/// @notice Minimal stand-in for Convex's Frax pool registry, only used to benchmark our factory lookups.
+contract MockConvexFraxPoolRegistry {
+    struct PoolInfo {
+        address implementation;
+        address stakingAddress;
+        address stakingToken;
+        address rewardsAddress;
+        uint8 active;
+    }
+
+    PoolInfo[] public poolInfo;
+
+    function poolLength() external view returns (uint256) {
+        return poolInfo.length;
+    }
+
+    // add a single frax pool for a given convex pid
+    function addPool(
+        uint256 _convexPid,
+        bool _hasConvexPoolId
+    ) public returns (uint256) {
+        address stakingToken = address(
+            new MockFraxStakingToken(_convexPid, _hasConvexPoolId)
+        );
+        // staking address just needs to be unique and non-zero for our purposes
+        address stakingAddress = address(
+            uint160(uint256(keccak256(abi.encode(stakingToken))))
+        );
+        poolInfo.push(
+            PoolInfo(address(0), stakingAddress, stakingToken, address(0), 1)
+        );
+        return poolInfo.length - 1;
+    }
+
+    // fill the registry with placeholder pools, with convex pids starting at _firstConvexPid
+    function addPools(uint256 _firstConvexPid, uint256 _count) external {
+        for (uint256 i; i < _count; ++i) {
+            addPool(_firstConvexPid + i, true);
+        }
+    }
+
+    function setActive(uint256 _fraxPid, bool _active) external {
+        poolInfo[_fraxPid].active = _active ? 1 : 0;
+    }
+}
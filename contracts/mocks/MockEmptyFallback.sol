@@ -0,0 +1,7 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+/// @notice Accepts any call and returns nothing, only used to test that bad gauges can't break our batch views.
+contract MockEmptyFallback {
+    fallback() external {}
+}
@@ -0,0 +1,69 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+/// @notice Stand-in for Curve's fee distributor, only used to test how many claims our proxy makes.
+/// @dev Each claim runs up to 50 iterations, first through any pending user epochs, then weeks, like
+///  the real distributor. Tests put this code at the real distributor's address, which keeps its
+///  storage, so set every value with setState() before claiming.
+contract MockFeeDistributor {
+    uint256 internal constant WEEK = 7 days;
+    uint256 internal constant ITERATIONS = 50;
+
+    uint256 public last_token_time;
+    uint256 public maxUserEpoch;
+    mapping(address => uint256) public time_cursor_of;
+    mapping(address => uint256) public user_epoch_of;
+
+    uint256 public claims;
+    uint256 public claimManyCalls;
+
+    function setState(
+        address _user,
+        uint256 _lastTokenTime,
+        uint256 _timeCursor,
+        uint256 _userEpoch,
+        uint256 _maxUserEpoch
+    ) external {
+        last_token_time = _lastTokenTime;
+        time_cursor_of[_user] = _timeCursor;
+        user_epoch_of[_user] = _userEpoch;
+        maxUserEpoch = _maxUserEpoch;
+        claims = 0;
+        claimManyCalls = 0;
+    }
+
+    function claim(address _user) external returns (uint256) {
+        _claim(_user);
+        return 0;
+    }
+
+    // like the real distributor, stop at the first zero address
+    function claim_many(address[20] calldata _users) external returns (bool) {
+        ++claimManyCalls;
+        for (uint256 i; i < 20; ++i) {
+            if (_users[i] == address(0)) {
+                break;
+            }
+            _claim(_users[i]);
+        }
+        return true;
+    }
+
+    function _claim(address _user) internal {
+        ++claims;
+        uint256 cursor = time_cursor_of[_user];
+        uint256 epoch = user_epoch_of[_user];
+        for (uint256 i; i < ITERATIONS; ++i) {
+            if (cursor >= last_token_time) {
+                break;
+            }
+            if (epoch < maxUserEpoch) {
+                ++epoch;
+            } else {
+                cursor += WEEK;
+            }
+        }
+        time_cursor_of[_user] = cursor;
+        user_epoch_of[_user] = epoch;
+    }
+}
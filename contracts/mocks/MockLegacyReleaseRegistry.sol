@@ -0,0 +1,57 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+interface IReleaseRegistry {
+    function numReleases() external view returns (uint256);
+
+    function releases(uint256 _version) external view returns (address);
+
+    function newVault(
+        address _token,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        string calldata _name,
+        string calldata _symbol,
+        uint256 _releaseDelta
+    ) external returns (address);
+}
+
+/// @notice Release registry from before deterministic deployments, forwarding to a real one. Only used
+///  to test that our vault registry still works with older release registries.
+contract MockLegacyReleaseRegistry {
+    IReleaseRegistry internal immutable releaseRegistry;
+
+    constructor(address _releaseRegistry) {
+        releaseRegistry = IReleaseRegistry(_releaseRegistry);
+    }
+
+    function numReleases() external view returns (uint256) {
+        return releaseRegistry.numReleases();
+    }
+
+    function releases(uint256 _version) external view returns (address) {
+        return releaseRegistry.releases(_version);
+    }
+
+    function newVault(
+        address _token,
+        address _governance,
+        address _guardian,
+        address _rewards,
+        string calldata _name,
+        string calldata _symbol,
+        uint256 _releaseDelta
+    ) external returns (address) {
+        return
+            releaseRegistry.newVault(
+                _token,
+                _governance,
+                _guardian,
+                _rewards,
+                _name,
+                _symbol,
+                _releaseDelta
+            );
+    }
+}
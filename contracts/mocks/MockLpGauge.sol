@@ -0,0 +1,40 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+
+/// @notice Mintable LP token whose approvals can be switched off, only used to test our proxy's revocations.
+contract MockLpToken is ERC20 {
+    bool public approvalsBlocked;
+
+    constructor() ERC20("Mock LP", "MLP") {}
+
+    function mint(address _to, uint256 _amount) external {
+        _mint(_to, _amount);
+    }
+
+    function setApprovalsBlocked(bool _blocked) external {
+        approvalsBlocked = _blocked;
+    }
+
+    function approve(address _spender, uint256 _amount) public override returns (bool) {
+        require(!approvalsBlocked, "approvals blocked");
+        return super.approve(_spender, _amount);
+    }
+}
+
+/// @notice Minimal stand-in for a Curve gauge that takes deposits, only used to test our proxy's revocations.
+contract MockLpGauge {
+    address public lp_token;
+
+    mapping(address => uint256) public balanceOf;
+
+    constructor(address _lpToken) {
+        lp_token = _lpToken;
+    }
+
+    function deposit(uint256 _amount) external {
+        MockLpToken(lp_token).transferFrom(msg.sender, address(this), _amount);
+        balanceOf[msg.sender] += _amount;
+    }
+}
@@ -0,0 +1,17 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+/// @notice Stand-in for yearn's lens oracle with settable prices, only used to test our price cache.
+contract MockPriceOracle {
+    mapping(address => uint256) public prices;
+
+    function setPrice(address _token, uint256 _price) external {
+        prices[_token] = _price;
+    }
+
+    function getPriceUsdcRecommended(
+        address _token
+    ) external view returns (uint256) {
+        return prices[_token];
+    }
+}
@@ -0,0 +1,45 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+
+/// @notice Mintable reward token, only used to benchmark our proxy's reward claims.
+contract MockRewardToken is ERC20 {
+    constructor(string memory _symbol) ERC20(_symbol, _symbol) {}
+
+    function mint(address _to, uint256 _amount) external {
+        _mint(_to, _amount);
+    }
+}
+
+/// @notice Minimal stand-in for a Curve gauge with extra rewards, only used to benchmark our proxy's reward claims.
+contract MockRewardGauge {
+    uint256 internal constant MAX_REWARDS = 8;
+    uint256 internal constant REWARD_AMOUNT = 1e18;
+
+    address[] internal rewards;
+
+    // deploy a new reward token and add it to our gauge
+    function addRewardToken(string memory _symbol) external returns (address token) {
+        require(rewards.length < MAX_REWARDS);
+        token = address(new MockRewardToken(_symbol));
+        rewards.push(token);
+    }
+
+    // like curve, return zero past the end of our rewards
+    function reward_tokens(uint256 _index) external view returns (address) {
+        if (_index >= rewards.length) return address(0);
+        return rewards[_index];
+    }
+
+    function reward_count() external view returns (uint256) {
+        return rewards.length;
+    }
+
+    // every claim pays out a fixed amount of each reward token
+    function claim_rewards(address _addr) external {
+        for (uint256 i; i < rewards.length; ++i) {
+            MockRewardToken(rewards[i]).mint(_addr, REWARD_AMOUNT);
+        }
+    }
+}
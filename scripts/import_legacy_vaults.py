@@ -0,0 +1,49 @@
+from brownie import Contract, VaultRegistry, ZERO_ADDRESS, accounts, multicall, network
+import click
+
+# number of tokens to import per transaction
+BATCH_SIZE = 100
+
+
+def build_batches(registry):
+    legacy_registry = Contract(registry.LEGACY_REGISTRY())
+    num_tokens = legacy_registry.numTokens()
+    print(f"Legacy registry {legacy_registry.address} has {num_tokens} tokens")
+
+    # read everything we need from both registries in a few batched calls
+    with multicall:
+        tokens = [legacy_registry.tokens(i) for i in range(num_tokens)]
+    with multicall:
+        latest = [legacy_registry.latestVault(token) for token in tokens]
+        snapshots = [registry.legacySnapshot(token) for token in tokens]
+
+    # only import tokens that are missing or stale in our snapshot
+    to_import = []
+    for token, vault, snapshot in zip(tokens, latest, snapshots):
+        vault = vault or ZERO_ADDRESS
+        if not snapshot["imported"] or snapshot["vault"] != vault:
+            to_import.append(token)
+    print(f"{len(to_import)} tokens need importing")
+
+    return [
+        to_import[i : i + BATCH_SIZE] for i in range(0, len(to_import), BATCH_SIZE)
+    ]
+
+
+def main():
+    print(f"You are using the '{network.show_active()}' network")
+    dev = accounts.load(click.prompt("Account", type=click.Choice(accounts.load())))
+    print(f"You are using: 'dev' [{dev.address}]")
+
+    registry = VaultRegistry.at(click.prompt("Vault registry"))
+    assert registry.owner() == dev.address, "Only our registry owner can import"
+
+    batches = build_batches(registry)
+    for i, batch in enumerate(batches):
+        print(f"Importing batch {i + 1}/{len(batches)} ({len(batch)} tokens)")
+        registry.importLegacyVaults(batch, {"from": dev})
+
+    if not registry.useLegacySnapshot() and click.confirm(
+        "Serve legacy lookups from our snapshot?"
+    ):
+        registry.setUseLegacySnapshot(True, {"from": dev})
@@ -0,0 +1,78 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+def test_batch_vault_deployment(
+    StrategyConvexFactoryClonable,
+    curve_global,
+    gov,
+    accounts,
+    pid,
+    new_registry,
+    gauge,
+    new_proxy,
+    voter,
+    whale,
+    tests_using_tenderly,
+    steth_gauge,
+):
+    # for most pids below 100, we already have a vault, and any legacy vault will revert when trying to deploy permissionlessly
+    if pid < 100:
+        print("PID less than 100, skipping permissionless vault testing")
+        return
+
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(curve_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(curve_global, True, {"from": registry_owner})
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    new_proxy.setFactory(curve_global.address, {"from": gov})
+
+    # only our factory can call the per-gauge batch helper
+    if not tests_using_tenderly:
+        # addresses and contracts, then keeps and voters, then harvest bounds, fees and deposit limit, then proxy
+        keeps_and_voters = [0, ZERO_ADDRESS] * 3
+        config = [ZERO_ADDRESS] * 14 + keeps_and_voters + [0] * 5 + [ZERO_ADDRESS]
+        with brownie.reverts():
+            curve_global.createNewVaultsAndStrategiesFromBatch(
+                gauge, config, {"from": whale}
+            )
+
+    # stETH already has a vault, and our whale isn't a gauge at all, so both should be skipped
+    gauges = [steth_gauge, gauge, whale]
+    results = curve_global.createNewVaultsAndStrategiesBatch.call(
+        gauges, {"from": whale}
+    )
+    tx = curve_global.createNewVaultsAndStrategiesBatch(gauges, {"from": whale})
+    print("Batch gas used:", tx.gas_used)
+
+    assert [result["gauge"] for result in results] == gauges
+    assert [result["success"] for result in results] == [False, True, False]
+    assert len(tx.events["VaultCreationSkipped"]) == 2
+    assert tx.events["VaultCreationSkipped"][0]["gauge"] == steth_gauge
+    assert tx.events["VaultCreationSkipped"][1]["gauge"] == whale
+
+    # our one new vault should look exactly like one from createNewVaultsAndStrategies
+    assert len(tx.events["NewAutomatedVault"]) == 1
+    info = tx.events["NewAutomatedVault"]
+    assert info["gauge"] == gauge
+    vault = Contract(info["vault"])
+    assert curve_global.latestStandardVaultFromGauge(gauge) == vault.address
+    assert curve_global.numVaults() == 1
+    assert vault.governance() == curve_global.address
+    assert vault.management() == curve_global.management()
+    assert vault.depositLimit() == curve_global.depositLimit()
+    assert vault.withdrawalQueue(0) == info["convexStrategy"]
+    assert vault.withdrawalQueue(1) == info["curveStrategy"]
+    assert new_proxy.strategies(gauge) == info["curveStrategy"]
+
+    convex_strategy = StrategyConvexFactoryClonable.at(info["convexStrategy"])
+    assert convex_strategy.healthCheck() == curve_global.healthCheck()
+    assert convex_strategy.keeper() == curve_global.keeper()
+    print("Batch deployed our vault and skipped the rest")
+
+    # running the same batch again should skip everything without reverting
+    tx = curve_global.createNewVaultsAndStrategiesBatch(gauges, {"from": whale})
+    assert len(tx.events["VaultCreationSkipped"]) == 3
+    assert "NewAutomatedVault" not in tx.events
+    assert curve_global.numVaults() == 1
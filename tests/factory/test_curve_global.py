@@ -105,6 +105,7 @@ def test_vault_deployment(
 
     tx = curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
     assert curve_global.latestStandardVaultFromGauge(gauge) != ZERO_ADDRESS
+    print("Gas used deploying our vault and strategies:", tx.gas_used)
 
     vault_address = tx.events["NewAutomatedVault"]["vault"]
     vault = Contract(vault_address)
@@ -578,12 +579,16 @@ def test_curve_global_setters_and_views(
     curve_global.setHarvestProfitMaxInUsdc(0, {"from": gov})
     curve_global.setHarvestProfitMaxInUsdc(69, {"from": curve_global.management()})
     assert curve_global.harvestProfitMaxInUsdc() == 69
+    with brownie.reverts():
+        curve_global.setHarvestProfitMaxInUsdc(2**96, {"from": gov})
 
     with brownie.reverts():
         curve_global.setHarvestProfitMinInUsdc(69, {"from": whale})
     curve_global.setHarvestProfitMinInUsdc(0, {"from": gov})
     curve_global.setHarvestProfitMinInUsdc(69, {"from": curve_global.management()})
     assert curve_global.harvestProfitMinInUsdc() == 69
+    with brownie.reverts():
+        curve_global.setHarvestProfitMinInUsdc(2**96, {"from": gov})
 
     with brownie.reverts():
         curve_global.setKeeper(gov, {"from": whale})
@@ -657,6 +662,11 @@ def test_curve_global_setters_and_views(
     curve_global.setBaseFeeOracle(gov, {"from": gov})
     assert curve_global.baseFeeOracle() == gov.address
 
+    with brownie.reverts():
+        curve_global.setPriceOracle(gov, {"from": whale})
+    curve_global.setPriceOracle(gov, {"from": gov})
+    assert curve_global.priceOracle() == gov.address
+
     with brownie.reverts():
         curve_global.setConvexStratImplementation(gov, {"from": whale})
     curve_global.setConvexStratImplementation(gov, {"from": gov})
@@ -0,0 +1,135 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS, web3
+
+
+def test_predicted_factory_addresses(
+    curve_global,
+    gov,
+    accounts,
+    pid,
+    new_registry,
+    gauge,
+    new_proxy,
+    voter,
+    whale,
+):
+    # for most pids below 100, we already have a vault, and any legacy vault will revert when trying to deploy permissionlessly
+    if pid < 100:
+        print("PID less than 100, skipping permissionless vault testing")
+        return
+
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(curve_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(curve_global, True, {"from": registry_owner})
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    new_proxy.setFactory(curve_global.address, {"from": gov})
+
+    # predict everything before we deploy anything
+    predicted_vault = curve_global.predictVaultAddress(gauge)
+    predicted = curve_global.predictStrategyAddresses(gauge)
+    assert predicted["vault"] == predicted_vault
+    assert len(web3.eth.get_code(predicted_vault)) == 0
+    assert predicted["convexStrategy"] != ZERO_ADDRESS
+    assert predicted["curveStrategy"] != ZERO_ADDRESS
+    print("Predicted addresses:", predicted)
+
+    tx = curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    info = tx.events["NewAutomatedVault"]
+    assert info["vault"] == predicted["vault"]
+    assert info["convexStrategy"] == predicted["convexStrategy"]
+    assert info["curveStrategy"] == predicted["curveStrategy"]
+    assert info["convexFraxStrategy"] == predicted["convexFraxStrategy"]
+    print("Deployed addresses match our predictions")
+
+
+def test_predicted_release_registry_vault(
+    ReleaseRegistry,
+    new_registry,
+    gov,
+    token,
+    guardian,
+    rewards,
+):
+    release_registry = ReleaseRegistry.at(new_registry.releaseRegistry())
+    salt = "0x" + "69" * 32
+
+    # our salt is scoped to the deployer, so different callers get different addresses
+    predicted = release_registry.predictVaultAddress(gov, token, salt, 0)
+    assert release_registry.predictVaultAddress(guardian, token, salt, 0) != predicted
+
+    tx = release_registry.newVaultDeterministic(
+        token, gov, guardian, rewards, "", "", 0, salt, {"from": gov}
+    )
+    vault = Contract(tx.return_value)
+    assert vault.address == predicted
+    assert tx.events["NewClone"]["vault"] == predicted
+    assert vault.token() == token.address
+    assert vault.governance() == gov.address
+
+    # can't deploy the same vault twice
+    with brownie.reverts("already deployed"):
+        release_registry.newVaultDeterministic(
+            token, gov, guardian, rewards, "", "", 0, salt, {"from": gov}
+        )
+
+    # but anyone else can use the same salt
+    tx = release_registry.newVaultDeterministic(
+        token, gov, guardian, rewards, "", "", 0, salt, {"from": guardian}
+    )
+    assert tx.return_value != predicted
+
+    # our release is part of our salt, so an older release never collides with our latest
+    if release_registry.numReleases() > 1:
+        older = release_registry.predictVaultAddress(gov, token, salt, 1)
+        assert older != predicted
+        tx = release_registry.newVaultDeterministic(
+            token, gov, guardian, rewards, "", "", 1, salt, {"from": gov}
+        )
+        assert tx.return_value == older
+
+
+# our vault registry should only deploy deterministically when its release registry supports it
+def test_registry_vault_deployment_detection(
+    VaultRegistry,
+    ReleaseRegistry,
+    MockLegacyReleaseRegistry,
+    new_registry,
+    old_registry,
+    gov,
+    accounts,
+    token,
+    guardian,
+    rewards,
+    tests_using_tenderly,
+):
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(gov, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(gov, True, {"from": registry_owner})
+
+    # our current release registry is deterministic, keyed by token, release and type
+    predicted = new_registry.predictVaultAddress(token, 0, 1)
+    assert predicted != ZERO_ADDRESS
+    tx = new_registry.newVault(
+        token, gov, guardian, rewards, "", "", 0, 1, {"from": gov}
+    )
+    assert tx.return_value == predicted
+
+    # deploying the same token, type and release again collides instead of silently moving
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            new_registry.newVault(
+                token, gov, guardian, rewards, "", "", 0, 1, {"from": gov}
+            )
+
+    # older release registries can't predict, so we use their plain newVault()
+    release_registry = ReleaseRegistry.at(new_registry.releaseRegistry())
+    legacy_release_registry = gov.deploy(MockLegacyReleaseRegistry, release_registry)
+    legacy_registry = gov.deploy(VaultRegistry, legacy_release_registry, old_registry)
+    legacy_registry.setApprovedVaultsOwner(gov, True, {"from": gov})
+    legacy_registry.setVaultEndorsers(gov, True, {"from": gov})
+    assert legacy_registry.predictVaultAddress(token, 0, 1) == ZERO_ADDRESS
+    tx = legacy_registry.newVault(
+        token, gov, guardian, rewards, "", "", 0, 1, {"from": gov}
+    )
+    assert legacy_registry.latestVaultOfType(token, 1) == tx.return_value
@@ -0,0 +1,103 @@
+import brownie
+from brownie import ZERO_ADDRESS
+
+# keep each transaction well under the block gas limit
+POOLS_PER_TX = 25
+
+# convex pids for our mock frax pools start here, just to keep them distinct from frax pids
+FIRST_CONVEX_PID = 1_000
+
+
+def estimate(fn, *args):
+    # a full scan can blow past the block gas limit, so report that instead of failing
+    try:
+        return fn.estimate_gas(*args)
+    except Exception:
+        return None
+
+
+def deploy_factory(CurveGlobal, registry, gov):
+    factory = gov.deploy(
+        CurveGlobal, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, gov
+    )
+    factory.setConvexFraxPoolRegistry(registry, {"from": gov})
+    return factory
+
+
+# compare our convex pid -> frax pool lookup with and without the index against a mock registry
+def test_frax_index_benchmark(CurveGlobal, MockConvexFraxPoolRegistry, gov):
+    num_pools = 400
+    mock_registry = gov.deploy(MockConvexFraxPoolRegistry)
+    while mock_registry.poolLength() < num_pools:
+        mock_registry.addPools(
+            FIRST_CONVEX_PID + mock_registry.poolLength(),
+            POOLS_PER_TX,
+            {"from": gov},
+        )
+
+    # our oldest pool is the worst case for the reverse scan
+    oldest_convex_pid = FIRST_CONVEX_PID
+    unindexed = deploy_factory(CurveGlobal, mock_registry, gov)
+    scan_cost = estimate(unindexed.getFraxInfo, oldest_convex_pid)
+
+    factory = deploy_factory(CurveGlobal, mock_registry, gov)
+    while factory.numFraxPidsIndexed(mock_registry) < num_pools:
+        factory.syncFraxPools(POOLS_PER_TX, {"from": gov})
+    index_cost = estimate(factory.getFraxInfo, oldest_convex_pid)
+
+    info = factory.getFraxInfo(oldest_convex_pid)
+    assert info[0]
+    assert info[1] == 0
+    assert info[2] == mock_registry.poolInfo(0)[1]
+    assert factory.getFraxInfo(FIRST_CONVEX_PID + num_pools - 1)[1] == num_pools - 1
+
+    print(
+        f"\n{num_pools} frax pools, getFraxInfo gas. Scan: {scan_cost}, Index: {index_cost}"
+    )
+    if scan_cost is not None:
+        assert index_cost < scan_cost
+
+    # a convex pid without a frax pool shouldn't cost us a scan either
+    assert not factory.getFraxInfo(1)[0]
+    assert estimate(factory.getFraxInfo, 1) < 50_000
+
+
+def test_frax_index_tail_and_deactivation(
+    CurveGlobal, MockConvexFraxPoolRegistry, gov, accounts
+):
+    rando = accounts[5]
+    mock_registry = gov.deploy(MockConvexFraxPoolRegistry)
+    mock_registry.addPools(FIRST_CONVEX_PID, 5, {"from": gov})
+
+    # staking tokens without convexPoolId are skipped without reverting
+    mock_registry.addPool(1, False, {"from": gov})
+
+    factory = deploy_factory(CurveGlobal, mock_registry, gov)
+    factory.syncFraxPools(3, {"from": rando})
+    assert factory.numFraxPidsIndexed(mock_registry) == 3
+    factory.syncFraxPools(100, {"from": rando})
+    assert factory.numFraxPidsIndexed(mock_registry) == 6
+    assert not factory.getFraxInfo(1)[0]
+
+    # pools added after our last sync are still found via the scan
+    mock_registry.addPool(FIRST_CONVEX_PID + 2, True, {"from": gov})
+    assert factory.getFraxInfo(FIRST_CONVEX_PID + 2)[1] == 6
+
+    # if that newer pool is deactivated after syncing, we fall back to the older one
+    factory.syncFraxPools(100, {"from": rando})
+    assert factory.getFraxInfo(FIRST_CONVEX_PID + 2)[1] == 6
+    mock_registry.setActive(6, False, {"from": gov})
+    assert factory.getFraxInfo(FIRST_CONVEX_PID + 2)[1] == 2
+
+    # and if none are active, there's no frax pool
+    mock_registry.setActive(2, False, {"from": gov})
+    assert not factory.getFraxInfo(FIRST_CONVEX_PID + 2)[0]
+
+    # pools that are inactive when we sync are still indexed, so reactivating them works
+    new_pid = mock_registry.addPool(FIRST_CONVEX_PID + 3, True, {"from": gov}).return_value
+    mock_registry.setActive(new_pid, False, {"from": gov})
+    factory.syncFraxPools(100, {"from": rando})
+    assert factory.numFraxPidsIndexed(mock_registry) == new_pid + 1
+    assert factory.getFraxInfo(FIRST_CONVEX_PID + 3)[1] == 3
+    mock_registry.setActive(new_pid, True, {"from": gov})
+    assert factory.getFraxInfo(FIRST_CONVEX_PID + 3)[1] == new_pid
@@ -0,0 +1,79 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+def test_gauge_preflight(
+    curve_global,
+    gov,
+    accounts,
+    pid,
+    new_registry,
+    gauge,
+    new_proxy,
+    voter,
+    whale,
+    token,
+    steth_gauge,
+    steth_lp,
+    MockEmptyFallback,
+):
+    # for most pids below 100, we already have a vault, and any legacy vault will revert when trying to deploy permissionlessly
+    if pid < 100:
+        print("PID less than 100, skipping permissionless vault testing")
+        return
+
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(curve_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(curve_global, True, {"from": registry_owner})
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    new_proxy.setFactory(curve_global.address, {"from": gov})
+
+    # our whale isn't a contract, our lp token isn't a gauge, and our empty fallback returns
+    #  nothing we can decode; none of these should revert
+    empty_fallback = gov.deploy(MockEmptyFallback)
+    gauges = [gauge, steth_gauge, whale, token, empty_fallback]
+    tx = curve_global.gaugePreflight.transact(gauges, {"from": whale})
+    print("Preflight gas for", len(gauges), "gauges:", tx.gas_used)
+    results = curve_global.gaugePreflight(gauges)
+    assert [result["gauge"] for result in results] == gauges
+
+    # each result should match our individual views
+    for result in results[:2]:
+        fraxInfo = curve_global.getFraxInfo(result["pid"])
+        assert result["lpToken"] == Contract(result["gauge"]).lp_token()
+        assert result["pid"] == curve_global.getPid(result["gauge"])
+        assert result[
+            "canCreateVaultPermissionlessly"
+        ] == curve_global.canCreateVaultPermissionlessly(result["gauge"])
+        assert result[
+            "strategyProxyHasGauge"
+        ] == curve_global.doesStrategyProxyHaveGauge(result["gauge"])
+        assert result["hasFraxPool"] == fraxInfo[0]
+        assert result["convexFraxPid"] == fraxInfo[1]
+        assert result["stakingAddress"] == fraxInfo[2]
+        assert result["gaugeWeight"] > 0
+
+    assert results[0]["pid"] == pid
+    assert results[0]["lpToken"] == token.address
+    assert results[0]["canCreateVaultPermissionlessly"]
+    assert not results[0]["strategyProxyHasGauge"]
+
+    # stETH already has a vault
+    assert results[1]["lpToken"] == steth_lp.address
+    assert not results[1]["canCreateVaultPermissionlessly"]
+
+    # bad gauges come back empty
+    for result in results[2:]:
+        assert result["lpToken"] == ZERO_ADDRESS
+        assert result["gaugeWeight"] == 0
+        assert not result["canCreateVaultPermissionlessly"]
+        assert not result["strategyProxyHasGauge"]
+        assert result["pid"] == 2**256 - 1
+        assert not result["hasFraxPool"]
+
+    # once our vault is deployed, our preflight should reflect that
+    curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    result = curve_global.gaugePreflight([gauge])[0]
+    assert not result["canCreateVaultPermissionlessly"]
+    assert result["strategyProxyHasGauge"]
@@ -0,0 +1,104 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+def test_keeper_lens(
+    KeeperLens,
+    curve_global,
+    gov,
+    accounts,
+    pid,
+    new_registry,
+    gauge,
+    new_proxy,
+    voter,
+    whale,
+    gasOracle,
+    strategist_ms,
+    crv,
+    convexToken,
+    PriceCache,
+    MockPriceOracle,
+    chain,
+):
+    # for most pids below 100, we already have a vault, and any legacy vault will revert when trying to deploy permissionlessly
+    if pid < 100:
+        print("PID less than 100, skipping permissionless vault testing")
+        return
+
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(curve_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(curve_global, True, {"from": registry_owner})
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    new_proxy.setFactory(curve_global.address, {"from": gov})
+    gasOracle.setMaxAcceptableBaseFee(10000 * 1e9, {"from": strategist_ms})
+
+    lens = gov.deploy(KeeperLens)
+    assert lens.workableStrategies(curve_global, 0, 10, 0) == []
+
+    tx = curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    event = tx.events["NewAutomatedVault"]
+    vault = Contract(event["vault"])
+    vault.acceptGovernance({"from": gov})
+    convex_strategy = Contract(event["convexStrategy"])
+    curve_strategy = Contract(event["curveStrategy"])
+
+    # nothing has been deposited, so nothing should be workable yet
+    assert lens.workableStrategies(curve_global, 0, 10, 0) == []
+
+    # force our convex and curve strategies to trigger
+    convex_strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    curve_strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+
+    workable = lens.workableStrategies(curve_global, 0, 10, 0)
+    gas = lens.workableStrategies.estimate_gas(curve_global, 0, 10, 0)
+    print("Workable strategies:", workable, "gas:", gas)
+    assert len(workable) == 2
+    assert workable[0]["vault"] == vault.address
+    assert workable[0]["strategy"] == convex_strategy.address
+    assert workable[0]["hasClaimableProfit"]
+    claimable_profit = convex_strategy.claimableProfitInUsdc()
+    assert workable[0]["claimableProfitInUsdc"] == claimable_profit
+
+    # our curve strategy doesn't have claimableProfitInUsdc, but shouldn't break our lens
+    assert workable[1]["strategy"] == curve_strategy.address
+    assert not workable[1]["hasClaimableProfit"]
+    assert workable[1]["claimableProfitInUsdc"] == 0
+
+    # pages past our last vault come back empty
+    assert lens.workableStrategies(curve_global, 1, 10, 0) == []
+
+    # point our convex strategy at a price cache, and count oracle reads during a scan
+    oracle = gov.deploy(MockPriceOracle)
+    oracle.setPrice(crv, 1e6, {"from": gov})
+    oracle.setPrice(convexToken, 2e6, {"from": gov})
+    cache = gov.deploy(PriceCache, oracle, 0)
+    convex_strategy.setPriceOracle(cache, {"from": gov})
+    assert cache.getPriceUsdcRecommended(crv) == 1e6
+
+    # without caching, each trigger and profit check reads our oracle for both tokens
+    tx = lens.workableStrategies.transact(curve_global, 0, 10, 0, {"from": whale})
+    plain_calls = len([c for c in tx.subcalls if c["to"] == oracle.address])
+
+    # caching for the block first means one oracle read per token for the whole scan
+    tokens = [crv, convexToken]
+    tx = lens.workableStrategiesWithPrices(
+        curve_global, 0, 10, 0, cache, tokens, {"from": whale}
+    )
+    cached_calls = len([c for c in tx.subcalls if c["to"] == oracle.address])
+    print("Oracle calls, plain scan:", plain_calls, "cached scan:", cached_calls)
+    assert plain_calls == 4
+    assert cached_calls == len(tokens)
+    assert [w["strategy"] for w in tx.return_value] == [
+        convex_strategy.address,
+        curve_strategy.address,
+    ]
+
+    # block-only prices aren't reused in later blocks, and anyone can cache them
+    assert cache.isPriceFresh(crv)
+    chain.sleep(1)
+    chain.mine(1)
+    assert not cache.isPriceFresh(crv)
+    oracle.setPrice(crv, 3e6, {"from": gov})
+    assert cache.getPriceUsdcRecommended(crv) == 3e6
@@ -0,0 +1,53 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+def test_legacy_snapshot(
+    new_registry,
+    old_registry,
+    gov,
+    accounts,
+    whale,
+    token,
+    steth_lp,
+    tests_using_tenderly,
+):
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    legacy_steth = new_registry.latestVaultOfType(steth_lp, 0)
+    legacy_token = new_registry.latestVaultOfType(token, 0)
+    assert legacy_steth != ZERO_ADDRESS
+
+    # only our owner can import or flip our switch
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            new_registry.importLegacyVaults([steth_lp], {"from": whale})
+        with brownie.reverts():
+            new_registry.setUseLegacySnapshot(True, {"from": whale})
+
+    tx = new_registry.latestVaultOfType.transact(steth_lp, 0, {"from": whale})
+    legacy_gas = tx.gas_used
+
+    new_registry.importLegacyVaults([steth_lp, token], {"from": registry_owner})
+    assert new_registry.legacySnapshot(steth_lp) == (legacy_steth, True)
+    assert new_registry.legacySnapshot(token) == (legacy_token, True)
+
+    # importing alone doesn't change where we read from
+    assert not new_registry.useLegacySnapshot()
+    new_registry.setUseLegacySnapshot(True, {"from": registry_owner})
+
+    tx = new_registry.latestVaultOfType.transact(steth_lp, 0, {"from": whale})
+    snapshot_gas = tx.gas_used
+    print("Legacy registry lookup gas:", legacy_gas)
+    print("Snapshot lookup gas:", snapshot_gas)
+    assert snapshot_gas < legacy_gas
+
+    assert new_registry.latestVaultOfType(steth_lp, 0) == legacy_steth
+    assert new_registry.latestVaultOfType(token, 0) == legacy_token
+    assert new_registry.latestVault(steth_lp) == legacy_steth
+
+    # tokens we haven't imported still fall back to our legacy registry
+    legacy_token_count = old_registry.numTokens()
+    other_token = old_registry.tokens(legacy_token_count - 1)
+    assert new_registry.latestVaultOfType(other_token, 0) == old_registry.latestVault(
+        other_token
+    )
@@ -0,0 +1,102 @@
+import brownie
+from brownie import ZERO_ADDRESS
+
+# gas limit for a single transaction to fill our mock booster or sync our index
+POOLS_PER_TX = 50
+
+
+def estimate(fn, *args):
+    # a full scan can blow past the block gas limit, so report that instead of failing
+    try:
+        return fn.estimate_gas(*args)
+    except Exception:
+        return None
+
+
+def sync_all(factory, booster, gov):
+    while factory.numPidsIndexed(booster) < booster.poolLength():
+        factory.syncPids(POOLS_PER_TX, {"from": gov})
+
+
+# compare our gauge -> pid lookup with and without the index against a mock booster
+def test_pid_index_benchmark(CurveGlobal, MockConvexBooster, gov):
+    mock_booster = gov.deploy(MockConvexBooster)
+    factory = gov.deploy(
+        CurveGlobal, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, gov
+    )
+    factory.setBooster(mock_booster, {"from": gov})
+
+    indexed_costs = []
+    for num_pools in [100, 500, 1000]:
+        while mock_booster.poolLength() < num_pools:
+            mock_booster.addPools(POOLS_PER_TX, {"from": gov})
+
+        # our oldest pool is the worst case for the reverse scan
+        oldest_gauge = mock_booster.poolInfo(0)[2]
+        newest_gauge = mock_booster.poolInfo(num_pools - 1)[2]
+
+        # deploy a fresh factory each time so nothing is indexed yet
+        unindexed = gov.deploy(
+            CurveGlobal, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, gov
+        )
+        unindexed.setBooster(mock_booster, {"from": gov})
+        scan_cost = estimate(unindexed.getPid, oldest_gauge)
+
+        sync_all(factory, mock_booster, gov)
+        assert factory.numPidsIndexed(mock_booster) == num_pools
+        assert factory.getPid(oldest_gauge) == 0
+        assert factory.getPid(newest_gauge) == num_pools - 1
+        index_cost = estimate(factory.getPid, oldest_gauge)
+        indexed_costs.append(index_cost)
+
+        print(
+            f"\n{num_pools} pools, getPid gas. Scan: {scan_cost}, Index: {index_cost}"
+        )
+        if scan_cost is not None:
+            assert index_cost < scan_cost
+
+    # with everything indexed, our lookup cost shouldn't grow with the number of pools
+    assert max(indexed_costs) - min(indexed_costs) < 1_000
+
+
+def test_pid_index_tail_and_shutdown(CurveGlobal, MockConvexBooster, gov, accounts):
+    rando = accounts[5]
+    mock_booster = gov.deploy(MockConvexBooster)
+    factory = gov.deploy(
+        CurveGlobal, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, ZERO_ADDRESS, gov
+    )
+    factory.setBooster(mock_booster, {"from": gov})
+    mock_booster.addPools(10, {"from": gov})
+
+    # anyone can sync, and we can do it in pieces
+    factory.syncPids(4, {"from": rando})
+    assert factory.numPidsIndexed(mock_booster) == 4
+    factory.syncPids(100, {"from": rando})
+    assert factory.numPidsIndexed(mock_booster) == 10
+
+    # syncing when we're already caught up shouldn't do anything
+    factory.syncPids(100, {"from": rando})
+    assert factory.numPidsIndexed(mock_booster) == 10
+
+    # pools added after our last sync are still found via the scan
+    new_gauge = "0x000000000000000000000000000000000000dEaD"
+    mock_booster.addPool(new_gauge, new_gauge, {"from": gov})
+    assert factory.getPid(new_gauge) == 10
+
+    # gauges that aren't on convex return max uint
+    assert factory.getPid(gov) == 2**256 - 1
+
+    # if convex shuts down a pool and re-adds it, the newer pool wins, indexed or not
+    old_gauge = mock_booster.poolInfo(3)[2]
+    mock_booster.shutdownPool(3, {"from": gov})
+    assert factory.getPid(old_gauge) == 2**256 - 1
+    mock_booster.addPool(old_gauge, old_gauge, {"from": gov})
+    assert factory.getPid(old_gauge) == 11
+    factory.syncPids(100, {"from": rando})
+    assert factory.getPid(old_gauge) == 11
+
+    # changing our booster starts a new index
+    other_booster = gov.deploy(MockConvexBooster)
+    factory.setBooster(other_booster, {"from": gov})
+    assert factory.numPidsIndexed(other_booster) == 0
+    assert factory.getPid(old_gauge) == 2**256 - 1
@@ -0,0 +1,117 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+from eth_abi import encode_abi
+
+
+def test_bulk_new_vaults(
+    ReleaseRegistry,
+    new_registry,
+    gov,
+    accounts,
+    token,
+    steth_lp,
+    guardian,
+    rewards,
+    whale,
+    tests_using_tenderly,
+):
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(gov, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(gov, True, {"from": registry_owner})
+
+    # only endorsers can deploy, and only for approved vault owners
+    if not tests_using_tenderly:
+        with brownie.reverts("unauthorized"):
+            new_registry.newVaults(
+                [token], gov, guardian, rewards, 0, 1, {"from": whale}
+            )
+        with brownie.reverts("not allowed vault owner"):
+            new_registry.newVaults(
+                [token], whale, guardian, rewards, 0, 1, {"from": gov}
+            )
+        with brownie.reverts("unauthorized"):
+            new_registry.newVaultFromBatch(
+                token, gov, guardian, rewards, 0, 1, {"from": gov}
+            )
+
+    # our second token is a duplicate, and our whale isn't a token at all
+    tokens = [token, token, steth_lp, whale]
+    tx = new_registry.newVaults(tokens, gov, guardian, rewards, 0, 1, {"from": gov})
+    vaults = tx.return_value
+    print("Bulk newVaults gas:", tx.gas_used)
+
+    assert vaults[0] == new_registry.latestVaultOfType(token, 1)
+
+    # each vault is deployed with the same salt as newVault(), so we can predict it
+    release_registry = ReleaseRegistry.at(new_registry.releaseRegistry())
+    vault_salt = "0x" + "00" * 31 + "01"
+    assert vaults[0] == release_registry.predictVaultAddress(
+        new_registry, token, vault_salt, 0
+    )
+    assert vaults[1] == ZERO_ADDRESS
+    assert vaults[2] == new_registry.latestVaultOfType(steth_lp, 1)
+    assert vaults[3] == ZERO_ADDRESS
+    assert len(tx.events["NewVault"]) == 2
+    assert len(tx.events["VaultCreationSkipped"]) == 2
+    assert tx.events["VaultCreationSkipped"][0]["token"] == token
+    assert tx.events["VaultCreationSkipped"][1]["token"] == whale
+
+
+def test_bulk_endorse_vaults(
+    ReleaseRegistry,
+    new_registry,
+    gov,
+    accounts,
+    token,
+    steth_lp,
+    guardian,
+    rewards,
+    whale,
+    tests_using_tenderly,
+):
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(gov, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(gov, True, {"from": registry_owner})
+    release_registry = ReleaseRegistry.at(new_registry.releaseRegistry())
+
+    # deploy some vaults straight from our release registry, one of them owned by our whale
+    good_vaults = []
+    for lp in [token, steth_lp]:
+        tx = release_registry.newVault(
+            lp, gov, guardian, rewards, "", "", 0, {"from": gov}
+        )
+        good_vaults.append(tx.return_value)
+    tx = release_registry.newVault(
+        token, whale, guardian, rewards, "", "", 0, {"from": whale}
+    )
+    bad_vault = tx.return_value
+
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            new_registry.endorseVaults(good_vaults, [0, 0], {"from": whale})
+        with brownie.reverts("length mismatch"):
+            new_registry.endorseVaults(good_vaults, [0], {"from": gov})
+        with brownie.reverts():
+            new_registry.endorseVaultFromBatch(
+                good_vaults[0], "0.4.5", 1, {"from": gov}
+            )
+
+    # our bad vault has the wrong governance, and nothing exists 100 releases ago
+    vaults = good_vaults + [bad_vault, good_vaults[0]]
+    deltas = [0, 0, 0, 100]
+    tx = new_registry.endorseVaults(vaults, deltas, {"from": gov})
+    print("Bulk endorse gas:", tx.gas_used)
+    assert tx.return_value == [True, True, False, False]
+    assert len(tx.events["VaultEndorsementSkipped"]) == 2
+
+    # our unknown release is reported the same way as a revert
+    reason = "0x08c379a0" + encode_abi(["string"], ["unknown release"]).hex()
+    assert tx.events["VaultEndorsementSkipped"][1]["reason"] == reason
+    for vault in good_vaults:
+        assert new_registry.isVaultEndorsed(vault)
+        assert new_registry.vaultType(vault) == new_registry.DEFAULT_VAULT_TYPE()
+    assert not new_registry.isVaultEndorsed(bad_vault)
+
+    # endorsing the same vaults again should skip them all without reverting
+    tx = new_registry.endorseVaults(good_vaults, [0, 0], [2, 2], {"from": gov})
+    assert tx.return_value == [False, False]
@@ -0,0 +1,41 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+# our latest vault of each type should be a single read, no matter how many vaults a token has
+def test_latest_vault_of_type_gas(
+    new_registry,
+    gov,
+    accounts,
+    token,
+    guardian,
+    rewards,
+):
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(gov, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(gov, True, {"from": registry_owner})
+
+    # type 1 is our oldest vault, so the old backwards scan would have to walk past every other vault
+    gas_used = []
+    vault_type = 1
+    for target in [1, 10, 50]:
+        while vault_type <= target:
+            new_registry.newVault(
+                token, gov, guardian, rewards, "", "", 0, vault_type, {"from": gov}
+            )
+            vault_type += 1
+        assert new_registry.numVaults(token) == target
+
+        tx = new_registry.latestVaultOfType.transact(token, 1, {"from": gov})
+        gas_used.append(tx.gas_used)
+        print("latestVaultOfType gas with", target, "vaults:", tx.gas_used)
+
+    assert max(gas_used) - min(gas_used) < 1_000
+
+    # every type should point at its one vault, and our latest vault is the last one we deployed
+    for i in range(new_registry.numVaults(token)):
+        vault = new_registry.vaults(token, i)
+        assert new_registry.latestByType(token, i + 1) == vault
+        assert new_registry.latestVaultOfType(token, i + 1) == vault
+    assert new_registry.latestVault(token) == new_registry.vaults(token, 49)
+    assert new_registry.latestVaultOfType(token, 51) == ZERO_ADDRESS
@@ -0,0 +1,46 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+def test_token_vaults_page(
+    new_registry,
+    gov,
+    accounts,
+    token,
+    steth_lp,
+    guardian,
+    rewards,
+):
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(gov, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(gov, True, {"from": registry_owner})
+
+    # nothing registered yet
+    assert new_registry.tokenVaultsPage(0, 10) == []
+
+    # two vaults for our first token, one for our second
+    for vault_type in [1, 2]:
+        new_registry.newVault(
+            token, gov, guardian, rewards, "", "", 0, vault_type, {"from": gov}
+        )
+    new_registry.newVault(steth_lp, gov, guardian, rewards, "", "", 0, 2, {"from": gov})
+    assert new_registry.numTokens() == 2
+
+    page = new_registry.tokenVaultsPage(0, 10)
+    assert len(page) == 2
+    assert page[0]["token"] == token.address
+    assert list(page[0]["vaults"]) == [
+        new_registry.vaults(token, 0),
+        new_registry.vaults(token, 1),
+    ]
+    assert list(page[0]["types"]) == [1, 2]
+    assert list(page[0]["endorsed"]) == [True, True]
+    assert page[1]["token"] == steth_lp.address
+    assert list(page[1]["vaults"]) == [new_registry.vaults(steth_lp, 0)]
+    assert list(page[1]["types"]) == [2]
+
+    # our pages are clamped to the number of tokens we have
+    assert new_registry.tokenVaultsPage(1, 2**256 - 1) == [page[1]]
+    assert new_registry.tokenVaultsPage(0, 1) == [page[0]]
+    assert new_registry.tokenVaultsPage(2, 10) == []
+    assert new_registry.tokenVaultsPage(0, 0) == []
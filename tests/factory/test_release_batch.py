@@ -0,0 +1,59 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS, config
+
+
+def test_release_registry_batch_clones(
+    ReleaseRegistry,
+    new_registry,
+    gov,
+    token,
+    steth_lp,
+    guardian,
+    rewards,
+    pm,
+):
+    release_registry = ReleaseRegistry.at(new_registry.releaseRegistry())
+    Vault = pm(config["dependencies"][0]).Vault
+    tokens = [token, steth_lp]
+    salt = "0x" + "69" * 32
+
+    # baseline, one vault per transaction
+    single_gas = 0
+    for lp in tokens:
+        tx = release_registry.newVault(
+            lp, gov, guardian, rewards, "", "", 0, {"from": gov}
+        )
+        single_gas += tx.gas_used
+
+    tx = release_registry.newVaults(
+        tokens, gov, guardian, rewards, 0, salt, {"from": gov}
+    )
+    print("Individual newVault gas for", len(tokens), "vaults:", single_gas)
+    print("Batch newVaults gas for", len(tokens), "vaults:", tx.gas_used)
+    assert tx.gas_used < single_gas
+
+    vaults = tx.return_value
+    assert len(vaults) == len(tokens)
+    assert [event["vault"] for event in tx.events["NewClone"]] == list(vaults)
+
+    # every vault should be predictable, and fully initialized on our latest release
+    for lp, vault_address in zip(tokens, vaults):
+        assert vault_address == release_registry.predictVaultAddress(gov, lp, salt, 0)
+        vault = Vault.at(vault_address)
+        assert vault.token() == lp.address
+        assert vault.governance() == gov.address
+        assert vault.guardian() == guardian.address
+        assert vault.rewards() == rewards.address
+        assert vault.apiVersion() == release_registry.latestRelease()
+
+    # can't deploy the same vaults twice with the same salt
+    with brownie.reverts("already deployed"):
+        release_registry.newVaults(
+            tokens, gov, guardian, rewards, 0, salt, {"from": gov}
+        )
+
+    # can't target a release we don't have
+    with brownie.reverts():
+        release_registry.newVaults(
+            tokens, gov, guardian, rewards, 1, salt, {"from": gov}
+        )
@@ -0,0 +1,56 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+def test_deployed_vault_pages(
+    curve_global,
+    gov,
+    accounts,
+    pid,
+    new_registry,
+    gauge,
+    new_proxy,
+    voter,
+    whale,
+    token,
+):
+    # for most pids below 100, we already have a vault, and any legacy vault will revert when trying to deploy permissionlessly
+    if pid < 100:
+        print("PID less than 100, skipping permissionless vault testing")
+        return
+
+    # once our factory is deployed, setup the factory from gov
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(curve_global, True, {"from": registry_owner})
+    new_registry.setVaultEndorsers(curve_global, True, {"from": registry_owner})
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    new_proxy.setFactory(curve_global.address, {"from": gov})
+
+    # nothing deployed yet
+    assert curve_global.deployedVaultsPage(0, 10) == []
+    assert curve_global.deployedVaultsInfo(0, 10) == []
+
+    tx = curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    event = tx.events["NewAutomatedVault"]
+    vault = Contract(event["vault"])
+    assert curve_global.gaugeOfVault(vault) == gauge
+
+    # our pages are clamped to the number of vaults we have
+    assert curve_global.deployedVaultsPage(0, 10) == [vault.address]
+    assert curve_global.deployedVaultsPage(0, 2**256 - 1) == [vault.address]
+    assert curve_global.deployedVaultsPage(0, 0) == []
+    assert curve_global.deployedVaultsPage(1, 10) == []
+    assert curve_global.deployedVaultsPage(0, 10) == curve_global.allDeployedVaults()
+
+    info = curve_global.deployedVaultsInfo(0, 10)
+    assert len(info) == 1
+    assert info[0]["vault"] == vault.address
+    assert info[0]["gauge"] == gauge.address
+    assert info[0]["lpToken"] == token.address
+
+    # strategies come from our vault's withdrawal queue, in order
+    strategies = [event["convexStrategy"], event["curveStrategy"]]
+    if event["convexFraxStrategy"] != ZERO_ADDRESS:
+        strategies.append(event["convexFraxStrategy"])
+    assert list(info[0]["strategies"]) == strategies
+    print("Vault info:", info[0])
@@ -361,3 +361,164 @@ def test_cloning(
     else:
         assert token.balanceOf(whale) >= startingWhale
     assert vault.pricePerShare() >= before_pps
+
+
+# test cloning with a full config struct, make sure everything is set up in our single initialize call
+def test_cloning_with_config(
+    StrategyConvexFactoryClonable,
+    StrategyCurveBoostedFactoryClonable,
+    StrategyConvexFraxFactoryClonable,
+    gov,
+    vault,
+    rewards,
+    keeper,
+    strategist,
+    strategy,
+    new_proxy,
+    new_trade_factory,
+    booster,
+    convexToken,
+    healthCheck,
+    pid,
+    gauge,
+    which_strategy,
+    staking_address,
+    frax_pid,
+    frax_booster,
+    tests_using_tenderly,
+    is_clonable,
+    voter,
+):
+
+    # skip this test if we don't clone
+    if not is_clonable:
+        return
+
+    base_fee_oracle = strategist
+    convex_voter = rewards
+    frax_voter = keeper
+
+    # leaving our price oracle empty should default to yearn's lens oracle
+    yearn_oracle = "0x83d95e0D5f402511dB06817Aff3f9eA88224B030"
+
+    if which_strategy == 0:  # convex
+        config = [
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            pid,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            booster,
+            convexToken,
+            healthCheck,
+            base_fee_oracle,
+            voter,
+            convex_voter,
+            69,
+            420,
+            ZERO_ADDRESS,
+        ]
+        predicted = strategy.predictStrategyConvexAddress(gov, vault, booster, pid)
+        tx = strategy.cloneStrategyConvexWithConfig(config, {"from": gov})
+        newStrategy = StrategyConvexFactoryClonable.at(tx.return_value)
+        clone_function = newStrategy.cloneStrategyConvexWithConfig
+        template_clone_function = strategy.cloneStrategyConvexWithConfig
+        assert newStrategy.pid() == pid
+        assert newStrategy.convexVoter() == convex_voter
+        assert newStrategy.localKeepCVX() == 420
+        assert newStrategy.priceOracle() == yearn_oracle
+    elif which_strategy == 1:  # curve
+        config = [
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            new_proxy,
+            gauge,
+            healthCheck,
+            base_fee_oracle,
+            voter,
+            69,
+        ]
+        predicted = strategy.predictStrategyCurveBoostedAddress(
+            gov, vault, new_proxy, gauge
+        )
+        tx = strategy.cloneStrategyCurveBoostedWithConfig(config, {"from": gov})
+        newStrategy = StrategyCurveBoostedFactoryClonable.at(tx.return_value)
+        clone_function = newStrategy.cloneStrategyCurveBoostedWithConfig
+        template_clone_function = strategy.cloneStrategyCurveBoostedWithConfig
+        assert newStrategy.gauge() == gauge
+        assert newStrategy.proxy() == new_proxy
+    else:  # frax
+        config = [
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            frax_pid,
+            staking_address,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            frax_booster,
+            healthCheck,
+            base_fee_oracle,
+            voter,
+            convex_voter,
+            frax_voter,
+            69,
+            420,
+            42,
+            ZERO_ADDRESS,
+        ]
+        predicted = strategy.predictStrategyConvexFraxAddress(
+            gov, vault, frax_booster, staking_address, frax_pid
+        )
+        tx = strategy.cloneStrategyConvexFraxWithConfig(config, {"from": gov})
+        newStrategy = StrategyConvexFraxFactoryClonable.at(tx.return_value)
+        clone_function = newStrategy.cloneStrategyConvexFraxWithConfig
+        template_clone_function = strategy.cloneStrategyConvexFraxWithConfig
+        assert newStrategy.fraxPid() == frax_pid
+        assert newStrategy.convexVoter() == convex_voter
+        assert newStrategy.fraxVoter() == frax_voter
+        assert newStrategy.localKeepCVX() == 420
+        assert newStrategy.localKeepFXS() == 42
+        assert newStrategy.priceOracle() == yearn_oracle
+    print("Clone and full setup gas used:", tx.gas_used)
+
+    # config clones are deployed with CREATE2, so we know where they'll land ahead of time
+    assert newStrategy.address == predicted
+
+    # everything the factory used to set with follow-up calls should already be in place
+    assert newStrategy.vault() == vault
+    assert newStrategy.strategist() == strategist
+    assert newStrategy.rewards() == rewards
+    assert newStrategy.keeper() == keeper
+    assert newStrategy.tradeFactory() == new_trade_factory
+    assert newStrategy.healthCheck() == healthCheck
+    assert newStrategy.baseFeeOracle() == base_fee_oracle
+    assert newStrategy.curveVoter() == voter
+    assert newStrategy.localKeepCRV() == 69
+
+    # tenderly doesn't work for "with brownie.reverts"
+    if not tests_using_tenderly:
+        # Shouldn't be able to call initialize again
+        with brownie.reverts():
+            newStrategy.initializeWithConfig(config, {"from": gov})
+
+        ## shouldn't be able to clone a clone
+        with brownie.reverts():
+            clone_function(config, {"from": gov})
+
+        # each deployer only gets one config clone per vault
+        with brownie.reverts():
+            template_clone_function(config, {"from": gov})
+
+        # keeps still need a voter. use a fresh deployer so we don't collide with our first clone
+        config[config.index(voter)] = ZERO_ADDRESS
+        with brownie.reverts():
+            template_clone_function(config, {"from": strategist})
@@ -0,0 +1,91 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+# our hot paths should only touch our own kek records, no matter how long frax's stake history gets
+def test_frax_kek_ring(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    which_strategy,
+    staking_address,
+    accounts,
+):
+    if which_strategy != 2:
+        return
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount / 20, {"from": whale})
+    chain.sleep(1)
+    chain.mine(1)
+    strategy.harvest({"from": gov})
+
+    # our ring should match frax's record of our first kek: id, start, amount, end, multiplier
+    user_vault = Contract(strategy.userVault())
+    staking_contract = Contract(staking_address)
+    kek = strategy.kekInfo(0)
+    stake = staking_contract.lockedStakesOf(user_vault)[0]
+    assert kek["kekId"] == stake[0]
+    assert kek["amount"] == stake[2]
+    assert kek["endingTimestamp"] == stake[3]
+    with brownie.reverts("!ring"):
+        strategy.kekInfo(1)
+    with brownie.reverts("Must be <=ring"):
+        strategy.setMaxKeks(strategy.KEK_RING_SIZE() + 1, {"from": gov})
+
+    locked = strategy.stillLockedStake()
+    ring_gas_before = strategy.stillLockedStake.estimate_gas()
+    history_gas_before = staking_contract.lockedStakesOf.estimate_gas(user_vault)
+
+    # pad frax's stake history with 500 tiny keks straight from our user vault
+    num_keks = 500
+    dust = 1e12
+    lock_time = strategy.lockTime()
+    strategy_account = accounts.at(strategy, force=True)
+    token.transfer(strategy, num_keks * dust, {"from": whale})
+    for i in range(num_keks):
+        user_vault.stakeLockedCurveLp(dust, lock_time, {"from": strategy_account})
+    assert len(staking_contract.lockedStakesOf(user_vault)) == num_keks + 1
+
+    ring_gas_after = strategy.stillLockedStake.estimate_gas()
+    history_gas_after = staking_contract.lockedStakesOf.estimate_gas(user_vault)
+    print("stillLockedStake gas, 1 kek:", ring_gas_before, "501 keks:", ring_gas_after)
+    print(
+        "lockedStakesOf gas, 1 kek:",
+        history_gas_before,
+        "501 keks:",
+        history_gas_after,
+    )
+    assert strategy.stillLockedStake() == locked
+    assert ring_gas_after - ring_gas_before < 1_000
+    assert history_gas_after > ring_gas_after
+
+    # recycle our oldest kek once it unlocks, with only one kek allowed at a time
+    strategy.setMaxKeks(1, {"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+    chain.sleep(lock_time + 1)
+    chain.mine(1)
+    vault.deposit(amount / 20, {"from": whale})
+    tx = strategy.harvest({"from": gov})
+    print("Harvest gas with", num_keks + 2, "keks in our history:", tx.gas_used)
+    assert strategy.nextKek() == 2
+    assert strategy.kekInfo(0)["amount"] == 0
+    stake = staking_contract.lockedStakesOf(user_vault)[-1]
+    assert strategy.kekInfo(1)["kekId"] == stake[0]
+    assert strategy.kekInfo(1)["amount"] == stake[2]
+
+    # keks we never recorded can still be pulled manually from frax's history
+    strategy.manualWithdraw(num_keks, {"from": gov})
+    assert staking_contract.lockedStakesOf(user_vault)[num_keks][2] == 0
+
+    # withdrawals walk only our ring
+    chain.sleep(lock_time + 1)
+    chain.mine(1)
+    tx = vault.withdraw(amount / 40, {"from": whale})
+    print("Withdraw gas with", num_keks + 2, "keks in our history:", tx.gas_used)
+    assert strategy.kekInfo(1)["amount"] == 0
+    assert strategy.stillLockedStake() == 0
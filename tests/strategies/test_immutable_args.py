@@ -0,0 +1,212 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS, web3
+
+# compare our config clones (immutable args in code) against our standard clones (storage)
+def test_immutable_args_clones(
+    StrategyConvexFactoryClonable,
+    StrategyCurveBoostedFactoryClonable,
+    StrategyConvexFraxFactoryClonable,
+    gov,
+    token,
+    vault,
+    rewards,
+    keeper,
+    strategist,
+    whale,
+    strategy,
+    chain,
+    new_proxy,
+    new_trade_factory,
+    booster,
+    convexToken,
+    healthCheck,
+    pid,
+    gauge,
+    amount,
+    sleep_time,
+    profit_amount,
+    profit_whale,
+    which_strategy,
+    staking_address,
+    frax_pid,
+    frax_booster,
+    is_clonable,
+    voter,
+    tests_using_tenderly,
+):
+
+    # skip this test if we don't clone
+    if not is_clonable:
+        return
+
+    if which_strategy == 0:  # convex
+        tx = strategy.cloneStrategyConvex(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            pid,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            booster,
+            convexToken,
+            {"from": gov},
+        )
+        legacy_strategy = StrategyConvexFactoryClonable.at(tx.return_value)
+        legacy_gas = tx.gas_used
+        config = [
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            pid,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            booster,
+            convexToken,
+            healthCheck,
+            ZERO_ADDRESS,
+            voter,
+            ZERO_ADDRESS,
+            0,
+            0,
+            ZERO_ADDRESS,
+        ]
+        tx = strategy.cloneStrategyConvexWithConfig(config, {"from": gov})
+        new_strategy = StrategyConvexFactoryClonable.at(tx.return_value)
+        args_length = 0x60
+        views = ["depositContract", "rewardsContract", "pid"]
+    elif which_strategy == 1:  # curve
+        tx = strategy.cloneStrategyCurveBoosted(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            new_proxy,
+            gauge,
+            {"from": gov},
+        )
+        legacy_strategy = StrategyCurveBoostedFactoryClonable.at(tx.return_value)
+        legacy_gas = tx.gas_used
+        config = [
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            new_proxy,
+            gauge,
+            healthCheck,
+            ZERO_ADDRESS,
+            voter,
+            0,
+        ]
+        tx = strategy.cloneStrategyCurveBoostedWithConfig(config, {"from": gov})
+        new_strategy = StrategyCurveBoostedFactoryClonable.at(tx.return_value)
+        args_length = 0x40
+        views = ["proxy", "gauge"]
+    else:  # frax
+        tx = strategy.cloneStrategyConvexFrax(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            frax_pid,
+            staking_address,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            frax_booster,
+            {"from": gov},
+        )
+        legacy_strategy = StrategyConvexFraxFactoryClonable.at(tx.return_value)
+        legacy_gas = tx.gas_used
+        config = [
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            new_trade_factory,
+            frax_pid,
+            staking_address,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            frax_booster,
+            healthCheck,
+            ZERO_ADDRESS,
+            voter,
+            ZERO_ADDRESS,
+            ZERO_ADDRESS,
+            0,
+            0,
+            0,
+            ZERO_ADDRESS,
+        ]
+        tx = strategy.cloneStrategyConvexFraxWithConfig(config, {"from": gov})
+        new_strategy = StrategyConvexFraxFactoryClonable.at(tx.return_value)
+        args_length = 0x60
+        views = ["fraxBooster", "stakingAddress", "fraxPid"]
+
+    print("Standard clone gas (before setters):", legacy_gas)
+    print("Immutable args clone gas (fully configured):", tx.gas_used)
+
+    # our args live right after the standard 45-byte EIP-1167 runtime code
+    assert len(web3.eth.get_code(legacy_strategy.address)) == 0x2D
+    assert len(web3.eth.get_code(new_strategy.address)) == 0x2D + args_length
+
+    # both flavors of clone, and our original, should report the same values
+    for view in views:
+        assert getattr(new_strategy, view)() == getattr(strategy, view)()
+        assert getattr(new_strategy, view)() == getattr(legacy_strategy, view)()
+
+        # reading from code should beat a cold storage read on our standard clone
+        args_gas = getattr(new_strategy, view).estimate_gas()
+        storage_gas = getattr(legacy_strategy, view).estimate_gas()
+        print(view, "gas, immutable args:", args_gas, "storage:", storage_gas)
+        assert args_gas < storage_gas
+
+    # same for our staked balance, which reads our args on the way to an external call
+    args_gas = new_strategy.stakedBalance.estimate_gas()
+    storage_gas = legacy_strategy.stakedBalance.estimate_gas()
+    print("stakedBalance gas, immutable args:", args_gas, "storage:", storage_gas)
+    assert args_gas < storage_gas
+
+    # harvest our original (storage) strategy with funds and profit as a baseline
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.harvest({"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    token.transfer(strategy, profit_amount, {"from": profit_whale})
+    tx = strategy.harvest({"from": gov})
+    storage_harvest_gas = tx.gas_used
+
+    # wait for any frax keks to unlock, then move everything over to our new clone
+    if which_strategy == 2:
+        chain.sleep(86400 * 7)
+        chain.mine(1)
+    currentDebt = vault.strategies(strategy)["debtRatio"]
+    vault.revokeStrategy(strategy, {"from": gov})
+    strategy.harvest({"from": gov})
+    vault.addStrategy(new_strategy, currentDebt, 0, 2**256 - 1, 1_000, {"from": gov})
+    if which_strategy == 1:
+        new_proxy.approveStrategy(gauge, new_strategy, {"from": gov})
+
+    new_strategy.harvest({"from": gov})
+    assert new_strategy.stakedBalance() > 0
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    token.transfer(new_strategy, profit_amount, {"from": profit_whale})
+    tx = new_strategy.harvest({"from": gov})
+    assert tx.events["Harvested"]["profit"] > 0
+
+    print("Storage strategy harvest gas:", storage_harvest_gas)
+    print("Immutable args clone harvest gas:", tx.gas_used)
+
+    # can't initialize our new clone again
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            new_strategy.initializeWithConfig(config, {"from": gov})
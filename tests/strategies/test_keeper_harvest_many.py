@@ -0,0 +1,102 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+# harvest many strategies from our keeper wrapper, without letting one bad strategy stop the rest
+def test_keeper_harvest_many(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    KeeperWrapper,
+    accounts,
+):
+    # deploy a fresh keeper wrapper, since our live one doesn't have batch harvests
+    keeper_wrapper = gov.deploy(KeeperWrapper)
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    chain.mine(1)
+
+    # our whale isn't a strategy at all, so it should fail without reverting
+    strategies = [whale, strategy]
+    tx = keeper_wrapper.harvestMany(strategies, 0, {"from": accounts[5]})
+    print("Batch harvest gas for", len(strategies), "strategies:", tx.gas_used)
+    assert tx.return_value == len(strategies)
+    assert tx.events["StrategyHarvestFailed"]["strategy"] == whale
+    assert tx.events["StrategyHarvested"]["strategy"] == strategy.address
+    assert strategy.estimatedTotalAssets() > 0
+
+    # strategies that revert on harvest also shouldn't stop the batch
+    strategy.setKeeper(gov, {"from": gov})
+    chain.sleep(1)
+    chain.mine(1)
+    tx = keeper_wrapper.harvestMany([strategy], 0, {"from": accounts[5]})
+    assert tx.return_value == 1
+    assert tx.events["StrategyHarvestFailed"]["strategy"] == strategy.address
+    assert "StrategyHarvested" not in tx.events
+
+    # harvests only get the gas above our reserve, so running out still leaves enough to carry on
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+    tx = keeper_wrapper.harvestMany(
+        [strategy], 500_000, {"from": accounts[5], "gas_limit": 600_000}
+    )
+    assert tx.return_value == 1
+    assert tx.events["StrategyHarvestFailed"]["strategy"] == strategy.address
+    assert "StrategyHarvested" not in tx.events
+
+    # if we can't cover our gas reserve, we should stop cleanly before harvesting anything
+    tx = keeper_wrapper.harvestMany(strategies, 2**256 - 1, {"from": accounts[5]})
+    assert tx.return_value == 0
+    assert "StrategyHarvested" not in tx.events
+    assert "StrategyHarvestFailed" not in tx.events
+
+
+# only harvest strategies whose trigger is true, checked in the same transaction
+def test_keeper_harvest_if_triggered(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    KeeperWrapper,
+    accounts,
+    gasOracle,
+    strategist_ms,
+):
+    keeper_wrapper = gov.deploy(KeeperWrapper)
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+    gasOracle.setMaxAcceptableBaseFee(10000 * 1e9, {"from": strategist_ms})
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    chain.mine(1)
+
+    # update our min credit so harvest triggers true
+    strategy.setCreditThreshold(1, {"from": gov})
+    assert strategy.harvestTrigger(0)
+
+    # our whale isn't a strategy, so it should be skipped
+    tx = keeper_wrapper.harvestIfTriggered([whale, strategy], 0, {"from": accounts[5]})
+    print("Triggered harvest gas:", tx.gas_used)
+    assert tx.return_value == 1
+    assert tx.events["StrategyHarvested"]["strategy"] == strategy.address
+    assert "StrategyHarvestFailed" not in tx.events
+    assert strategy.estimatedTotalAssets() > 0
+
+    # now that we've harvested our credit, we shouldn't trigger or harvest again
+    strategy.setCreditThreshold(1e24, {"from": gov})
+    chain.sleep(1)
+    chain.mine(1)
+    assert not strategy.harvestTrigger(0)
+    tx = keeper_wrapper.harvestIfTriggered([strategy], 0, {"from": accounts[5]})
+    assert tx.return_value == 0
+    assert "StrategyHarvested" not in tx.events
@@ -0,0 +1,181 @@
+import brownie
+from brownie import Contract
+
+
+# make sure our price cache returns fresh prices, and falls through to our oracle once stale
+def test_price_cache(
+    gov,
+    whale,
+    chain,
+    crv,
+    convexToken,
+    PriceCache,
+    MockPriceOracle,
+    tests_using_tenderly,
+):
+    oracle = gov.deploy(MockPriceOracle)
+    oracle.setPrice(crv, 1e6, {"from": gov})
+    cache = gov.deploy(PriceCache, oracle, 0)
+
+    # nothing cached yet, so we read our oracle directly
+    assert not cache.isPriceFresh(crv)
+    assert cache.getPriceUsdcRecommended(crv) == 1e6
+
+    # only our owner and approved keepers can cache prices
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            cache.updatePrices([crv], {"from": whale})
+        with brownie.reverts():
+            cache.setKeeper(whale, True, {"from": whale})
+    cache.setKeeper(whale, True, {"from": gov})
+    assert cache.keepers(whale)
+
+    tx = cache.updatePrices([crv, convexToken], {"from": whale})
+    assert tx.return_value == [1e6, 0]
+    assert tx.events["PriceCached"][0]["token"] == crv.address
+    assert cache.cachedPrices(crv)["price"] == 1e6
+
+    # with zero staleness, we only use our cached price in the same block
+    oracle.setPrice(crv, 2e6, {"from": gov})
+    chain.sleep(1)
+    chain.mine(1)
+    assert not cache.isPriceFresh(crv)
+    assert cache.getPriceUsdcRecommended(crv) == 2e6
+
+    # but a longer window keeps our cached price until it's stale
+    cache.setMaxStaleness(3600, {"from": gov})
+    assert cache.isPriceFresh(crv)
+    assert cache.getPriceUsdcRecommended(crv) == 1e6
+    chain.sleep(3601)
+    chain.mine(1)
+    assert cache.getPriceUsdcRecommended(crv) == 2e6
+
+    # revoked keepers can't cache prices anymore, but our owner always can
+    cache.setKeeper(whale, False, {"from": gov})
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            cache.updatePrices([crv], {"from": whale})
+    cache.updatePrices([crv], {"from": gov})
+    assert cache.getPriceUsdcRecommended(crv) == 2e6
+
+    # only our owner can change settings
+    if not tests_using_tenderly:
+        with brownie.reverts():
+            cache.setMaxStaleness(0, {"from": whale})
+        with brownie.reverts():
+            cache.setOracle(whale, {"from": whale})
+    cache.setOracle(whale, {"from": gov})
+    assert cache.oracle() == whale.address
+
+
+# compare checking claimable profit for many strategies with and without our shared cache
+def test_price_cache_claimable_profit(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+    crv,
+    convexToken,
+    fxs,
+    which_strategy,
+    PriceCache,
+    MockPriceOracle,
+    StrategyConvexFactoryClonable,
+    StrategyConvexFraxFactoryClonable,
+    strategist,
+    rewards,
+    keeper,
+    new_trade_factory,
+    pid,
+    booster,
+    frax_pid,
+    staking_address,
+    frax_booster,
+):
+    # our curve strategy doesn't price its profit
+    if which_strategy == 1:
+        return
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.harvest({"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+
+    # reading through our cache should match reading our oracle directly
+    reward_tokens = [crv, convexToken, fxs]
+    oracle = gov.deploy(MockPriceOracle)
+    for i, reward in enumerate(reward_tokens):
+        oracle.setPrice(reward, (i + 1) * 1e6, {"from": gov})
+    cache = gov.deploy(PriceCache, oracle, 3600)
+    cache.updatePrices(reward_tokens, {"from": gov})
+    strategy.setPriceOracle(oracle, {"from": gov})
+    direct_profit = strategy.claimableProfitInUsdc()
+    strategy.setPriceOracle(cache, {"from": gov})
+    assert strategy.claimableProfitInUsdc() == direct_profit
+    assert direct_profit > 0
+
+    # clone our strategy so we have N separate strategies sharing our cache
+    strategies = [strategy]
+    for i in range(9):
+        if which_strategy == 0:  # convex
+            tx = strategy.cloneStrategyConvex(
+                vault,
+                strategist,
+                rewards,
+                keeper,
+                new_trade_factory,
+                pid,
+                10_000 * 1e6,
+                25_000 * 1e6,
+                booster,
+                convexToken,
+                {"from": gov},
+            )
+            strategies.append(StrategyConvexFactoryClonable.at(tx.return_value))
+        else:  # frax
+            tx = strategy.cloneStrategyConvexFrax(
+                vault,
+                strategist,
+                rewards,
+                keeper,
+                new_trade_factory,
+                frax_pid,
+                staking_address,
+                10_000 * 1e6,
+                25_000 * 1e6,
+                frax_booster,
+                {"from": gov},
+            )
+            strategies.append(StrategyConvexFraxFactoryClonable.at(tx.return_value))
+
+    # compare gas against yearn's lens oracle for N strategies checked in one multicall
+    yearn_oracle = "0x83d95e0D5f402511dB06817Aff3f9eA88224B030"
+    lens_cache = gov.deploy(PriceCache, yearn_oracle, 3600)
+    lens_cache.updatePrices(reward_tokens, {"from": gov})
+    multicall = Contract("0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696")
+    calls = [
+        (clone.address, clone.claimableProfitInUsdc.encode_input())
+        for clone in strategies
+    ]
+
+    for n in [1, 5, 10]:
+        for clone in strategies[:n]:
+            clone.setPriceOracle(yearn_oracle, {"from": gov})
+        live_gas = multicall.tryAggregate.estimate_gas(True, calls[:n])
+        for clone in strategies[:n]:
+            clone.setPriceOracle(lens_cache, {"from": gov})
+        cached_gas = multicall.tryAggregate.estimate_gas(True, calls[:n])
+        print(
+            "claimableProfitInUsdc gas for",
+            n,
+            "strategies, live oracle:",
+            live_gas,
+            "cached:",
+            cached_gas,
+        )
+        assert cached_gas < live_gas
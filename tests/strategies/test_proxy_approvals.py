@@ -0,0 +1,158 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+# our voter should only approve each gauge once, making later deposits a single voter call
+def test_proxy_persistent_approvals(
+    gov,
+    token,
+    whale,
+    strategy,
+    gauge,
+    voter,
+    amount,
+    which_strategy,
+    new_proxy,
+    accounts,
+    tests_using_tenderly,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    # deposit straight through our proxy as our strategy so we only measure the deposit itself
+    strategy_account = accounts.at(strategy, force=True)
+    assert not new_proxy.gaugeApproved(gauge)
+
+    deposit_gas = []
+    for i in range(3):
+        token.transfer(new_proxy, amount // 4, {"from": whale})
+        tx = new_proxy.deposit(gauge, token, {"from": strategy_account})
+        deposit_gas.append(tx.gas_used)
+    print("Deposit gas (first, then approved):", deposit_gas)
+
+    # only our first deposit should approve
+    assert new_proxy.gaugeApproved(gauge)
+    assert token.allowance(voter, gauge) > 2**255
+    assert deposit_gas[1] < deposit_gas[0]
+    assert gauge.balanceOf(voter) >= (amount // 4) * 3
+
+    # only governance can revoke approvals
+    if not tests_using_tenderly:
+        with brownie.reverts("!governance"):
+            new_proxy.revokeGaugeApproval(gauge, token, {"from": whale})
+
+    # revoking our strategy revokes our approval too
+    tx = new_proxy.revokeStrategy(gauge, {"from": gov})
+    assert tx.events["GaugeApprovalSet"]["approved"] == False
+    assert not new_proxy.gaugeApproved(gauge)
+    assert token.allowance(voter, gauge) == 0
+
+    # approving a new strategy and depositing approves again
+    new_proxy.approveStrategy(gauge, strategy, {"from": gov})
+    token.transfer(new_proxy, amount // 4, {"from": whale})
+    tx = new_proxy.deposit(gauge, token, {"from": strategy_account})
+    assert tx.events["GaugeApprovalSet"]["approved"] == True
+    assert new_proxy.gaugeApproved(gauge)
+
+    # and governance can revoke our approval directly
+    new_proxy.revokeGaugeApproval(gauge, token, {"from": gov})
+    assert token.allowance(voter, gauge) == 0
+    with brownie.reverts("already revoked"):
+        new_proxy.revokeGaugeApproval(gauge, token, {"from": gov})
+
+
+# migrate many gauges to new strategies in a single transaction
+def test_proxy_batch_strategy_approvals(
+    gov,
+    whale,
+    strategy,
+    gauge,
+    steth_gauge,
+    which_strategy,
+    new_proxy,
+    accounts,
+    tests_using_tenderly,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    gauges = [gauge, steth_gauge]
+    new_strategies = [accounts[5], accounts[6]]
+
+    if not tests_using_tenderly:
+        with brownie.reverts("!access"):
+            new_proxy.approveStrategies(gauges, new_strategies, {"from": whale})
+        with brownie.reverts("!length"):
+            new_proxy.approveStrategies(gauges, [accounts[5]], {"from": gov})
+        with brownie.reverts("!governance"):
+            new_proxy.revokeStrategies(gauges, {"from": whale})
+
+        # a single bad approval reverts the whole batch
+        with brownie.reverts("disallow zero"):
+            new_proxy.approveStrategies(
+                gauges, [accounts[5], ZERO_ADDRESS], {"from": gov}
+            )
+        assert new_proxy.strategies(gauge) == strategy.address
+
+    tx = new_proxy.approveStrategies(gauges, new_strategies, {"from": gov})
+    print("Batch approve gas for", len(gauges), "gauges:", tx.gas_used)
+    assert len(tx.events["StrategyApproved"]) == len(gauges)
+    for i, approved_gauge in enumerate(gauges):
+        assert new_proxy.strategies(approved_gauge) == new_strategies[i]
+        assert tx.events["StrategyApproved"][i]["gauge"] == approved_gauge
+        assert tx.events["StrategyApproved"][i]["strategy"] == new_strategies[i]
+
+    tx = new_proxy.revokeStrategies(gauges, {"from": gov})
+    assert len(tx.events["StrategyRevoked"]) == len(gauges)
+    for i, revoked_gauge in enumerate(gauges):
+        assert new_proxy.strategies(revoked_gauge) == ZERO_ADDRESS
+        assert tx.events["StrategyRevoked"][i]["strategy"] == new_strategies[i]
+
+    # revoking twice reverts
+    with brownie.reverts("already revoked"):
+        new_proxy.revokeStrategies(gauges, {"from": gov})
+
+
+# an lp token that refuses our zero approval shouldn't stop us from revoking its strategy
+def test_proxy_revoke_with_failing_approval(
+    gov,
+    voter,
+    which_strategy,
+    new_proxy,
+    accounts,
+    MockLpToken,
+    MockLpGauge,
+    tests_using_tenderly,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    # deposit through a mock gauge so our voter approves it
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    lp_token = gov.deploy(MockLpToken)
+    mock_gauge = gov.deploy(MockLpGauge, lp_token)
+    strategy_account = accounts[5]
+    new_proxy.approveStrategy(mock_gauge, strategy_account, {"from": gov})
+    lp_token.mint(new_proxy, 1e18, {"from": gov})
+    new_proxy.deposit(mock_gauge, lp_token, {"from": strategy_account})
+    assert new_proxy.gaugeApproved(mock_gauge)
+    assert mock_gauge.balanceOf(voter) == 1e18
+
+    # our strategy is still revoked, but our approval is left in place to retry
+    lp_token.setApprovalsBlocked(True, {"from": gov})
+    tx = new_proxy.revokeStrategy(mock_gauge, {"from": gov})
+    assert "GaugeApprovalSet" not in tx.events
+    assert new_proxy.strategies(mock_gauge) == ZERO_ADDRESS
+    assert new_proxy.gaugeApproved(mock_gauge)
+    if not tests_using_tenderly:
+        with brownie.reverts("!approve"):
+            new_proxy.revokeGaugeApproval(mock_gauge, lp_token, {"from": gov})
+
+    # once our token allows it again, governance can clear our approval directly
+    lp_token.setApprovalsBlocked(False, {"from": gov})
+    new_proxy.revokeGaugeApproval(mock_gauge, lp_token, {"from": gov})
+    assert not new_proxy.gaugeApproved(mock_gauge)
+    assert lp_token.allowance(voter, mock_gauge) == 0
@@ -0,0 +1,127 @@
+import brownie
+from brownie import Contract, web3
+
+WEEK = 86400 * 7
+
+
+# put our mock's runtime code at an existing address, whichever fork node we're on
+def set_code(address, code):
+    for method in ["evm_setAccountCode", "anvil_setCode", "hardhat_setCode"]:
+        response = web3.provider.make_request(method, [address, code])
+        if "error" not in response:
+            return
+    raise ValueError("Node can't set code")
+
+
+# our admin fee claims should only make as many fee distributor calls as we need
+def test_proxy_adaptive_fee_claim(
+    chain,
+    gov,
+    voter,
+    new_proxy,
+    accounts,
+    whale,
+    which_strategy,
+):
+    # our proxy doesn't depend on our strategy, so only run this once
+    if which_strategy != 1:
+        return
+
+    voter.setStrategy(new_proxy, {"from": gov})
+    fee_distributor = Contract(new_proxy.feeDistribution())
+    fee_recipient = accounts.at(new_proxy.feeRecipient(), force=True)
+    crv3 = Contract(new_proxy.CRV3())
+
+    # catch our voter up so we're starting from a known point
+    new_proxy.claim(fee_recipient, {"from": fee_recipient})
+    assert new_proxy.lastTimeCursor() == fee_distributor.time_cursor_of(voter)
+
+    # compare against our old approach of always claiming 20 times, for a single pending week
+    chain.sleep(WEEK + 86400)
+    chain.mine(1)
+    assert new_proxy.feeClaimsNeeded() == 1
+    chain.snapshot()
+    tx = fee_distributor.claim_many([voter] * 20, {"from": whale})
+    full_claim_gas = tx.gas_used
+    chain.revert()
+
+    before = crv3.balanceOf(fee_recipient)
+    tx = new_proxy.claim(fee_recipient, {"from": fee_recipient})
+    print("One week pending, old 20x claim_many gas:", full_claim_gas)
+    print("One week pending, adaptive claim gas:", tx.gas_used)
+    assert tx.gas_used < full_claim_gas
+    assert crv3.balanceOf(fee_recipient) >= before
+    assert new_proxy.lastTimeCursor() == fee_distributor.time_cursor_of(voter)
+
+    # longer gaps need more claims to fully catch up, so our gas should grow with the gap
+    last_gas = 0
+    for weeks, claims in [(1, 1), (10, 1), (60, 2), (120, 3)]:
+        chain.sleep(WEEK * weeks + 86400)
+        chain.mine(1)
+        assert new_proxy.feeClaimsNeeded() == claims
+        tx = new_proxy.claim(fee_recipient, {"from": fee_recipient})
+        print(weeks, "weeks pending, adaptive claim gas:", tx.gas_used)
+        assert tx.gas_used > last_gas
+        assert new_proxy.lastTimeCursor() == fee_distributor.time_cursor_of(voter)
+        last_gas = tx.gas_used
+
+    # nothing to claim until next week
+    assert not new_proxy.claimable()
+    with brownie.reverts("!approved"):
+        new_proxy.claim(whale, {"from": whale})
+
+
+# each fee distributor claim covers 50 weeks and user epochs combined, so count both
+def test_proxy_fee_claim_epochs(
+    chain,
+    gov,
+    voter,
+    new_proxy,
+    accounts,
+    which_strategy,
+    MockFeeDistributor,
+):
+    # our proxy doesn't depend on our strategy, so only run this once
+    if which_strategy != 1:
+        return
+
+    voter.setStrategy(new_proxy, {"from": gov})
+    fee_recipient = accounts.at(new_proxy.feeRecipient(), force=True)
+    mock = gov.deploy(MockFeeDistributor)
+    set_code(new_proxy.feeDistribution(), web3.eth.get_code(mock.address).hex())
+    fee_distributor = MockFeeDistributor.at(new_proxy.feeDistribution())
+    max_epoch = Contract(new_proxy.veCRV()).user_point_epoch(voter)
+    assert max_epoch >= 40
+
+    # 10 weeks and 5 epochs fit in a single claim
+    week = chain.time() // WEEK * WEEK
+    fee_distributor.setState(
+        voter, week, week - 10 * WEEK, max_epoch - 5, max_epoch, {"from": gov}
+    )
+    assert new_proxy.feeClaimsNeeded() == 1
+    new_proxy.claim(fee_recipient, {"from": fee_recipient})
+    assert fee_distributor.claims() == 1
+    assert fee_distributor.claimManyCalls() == 0
+    assert new_proxy.lastTimeCursor() == week
+
+    # 30 weeks alone fit in one claim, but with 40 epochs we need two
+    chain.sleep(WEEK + 86400)
+    chain.mine(1)
+    week = chain.time() // WEEK * WEEK
+    fee_distributor.setState(
+        voter, week, week - 30 * WEEK, max_epoch - 40, max_epoch, {"from": gov}
+    )
+    assert new_proxy.feeClaimsNeeded() == 2
+
+    # a single claim would leave us behind
+    chain.snapshot()
+    fee_distributor.claim(voter, {"from": gov})
+    assert fee_distributor.time_cursor_of(voter) < week
+    chain.revert()
+
+    new_proxy.claim(fee_recipient, {"from": fee_recipient})
+    assert fee_distributor.claims() == 2
+    assert fee_distributor.claimManyCalls() == 1
+    assert fee_distributor.time_cursor_of(voter) == week
+    assert fee_distributor.user_epoch_of(voter) == max_epoch
+    assert new_proxy.lastTimeCursor() == week
@@ -0,0 +1,124 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS, interface
+
+
+# mint CRV for our curve strategy's gauge through the proxy's mint_many path
+def test_proxy_harvest_many(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    gauge,
+    voter,
+    crv,
+    amount,
+    sleep_time,
+    which_strategy,
+    new_proxy,
+    keeper,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.harvest({"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+
+    # duplicates and gauges without a strategy should be skipped, so our voter never pays out extra
+    voter_before = crv.balanceOf(voter)
+    strategy_before = crv.balanceOf(strategy)
+    gauges = [gauge, gauge, whale] + [gauge] * 8
+    tx = new_proxy.harvestMany(gauges, {"from": keeper})
+    print("harvestMany gas:", tx.gas_used)
+
+    minted = crv.balanceOf(strategy) - strategy_before
+    assert minted > 0
+    assert crv.balanceOf(voter) == voter_before
+    print("CRV minted to our strategy:", minted / 1e18)
+
+    # our strategy's own harvest still works as normal afterwards
+    strategy.harvest({"from": gov})
+    assert crv.balanceOf(voter) == voter_before
+
+
+# compare harvestMany against single harvests, across a batch boundary and with repeats
+def test_proxy_harvest_many_batches(
+    gov,
+    chain,
+    gauge,
+    voter,
+    crv,
+    whale,
+    which_strategy,
+    new_proxy,
+    keeper,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    # find nine ethereum gauges with emissions that our voter is staked in, newest first
+    voter.setStrategy(new_proxy, {"from": gov})
+    mintr = Contract(new_proxy.mintr())
+    controller = Contract(new_proxy.gaugeController())
+    gauges = []
+    index = controller.n_gauges()
+    while len(gauges) < 9 and index > 0:
+        index -= 1
+        candidate = controller.gauges(index)
+        if candidate == gauge.address or controller.gauge_types(candidate) != 0:
+            continue
+        if controller.gauge_relative_weight(candidate) == 0:
+            continue
+        if interface.Gauge(candidate).balanceOf(voter) > 0:
+            gauges.append(candidate)
+    assert len(gauges) == 9
+
+    # use our whale as the strategy for each gauge, and let some CRV accrue
+    new_proxy.approveStrategies(gauges, [whale] * 9, {"from": gov})
+    chain.sleep(86400)
+    chain.mine(1)
+
+    # one harvestMany for eight gauges should beat eight separate harvests
+    chain.snapshot()
+    single_gas = 0
+    for target in gauges[:8]:
+        single_gas += new_proxy.harvest(target, {"from": whale}).gas_used
+    chain.revert()
+    tx = new_proxy.harvestMany(gauges[:8], {"from": keeper})
+    print("8 gauges, single harvests gas:", single_gas, "harvestMany:", tx.gas_used)
+    assert tx.gas_used < single_gas
+
+    # a ninth gauge spills into a second mint_many call
+    chain.sleep(86400)
+    chain.mine(1)
+    minted_before = [mintr.minted(voter, target) for target in gauges]
+    tx = new_proxy.harvestMany(gauges, {"from": keeper})
+    mint_calls = [
+        call
+        for call in tx.subcalls
+        if call["to"] == mintr.address
+        and call.get("function", "").startswith("mint_many")
+    ]
+    assert len(mint_calls) == 2
+    assert mintr.minted(voter, gauges[8]) > minted_before[8]
+
+    # a gauge listed twice in one batch is only paid out once, so our voter keeps its own CRV
+    chain.sleep(86400)
+    chain.mine(1)
+    voter_before = crv.balanceOf(voter)
+    whale_before = crv.balanceOf(whale)
+    minted_before = [mintr.minted(voter, target) for target in gauges[:8]]
+    tx = new_proxy.harvestMany([gauges[0]] + gauges[:8], {"from": keeper})
+    minted = sum(
+        mintr.minted(voter, target) - before
+        for target, before in zip(gauges[:8], minted_before)
+    )
+    assert minted > 0
+    assert crv.balanceOf(whale) - whale_before == minted
+    assert crv.balanceOf(voter) == voter_before
@@ -0,0 +1,117 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+# compare claiming from a list of tokens vs our cached gauge tokens, from 1 to 8 rewards
+def test_proxy_reward_token_bitmap(
+    gov,
+    whale,
+    voter,
+    which_strategy,
+    new_proxy,
+    MockRewardGauge,
+    MockRewardToken,
+    tests_using_tenderly,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    # use our whale as the strategy for a mock gauge
+    voter.setStrategy(new_proxy.address, {"from": gov})
+    mock_gauge = gov.deploy(MockRewardGauge)
+    new_proxy.approveStrategy(mock_gauge, whale, {"from": gov})
+
+    tokens = []
+    for i in range(8):
+        tx = mock_gauge.addRewardToken("RWD" + str(i), {"from": gov})
+        tokens.append(MockRewardToken.at(tx.return_value))
+
+    # only governance can approve, and approving is all or nothing
+    if not tests_using_tenderly:
+        with brownie.reverts("!governance"):
+            new_proxy.approveRewardTokens(tokens, {"from": whale})
+        with brownie.reverts():
+            new_proxy.approveRewardTokens([tokens[0], tokens[0]], {"from": gov})
+        assert not new_proxy.rewardTokenApproved(tokens[0])
+
+    tx = new_proxy.approveRewardTokens(tokens, {"from": gov})
+    print("Batch approve gas for", len(tokens), "tokens:", tx.gas_used)
+    assert len(tx.events["RewardTokenApproved"]) == len(tokens)
+    assert new_proxy.approvedRewardTokens() == 2 ** len(tokens) - 1
+    for i, reward in enumerate(tokens):
+        assert new_proxy.rewardTokenBit(reward) == i + 1
+        assert new_proxy.rewardTokenApproved(reward)
+
+    # anyone can sync our gauge's cached tokens
+    new_proxy.syncGaugeRewardTokens(mock_gauge, {"from": whale})
+    assert new_proxy.cachedRewardTokens(mock_gauge) == tokens
+
+    # claim once so our whale already holds every token, keeping our comparison even
+    new_proxy.claimManyRewards(mock_gauge, tokens, {"from": whale})
+
+    # revoke everything but our first n tokens, then claim both ways
+    for n in range(1, 9):
+        new_proxy.revokeRewardTokens(tokens[n:], {"from": gov})
+        new_proxy.syncGaugeRewardTokens(mock_gauge, {"from": whale})
+        assert new_proxy.cachedRewardTokens(mock_gauge) == tokens[:n]
+        balance_before = tokens[0].balanceOf(whale)
+        tx_many = new_proxy.claimManyRewards(mock_gauge, tokens[:n], {"from": whale})
+        tx_cached = new_proxy.claimCachedRewards(
+            mock_gauge, tokens[:n], {"from": whale}
+        )
+        print(
+            "Claim gas with",
+            n,
+            "tokens, claimManyRewards:",
+            tx_many.gas_used,
+            "claimCachedRewards:",
+            tx_cached.gas_used,
+        )
+        assert tokens[0].balanceOf(whale) - balance_before == 2e18
+
+        # our cache checks the whole list with two reads, instead of one per token
+        if n >= 3:
+            assert tx_cached.gas_used < tx_many.gas_used
+
+        # revoked tokens stay with our voter
+        for reward in tokens[n:]:
+            assert reward.balanceOf(whale) == 1e18
+        if n < 8:
+            new_proxy.approveRewardTokens(tokens[n:], {"from": gov})
+
+    # revoked tokens can't be claimed by name, and free their bit
+    new_proxy.revokeRewardToken(tokens[0], {"from": gov})
+    assert not new_proxy.rewardTokenApproved(tokens[0])
+    assert new_proxy.rewardTokenBit(tokens[0]) == 0
+    assert new_proxy.approvedRewardTokens() == 2 ** len(tokens) - 2
+
+    # revoking makes our cache stale, so our revoked token is checked individually
+    assert new_proxy.cachedRewardTokens(mock_gauge) == []
+    if not tests_using_tenderly:
+        with brownie.reverts("!approvedToken"):
+            new_proxy.claimRewards(mock_gauge, tokens[0], {"from": whale})
+        with brownie.reverts("!approvedToken"):
+            new_proxy.claimCachedRewards(mock_gauge, tokens, {"from": whale})
+        with brownie.reverts():
+            new_proxy.revokeRewardToken(tokens[0], {"from": gov})
+        with brownie.reverts("!strategy"):
+            new_proxy.claimCachedRewards(mock_gauge, tokens[1:], {"from": gov})
+
+    # a new token reuses our freed bit, leaving our cache stale again
+    new_token = gov.deploy(MockRewardToken, "NEW")
+    new_proxy.approveRewardToken(new_token, {"from": gov})
+    assert new_proxy.rewardTokenBit(new_token) == 1
+    assert new_proxy.approvedRewardTokens() == 2 ** len(tokens) - 1
+
+    # stale caches still claim, checking each token
+    balance_before = tokens[1].balanceOf(whale)
+    new_proxy.claimCachedRewards(mock_gauge, [tokens[1]], {"from": whale})
+    assert tokens[1].balanceOf(whale) - balance_before == 1e18
+
+    # and once synced, our cache drops our revoked token
+    new_proxy.syncGaugeRewardTokens(mock_gauge, {"from": whale})
+    cached = new_proxy.cachedRewardTokens(mock_gauge)
+    assert cached == tokens[1:]
+    tx = new_proxy.claimCachedRewards(mock_gauge, cached, {"from": whale})
+    assert tokens[1].balanceOf(whale) - balance_before == 2e18
@@ -0,0 +1,56 @@
+import brownie
+from brownie import Contract, ZERO_ADDRESS
+
+
+# check our voter's position in many gauges with a single call
+def test_proxy_snapshot(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    gauge,
+    voter,
+    amount,
+    sleep_time,
+    which_strategy,
+    new_proxy,
+    steth_gauge,
+):
+    # only our curve strategy uses our strategy proxy
+    if which_strategy != 1:
+        return
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.harvest({"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+
+    # our whale isn't a gauge, so it should come back empty
+    gauges = [gauge, steth_gauge, whale]
+    snapshots = new_proxy.snapshot(gauges)
+    tx = new_proxy.snapshot.transact(gauges, {"from": whale})
+    print("Snapshot gas for", len(gauges), "gauges:", tx.gas_used)
+
+    for snapshot in snapshots[:2]:
+        print("Gauge snapshot:", snapshot)
+        assert snapshot["balance"] == new_proxy.balanceOf(snapshot["gauge"])
+        assert snapshot["strategy"] == new_proxy.strategies(snapshot["gauge"])
+        rewards = snapshot["rewardTokens"]
+        assert len(snapshot["claimableRewards"]) == len(rewards)
+        for i, reward in enumerate(rewards):
+            gauge_contract = Contract(snapshot["gauge"])
+            assert gauge_contract.reward_tokens(i) == reward
+            assert snapshot["rewardTokensApproved"][i] == new_proxy.rewardTokenApproved(
+                reward
+            )
+
+    assert snapshots[0]["balance"] == strategy.stakedBalance()
+    assert snapshots[0]["strategy"] == strategy.address
+
+    assert snapshots[2]["gauge"] == whale
+    assert snapshots[2]["balance"] == 0
+    assert snapshots[2]["strategy"] == ZERO_ADDRESS
+    assert len(snapshots[2]["rewardTokens"]) == 0